@@ -8,14 +8,43 @@ Search and explore all n8n node types
 import streamlit as st
 import sqlite3
 import pandas as pd
+import numpy as np
 import json
 import os
+import re
+import html
+import threading
+from collections import OrderedDict, defaultdict
 from datetime import datetime
 from dotenv import load_dotenv
+from node_catalog import NodeCatalog, database_version
 
 # Load environment variables
 load_dotenv()
 
+# Max. cached search results (query, categories, sort) shared by all sessions
+SEARCH_CACHE_SIZE = 64
+
+# Page sizes for Cards / Compact result views
+RESULTS_PAGE_SIZES = [25, 50, 100]
+
+# Synonyms and related terms for intelligent search
+SYNONYMS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'synonyms.json')
+
+# node_type keywords of Core/Utility nodes (categorize_node)
+CORE_KEYWORDS = [
+    'webhook', 'cron', 'schedule', 'manual', 'code', 'set', 'if', 'switch',
+    'merge', 'split', 'function', 'crypto', 'datetime', 'filter', 'sort',
+    'limit', 'aggregate', 'compress', 'convert', 'edit', 'html', 'xml',
+    'jwt', 'wait', 'noop', 'error', 'debug', 'sticky'
+]
+
+# Text columns scored by search (lowercased copies are precomputed at load)
+SEARCH_TEXT_COLUMNS = ['node_type', 'display_name', 'description']
+
+# Search backend: 'index' (in-memory NodeSearchIndex) or 'fts' (SQLite FTS5 selects the matches, score_matrix ranks them)
+SEARCH_BACKEND = os.getenv('SEARCH_BACKEND', 'index').lower()
+
 # Page Configuration
 st.set_page_config(
     page_title="n8n Nodes Explorer & AI Generator",
@@ -249,13 +278,45 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# ROOT database with FULL data
+DATABASE_PATH = 'n8n_docs.db'
+
 @st.cache_resource
 def get_database_connection():
     """Cached database connection - using ROOT database with FULL data"""
-    return sqlite3.connect('n8n_docs.db', check_same_thread=False)
+    return sqlite3.connect(DATABASE_PATH, check_same_thread=False)
+
+def get_database_version():
+    """Change marker for DATABASE_PATH (see node_catalog.database_version)"""
+    return database_version(DATABASE_PATH, get_database_connection())
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def load_shared_nodes(database_version):
+    """
+    Process-wide node DataFrame and search index shared by all sessions
+    Rebuilt once whenever database_version changes - treat the result as read-only
+    """
+    df = load_all_nodes()
+    return df, NodeSearchIndex(df)
 
 def load_all_nodes():
-    """Load all nodes from database - cached in session_state"""
+    """Load all nodes from database - use load_shared_nodes for the cached copy"""
+    df = load_node_rows()
+
+    # Categorize
+    df['category'] = categorize_nodes(df)
+
+    # Lowercased search columns (computed once instead of per query)
+    add_search_columns(df)
+
+    return df
+
+def table_has_column(conn, table, column):
+    """Check a column that newer scraper versions add to existing tables"""
+    return column in [row[1] for row in conn.execute(f'PRAGMA table_info({table})')]
+
+def load_node_rows():
+    """Union of API, GitHub and community nodes with their source category"""
     conn = get_database_connection()
 
     # Official nodes from API
@@ -282,7 +343,7 @@ def load_all_nodes():
         FROM node_types_github
     """
 
-    # Community nodes
+    # Community nodes (without packages no longer listed on npm)
     query_community = """
         SELECT
             package_name as node_type,
@@ -293,6 +354,8 @@ def load_all_nodes():
             'npm' as source
         FROM community_nodes
     """
+    if table_has_column(conn, 'community_nodes', 'removed_at'):
+        query_community += " WHERE removed_at IS NULL"
 
     df_api = pd.read_sql_query(query_api, conn)
     df_github = pd.read_sql_query(query_github, conn)
@@ -308,11 +371,21 @@ def load_all_nodes():
     if 'version' in df.columns:
         df['version'] = df['version'].fillna('').astype(str).replace('nan', '').replace('None', '')
 
-    # Categorize
-    df['category'] = df.apply(categorize_node, axis=1)
+    return df
 
+def add_search_columns(df):
+    """Precompute lowercased node_type/display_name/description columns for search"""
+    for column in SEARCH_TEXT_COLUMNS:
+        df[f'_{column}_lower'] = df[column].str.lower()
     return df
 
+def lower_search_column(df, column):
+    """Lowercased text column - precomputed by add_search_columns if available"""
+    lower_column = f'_{column}_lower'
+    if lower_column in df.columns:
+        return df[lower_column]
+    return df[column].str.lower()
+
 def categorize_node(row):
     """Categorize node based on node_type"""
     node_type = row['node_type']
@@ -337,14 +410,7 @@ def categorize_node(row):
             return 'Trigger'
 
         # Core/Utility nodes
-        core_keywords = [
-            'webhook', 'cron', 'schedule', 'manual', 'code', 'set', 'if', 'switch',
-            'merge', 'split', 'function', 'crypto', 'datetime', 'filter', 'sort',
-            'limit', 'aggregate', 'compress', 'convert', 'edit', 'html', 'xml',
-            'jwt', 'wait', 'noop', 'error', 'debug', 'sticky'
-        ]
-
-        if any(keyword in node_name for keyword in core_keywords):
+        if any(keyword in node_name for keyword in CORE_KEYWORDS):
             return 'Core'
 
         # App nodes
@@ -352,10 +418,83 @@ def categorize_node(row):
 
     return row.get('category', 'Unknown')
 
+def categorize_nodes(df):
+    """
+    Vectorized categorize_node for a whole DataFrame
+    Returns the category Series (same result as df.apply(categorize_node, axis=1))
+    """
+    node_type = df['node_type']
+    is_base = node_type.str.startswith('n8n-nodes-base.', na=False)
+    node_name = node_type.str.replace('n8n-nodes-base.', '', regex=False).str.lower()
+    core_pattern = '|'.join(re.escape(keyword) for keyword in CORE_KEYWORDS)
+
+    conditions = [
+        node_type.isna(),
+        node_type.str.startswith('@', na=False) & node_type.str.contains('n8n-nodes', regex=False, na=False),
+        node_type.str.lower().str.contains('langchain', regex=False, na=False),
+        is_base & node_name.str.contains('trigger', regex=False, na=False),
+        is_base & node_name.str.contains(core_pattern, regex=True, na=False),
+        is_base,
+    ]
+    choices = ['Unknown', 'Community', 'LangChain', 'Trigger', 'Core', 'App']
+
+    if 'category' in df.columns:
+        default = df['category'].to_numpy(dtype=object)
+    else:
+        default = 'Unknown'
+
+    categories = np.select([c.to_numpy(dtype=bool) for c in conditions], choices, default=default)
+    return pd.Series(categories, index=df.index)
+
 def get_category_stats(df):
     """Get statistics by category"""
     return df['category'].value_counts().to_dict()
 
+def score_matrix(df, terms):
+    """
+    Vectorized calculate_relevance_score over all rows of df
+    Returns a float array with one score per row (identical values)
+    """
+    node_type = lower_search_column(df, 'node_type')
+    display_name = lower_search_column(df, 'display_name')
+    description = lower_search_column(df, 'description').fillna('')
+
+    # calculate_relevance_score scores missing names as str(value), e.g. 'nan'
+    if node_type.isna().any():
+        node_type = node_type.fillna(df['node_type'].map(lambda v: str(v).lower()))
+    if display_name.isna().any():
+        display_name = display_name.fillna(df['display_name'].map(lambda v: str(v).lower()))
+
+    node_type_values = node_type.to_numpy(dtype=object)
+    display_name_values = display_name.to_numpy(dtype=object)
+
+    scores = np.zeros(len(df), dtype=np.float64)
+
+    for term in terms:
+        term = term.lower()
+
+        in_display_name = display_name.str.contains(term, regex=False).to_numpy(dtype=bool)
+        in_node_type = node_type.str.contains(term, regex=False).to_numpy(dtype=bool)
+        in_description = description.str.contains(term, regex=False).to_numpy(dtype=bool)
+
+        # Exact match beats partial match
+        scores += np.where((display_name_values == term), 100, np.where(in_display_name, 50, 0))
+        scores += np.where((node_type_values == term), 80, np.where(in_node_type, 30, 0))
+        scores += np.where(in_description, 10, 0)
+
+        # Whole word matches are a subset of substring matches - only check those rows
+        boundary = re.compile(rf'\b{re.escape(term)}\b')
+        scores[in_display_name] += np.fromiter(
+            (20 if boundary.search(text) else 0 for text in display_name_values[in_display_name]),
+            dtype=np.float64, count=int(in_display_name.sum())
+        )
+        scores[in_node_type] += np.fromiter(
+            (15 if boundary.search(text) else 0 for text in node_type_values[in_node_type]),
+            dtype=np.float64, count=int(in_node_type.sum())
+        )
+
+    return scores
+
 def calculate_relevance_score(row, search_terms):
     """Calculate relevance score for intelligent search"""
     score = 0
@@ -391,41 +530,254 @@ def calculate_relevance_score(row, search_terms):
 
     return score
 
+class NodeSearchIndex:
+    """
+    In-memory inverted index over node_type, display_name and description
+    Built once per loaded DataFrame - queries only touch candidate rows
+    """
+
+    FIELD_DISPLAY_NAME = 0
+    FIELD_NODE_TYPE = 1
+    FIELD_DESCRIPTION = 2
+
+    # calculate_relevance_score points per field (display_name, node_type, description)
+    SUBSTRING_POINTS = (50, 30, 10)
+    WHOLE_WORD_POINTS = (20, 15, 0)
+    # Term equal to the whole field: 100 instead of 50 / 80 instead of 30
+    EXACT_BONUS = (50, 50, 0)
+
+    TOKEN_PATTERN = re.compile(r'\w+')
+    MAX_CACHED_FRAGMENTS = 1024
+    GRAM_SIZE = 3
+
+    def __init__(self, df):
+        self.labels = df.index
+
+        # Lowercased text used for matching (missing values never match)
+        self.display_names = [str(v).lower() if pd.notna(v) else '' for v in df['display_name']]
+        self.node_types = [str(v).lower() if pd.notna(v) else '' for v in df['node_type']]
+        self.descriptions = [str(v).lower() if pd.notna(v) else '' for v in df['description']]
+
+        # Scoring uses str() of the raw value like calculate_relevance_score
+        # (e.g. 'nan') - rows with a missing name are scored on these strings
+        self.score_display_names = [
+            text if pd.notna(v) else str(v).lower()
+            for v, text in zip(df['display_name'], self.display_names)
+        ]
+        self.score_node_types = [
+            text if pd.notna(v) else str(v).lower()
+            for v, text in zip(df['node_type'], self.node_types)
+        ]
+        self.missing_names = (df['display_name'].isna() | df['node_type'].isna()).to_numpy()
+
+        # Per field: token -> row positions
+        self.field_postings = tuple(defaultdict(set) for _ in range(3))
+        fields = (
+            (self.FIELD_DISPLAY_NAME, self.display_names),
+            (self.FIELD_NODE_TYPE, self.node_types),
+            (self.FIELD_DESCRIPTION, self.descriptions),
+        )
+        vocabulary = {}
+        for field, values in fields:
+            postings = self.field_postings[field]
+            for row, text in enumerate(values):
+                for token in set(self.TOKEN_PATTERN.findall(text)):
+                    postings[token].add(row)
+                    vocabulary[token] = None
+
+        self.vocabulary = list(vocabulary)
+
+        # Substrings of up to GRAM_SIZE characters -> vocabulary positions
+        # (longer fragments intersect the sets of their trigrams)
+        self.token_grams = defaultdict(set)
+        size = self.GRAM_SIZE
+        for position, token in enumerate(self.vocabulary):
+            length = len(token)
+            for start in range(length):
+                for end in range(start + 1, min(start + size, length) + 1):
+                    self.token_grams[token[start:end]].add(position)
+
+        self._fragment_cache = {}
+
+    def __len__(self):
+        return len(self.labels)
+
+    def _tokens_containing(self, fragment):
+        """Vocabulary positions of the tokens containing fragment"""
+        size = self.GRAM_SIZE
+        if len(fragment) <= size:
+            return self.token_grams.get(fragment, ())
+
+        gram_sets = sorted(
+            (self.token_grams.get(fragment[start:start + size], set())
+             for start in range(len(fragment) - size + 1)),
+            key=len
+        )
+        positions = gram_sets[0].intersection(*gram_sets[1:])
+        return [position for position in positions if fragment in self.vocabulary[position]]
+
+    def _field_rows(self, fragment):
+        """
+        Row positions with a token containing fragment: one set per field
+        plus their union (cached)
+        """
+        cached = self._fragment_cache.get(fragment)
+        if cached is None:
+            tokens = [self.vocabulary[position] for position in self._tokens_containing(fragment)]
+            field_rows = tuple(set() for _ in self.field_postings)
+            for rows, postings in zip(field_rows, self.field_postings):
+                for token in tokens:
+                    posting = postings.get(token)
+                    if posting:
+                        rows.update(posting)
+            cached = (field_rows, set().union(*field_rows))
+            if len(self._fragment_cache) >= self.MAX_CACHED_FRAGMENTS:
+                self._fragment_cache.clear()
+            self._fragment_cache[fragment] = cached
+        return cached
+
+    def matching_rows(self, term):
+        """Row positions where term is a substring of any indexed field"""
+        fragments = self.TOKEN_PATTERN.findall(term)
+
+        if not fragments:
+            # Punctuation-only terms cannot use the index
+            candidates = range(len(self.labels))
+        else:
+            candidates = None
+            for fragment in fragments:
+                rows = self._field_rows(fragment)[1]
+                candidates = rows if candidates is None else candidates & rows
+
+            # A single-token term is contained in every candidate by construction
+            if fragments == [term]:
+                return candidates
+
+        return {
+            row for row in candidates
+            if term in self.display_names[row]
+            or term in self.node_types[row]
+            or term in self.descriptions[row]
+        }
+
+    def term_score(self, row, term, boundary):
+        """Points of one term for one row, as in calculate_relevance_score"""
+        score = 0
+        display_name = self.score_display_names[row]
+        node_type = self.score_node_types[row]
+
+        if term == display_name:
+            score += 100
+        elif term in display_name:
+            score += 50
+
+        if term == node_type:
+            score += 80
+        elif term in node_type:
+            score += 30
+
+        if term in self.descriptions[row]:
+            score += 10
+
+        if boundary.search(display_name):
+            score += 20
+        if boundary.search(node_type):
+            score += 15
+
+        return score
+
+    def score(self, row, compiled_terms):
+        """Relevance score identical to calculate_relevance_score"""
+        return sum(self.term_score(row, term, boundary) for term, boundary in compiled_terms)
+
+    def _add_token_term(self, scores, matched, term):
+        """
+        Points of a term that is a single \\w+ token, from the postings alone:
+        term is a substring of a field iff one of its tokens contains term,
+        and a whole word (regex \\b) iff one of its tokens equals term
+        """
+        field_rows, _ = self._field_rows(term)
+        texts = (self.display_names, self.node_types, self.descriptions)
+
+        for field, rows in enumerate(field_rows):
+            if not rows:
+                continue
+            positions = np.fromiter(rows, dtype=np.intp, count=len(rows))
+            scores[positions] += self.SUBSTRING_POINTS[field]
+            matched[positions] = True
+
+            if not self.WHOLE_WORD_POINTS[field]:
+                continue
+            word_rows = self.field_postings[field].get(term)
+            if word_rows:
+                positions = np.fromiter(word_rows, dtype=np.intp, count=len(word_rows))
+                scores[positions] += self.WHOLE_WORD_POINTS[field]
+                # Only a field holding a single token can equal the term
+                exact = [row for row in word_rows if texts[field][row] == term]
+                scores[exact] += self.EXACT_BONUS[field]
+
+    def search(self, search_terms):
+        """
+        Return relevance scores of all matching rows as a Series
+        indexed by the original DataFrame labels (in original row order)
+        """
+        terms = [term.lower() for term in search_terms]
+        compiled_terms = [(term, re.compile(rf'\b{re.escape(term)}\b')) for term in terms]
+
+        scores = np.zeros(len(self.labels), dtype=np.int64)
+        matched = np.zeros(len(self.labels), dtype=bool)
+        for term, boundary in compiled_terms:
+            if self.TOKEN_PATTERN.findall(term) == [term]:
+                self._add_token_term(scores, matched, term)
+            else:
+                # Terms with punctuation or spaces: match and score on the strings
+                for row in self.matching_rows(term):
+                    scores[row] += self.term_score(row, term, boundary)
+                    matched[row] = True
+
+        rows = np.flatnonzero(matched)
+
+        # Missing names score as e.g. 'nan' - rescore these rows on the strings
+        for row in rows[self.missing_names[rows]]:
+            scores[row] = self.score(row, compiled_terms)
+
+        return pd.Series(scores[rows], index=self.labels[rows], dtype='int64')
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def load_shared_node_context(database_version):
+    """
+    Process-wide AI node catalog shared by all sessions
+    Rebuilt once whenever database_version changes
+    """
+    return NodeCatalog.from_context(load_node_context_for_ai(limit=None))
+
 def load_node_context_for_ai(limit=None):
     """
     Load COMPREHENSIVE node information for AI context
     Returns ALL nodes with their operations, parameters, and credentials from database
-    NOTE: Not cached due to complex dict structures
+    Each child table is read once and grouped by node_type (no per-node queries)
     """
     conn = get_database_connection()
     cursor = conn.cursor()
 
     # Get ALL nodes with their details (no limit by default)
+    query = '''
+        SELECT DISTINCT
+            n.node_type,
+            n.display_name,
+            n.description,
+            n.category
+        FROM node_types_api n
+        WHERE n.category IN ('App', 'Trigger', 'Core')
+        ORDER BY n.display_name
+    '''
     if limit:
-        cursor.execute('''
-            SELECT DISTINCT
-                n.node_type,
-                n.display_name,
-                n.description,
-                n.category
-            FROM node_types_api n
-            WHERE n.category IN ('App', 'Trigger', 'Core')
-            ORDER BY n.display_name
-            LIMIT ?
-        ''', (limit,))
+        cursor.execute(query + ' LIMIT ?', (limit,))
     else:
-        cursor.execute('''
-            SELECT DISTINCT
-                n.node_type,
-                n.display_name,
-                n.description,
-                n.category
-            FROM node_types_api n
-            WHERE n.category IN ('App', 'Trigger', 'Core')
-            ORDER BY n.display_name
-        ''')
+        cursor.execute(query)
 
     nodes_data = []
+    nodes_by_type = {}
     for node_type, display_name, description, category in cursor.fetchall():
         node_info = {
             'node_type': node_type,
@@ -436,30 +788,34 @@ def load_node_context_for_ai(limit=None):
             'parameters': [],
             'credentials': []
         }
-
-        # Get ALL operations for this node from database
-        cursor.execute('''
-            SELECT operation, description
-            FROM node_operations
-            WHERE node_type = ?
-            ORDER BY operation
-        ''', (node_type,))
-
-        for operation, op_desc in cursor.fetchall():
+        nodes_data.append(node_info)
+        nodes_by_type[node_type] = node_info
+
+    # Get ALL operations in one pass
+    cursor.execute('''
+        SELECT node_type, operation, description
+        FROM node_operations
+        ORDER BY node_type, operation
+    ''')
+
+    for node_type, operation, op_desc in cursor.fetchall():
+        node_info = nodes_by_type.get(node_type)
+        if node_info is not None:
             node_info['operations'].append({
                 'operation': operation,
                 'description': op_desc or ''
             })
 
-        # Get ALL parameters for this node from database (no limit - we need everything!)
-        cursor.execute('''
-            SELECT parameter_name, display_name, parameter_type, required, description, default_value
-            FROM node_parameters
-            WHERE node_type = ?
-            ORDER BY required DESC, parameter_name
-        ''', (node_type,))
+    # Get ALL parameters in one pass (no limit - we need everything!)
+    cursor.execute('''
+        SELECT node_type, parameter_name, display_name, parameter_type, required, description, default_value
+        FROM node_parameters
+        ORDER BY node_type, required DESC, parameter_name
+    ''')
 
-        for param_name, param_display, param_type, required, param_desc, default_val in cursor.fetchall():
+    for node_type, param_name, param_display, param_type, required, param_desc, default_val in cursor.fetchall():
+        node_info = nodes_by_type.get(node_type)
+        if node_info is not None:
             node_info['parameters'].append({
                 'name': param_name,
                 'display_name': param_display or param_name,
@@ -469,27 +825,30 @@ def load_node_context_for_ai(limit=None):
                 'default': default_val
             })
 
-        # Get credentials for this node from database
-        cursor.execute('''
-            SELECT credential_type, display_name
-            FROM node_credentials
-            WHERE node_type = ?
-        ''', (node_type,))
-
-        for cred_type, cred_display in cursor.fetchall():
+    # Get ALL credentials in one pass
+    # (per node in credential_type order, like the former per-node lookup
+    # through the UNIQUE(node_type, credential_type) index)
+    cursor.execute('''
+        SELECT node_type, credential_type, display_name
+        FROM node_credentials
+        ORDER BY node_type, credential_type
+    ''')
+
+    for node_type, cred_type, cred_display in cursor.fetchall():
+        node_info = nodes_by_type.get(node_type)
+        if node_info is not None:
             node_info['credentials'].append({
                 'type': cred_type,
                 'display_name': cred_display or cred_type
             })
 
-        nodes_data.append(node_info)
-
     return nodes_data
 
 def generate_workflow_with_openai(prompt, api_key, nodes_context):
     """
     Generate n8n workflow using OpenAI API
     Compatible with both openai 0.28 and 1.0+
+    nodes_context: NodeCatalog (or iterable of CatalogNode records)
     """
     try:
         import openai
@@ -498,8 +857,8 @@ def generate_workflow_with_openai(prompt, api_key, nodes_context):
         # Build COMPREHENSIVE system message with ALL available node context
         # Group nodes by availability of details
         try:
-            detailed_nodes = [n for n in nodes_context if n.get('operations') or n.get('parameters')]
-            basic_nodes = [n for n in nodes_context if not n.get('operations') and not n.get('parameters')]
+            detailed_nodes = [n for n in nodes_context if n.operations or n.parameters]
+            basic_nodes = [n for n in nodes_context if not n.operations and not n.parameters]
         except Exception as e:
             print(f"✗ Error grouping nodes: {type(e).__name__}: {e}")
             traceback.print_exc()
@@ -517,27 +876,27 @@ def generate_workflow_with_openai(prompt, api_key, nodes_context):
         # Only send essential info for detailed nodes (top 10 most useful)
         try:
             # Prioritize nodes with most parameters (likely most useful)
-            detailed_sorted = sorted(detailed_nodes, key=lambda x: len(x.get('parameters', [])), reverse=True)[:10]
+            detailed_sorted = sorted(detailed_nodes, key=lambda x: len(x.parameters), reverse=True)[:10]
 
             # Compact format - only essential fields
             detailed_compact = []
             for n in detailed_sorted:
                 compact = {
-                    'type': n['node_type'],
-                    'name': n['display_name'],
+                    'type': n.node_type,
+                    'name': n.display_name,
                 }
-                if n.get('operations'):
-                    compact['ops'] = [op['operation'] for op in n['operations'][:3]]  # Max 3 ops
-                if n.get('parameters'):
-                    compact['params'] = [{'name': p['name'], 'type': p.get('type', 'string'), 'req': p.get('required', False)} for p in n['parameters'][:5]]  # Max 5 params
-                if n.get('credentials'):
-                    compact['creds'] = [c['type'] for c in n['credentials'][:2]]  # Max 2 creds
+                if n.operations:
+                    compact['ops'] = [op.operation for op in n.operations[:3]]  # Max 3 ops
+                if n.parameters:
+                    compact['params'] = [{'name': p.name, 'type': p.type or 'string', 'req': p.required} for p in n.parameters[:5]]  # Max 5 params
+                if n.credentials:
+                    compact['creds'] = [c.type for c in n.credentials[:2]]  # Max 2 creds
                 detailed_compact.append(compact)
 
             detailed_nodes_json = json.dumps(detailed_compact, indent=2, default=str)
 
             # Basic nodes - just node types and names (no descriptions to save tokens)
-            basic_nodes_json = json.dumps([{'type': n['node_type'], 'name': n['display_name']} for n in basic_nodes[:30]], indent=2, default=str)
+            basic_nodes_json = json.dumps([{'type': n.node_type, 'name': n.display_name} for n in basic_nodes[:30]], indent=2, default=str)
 
             print(f"Serialized {len(detailed_compact)} detailed nodes, {min(30, len(basic_nodes))} basic nodes")
         except Exception as e:
@@ -668,88 +1027,125 @@ def export_workflow(workflow):
     """
     return json.dumps(workflow, indent=2, ensure_ascii=False)
 
-def expand_search_terms(search_term):
-    """Expand search term with synonyms and related terms"""
-    # Common synonyms and related terms for n8n nodes
-    synonyms = {
-        'email': ['mail', 'gmail', 'outlook', 'smtp', 'imap'],
-        'mail': ['email', 'gmail', 'outlook', 'smtp'],
-        'calendar': ['schedule', 'event', 'appointment', 'google calendar'],
-        'database': ['db', 'sql', 'postgres', 'mysql', 'mongodb'],
-        'db': ['database', 'sql', 'postgres', 'mysql'],
-        'sheet': ['spreadsheet', 'excel', 'google sheets', 'airtable'],
-        'spreadsheet': ['sheet', 'excel', 'google sheets'],
-        'storage': ['drive', 'dropbox', 'box', 's3', 'cloud'],
-        'cloud': ['storage', 'drive', 'aws', 'azure', 'gcp'],
-        'chat': ['slack', 'teams', 'discord', 'telegram', 'whatsapp', 'messenger'],
-        'message': ['chat', 'sms', 'whatsapp', 'telegram'],
-        'crm': ['salesforce', 'hubspot', 'pipedrive', 'zoho'],
-        'payment': ['stripe', 'paypal', 'paddle'],
-        'automation': ['workflow', 'trigger', 'cron', 'schedule'],
-        'ai': ['openai', 'anthropic', 'langchain', 'gpt', 'claude', 'gemini'],
-        'llm': ['ai', 'openai', 'anthropic', 'langchain', 'gpt'],
-        'social': ['twitter', 'facebook', 'linkedin', 'instagram'],
-        'document': ['doc', 'pdf', 'google docs', 'notion'],
-        'form': ['typeform', 'google forms', 'jotform'],
-        'video': ['youtube', 'vimeo'],
-        'sms': ['twilio', 'message', 'text'],
-        'webhook': ['http', 'api', 'trigger'],
-        'api': ['http', 'rest', 'webhook'],
-        'code': ['javascript', 'python', 'function'],
-        'microsoft': ['outlook', 'teams', 'onedrive', 'excel', 'sharepoint'],
-        'google': ['gmail', 'sheets', 'drive', 'calendar', 'docs'],
-        'aws': ['s3', 'lambda', 'dynamodb', 'sns', 'sqs'],
-    }
+def load_synonyms(path=None):
+    """Load synonym table (term -> related terms) from data/synonyms.json"""
+    with open(path or SYNONYMS_PATH, encoding='utf-8') as f:
+        synonyms = json.load(f)
+    return {key.lower(): [value.lower() for value in values] for key, values in synonyms.items()}
 
-    terms = [search_term.lower()]
+class SynonymTrie:
+    """
+    Token trie over all synonym phrases with precomputed expansions
+    Built once - expanding a query only walks its tokens
+    """
 
-    # Add synonyms
-    if search_term.lower() in synonyms:
-        terms.extend(synonyms[search_term.lower()])
+    def __init__(self, synonyms):
+        self.root = {}
+
+        # value -> keys listing it (in table order)
+        reverse = defaultdict(list)
+        for key, values in synonyms.items():
+            for value in dict.fromkeys(values):
+                reverse[value].append(key)
+
+        for phrase in list(synonyms) + list(reverse):
+            terms = [phrase] + synonyms.get(phrase, [])
+
+            # Term is part of another synonym list -> add that group
+            for key in reverse.get(phrase, []):
+                terms.append(key)
+                terms.extend(synonyms[key])
+
+            self._insert(phrase, list(dict.fromkeys(terms)))
+
+    def _insert(self, phrase, expansion):
+        node = self.root
+        for token in phrase.split():
+            node = node.setdefault(token, {})
+        node[None] = expansion
+
+    def expand(self, query):
+        """
+        Query plus expansions of every synonym phrase in it (longest match per position)
+        Tokens without synonyms only match as part of the full query
+        """
+        query = query.lower()
+        tokens = query.split()
+        terms = [query]
+
+        i = 0
+        while i < len(tokens):
+            node = self.root
+            match_end, expansion = None, None
+            j = i
+            while j < len(tokens) and tokens[j] in node:
+                node = node[tokens[j]]
+                j += 1
+                if None in node:
+                    match_end, expansion = j, node[None]
+
+            if expansion is not None:
+                terms.extend(expansion)
+                i = match_end
+            else:
+                i += 1
 
-    # Check if search term is part of any synonym
-    for key, values in synonyms.items():
-        if search_term.lower() in values:
-            terms.append(key)
-            terms.extend(values)
+        # Remove duplicates while preserving order
+        return list(dict.fromkeys(terms))
 
-    # Remove duplicates while preserving order
-    seen = set()
-    expanded = []
-    for term in terms:
-        if term not in seen:
-            seen.add(term)
-            expanded.append(term)
+SYNONYM_TRIE = SynonymTrie(load_synonyms())
 
-    return expanded
+def expand_search_terms(search_term):
+    """Expand search term with synonyms and related terms (see data/synonyms.json)"""
+    return SYNONYM_TRIE.expand(search_term)
 
-def search_nodes(df, search_term, selected_categories, sort_by):
-    """Intelligent filter and search nodes with relevance ranking"""
+def search_nodes(df, search_term, selected_categories, sort_by, search_index=None):
+    """
+    Intelligent filter and search nodes with relevance ranking
+    search_index: optional NodeSearchIndex built from df (or a superset of its rows)
+    """
     # Filter by category
     if selected_categories and 'All' not in selected_categories:
         df = df[df['category'].isin(selected_categories)]
 
-    # Intelligent search
-    if search_term:
+    # Intelligent search via prebuilt inverted index
+    if search_term and search_index is not None:
+        search_terms = expand_search_terms(search_term)
+
+        scores = search_index.search(search_terms)
+        scores = scores[scores.index.isin(df.index)]
+
+        df = df.loc[scores.index].copy()
+
+        if len(df) > 0:
+            df['_relevance'] = scores.values
+            df = df.sort_values('_relevance', ascending=False)
+
+    # Intelligent search (full scan)
+    elif search_term:
         # Expand search terms with synonyms
         search_terms = expand_search_terms(search_term)
 
         # Create a mask for matching rows
         mask = pd.Series([False] * len(df), index=df.index)
 
+        node_type = lower_search_column(df, 'node_type')
+        display_name = lower_search_column(df, 'display_name')
+        description = lower_search_column(df, 'description')
+
         for term in search_terms:
             term_lower = term.lower()
             mask |= (
-                df['node_type'].str.lower().str.contains(term_lower, na=False, regex=False) |
-                df['display_name'].str.lower().str.contains(term_lower, na=False, regex=False) |
-                df['description'].str.lower().str.contains(term_lower, na=False, regex=False)
+                node_type.str.contains(term_lower, na=False, regex=False) |
+                display_name.str.contains(term_lower, na=False, regex=False) |
+                description.str.contains(term_lower, na=False, regex=False)
             )
 
         df = df[mask].copy()
 
         # Calculate relevance scores
         if len(df) > 0:
-            df['_relevance'] = df.apply(lambda row: calculate_relevance_score(row, search_terms), axis=1)
+            df['_relevance'] = score_matrix(df, search_terms)
 
             # Sort by relevance if we have search results
             if sort_by == 'Relevance' or search_term:
@@ -757,14 +1153,7 @@ def search_nodes(df, search_term, selected_categories, sort_by):
 
     # Sort (if not already sorted by relevance)
     if not search_term or sort_by != 'Relevance':
-        if sort_by == 'Name (A-Z)':
-            df = df.sort_values('display_name')
-        elif sort_by == 'Name (Z-A)':
-            df = df.sort_values('display_name', ascending=False)
-        elif sort_by == 'Node Type (A-Z)':
-            df = df.sort_values('node_type')
-        elif sort_by == 'Category':
-            df = df.sort_values(['category', 'display_name'])
+        df = sort_nodes(df, sort_by)
 
     # Remove temporary relevance column if it exists
     if '_relevance' in df.columns:
@@ -772,6 +1161,161 @@ def search_nodes(df, search_term, selected_categories, sort_by):
 
     return df
 
+def sort_nodes(df, sort_by):
+    """
+    Sort nodes by a non-relevance sort option
+    Stable, so equal names keep their relevance order in every search backend
+    """
+    if sort_by == 'Name (A-Z)':
+        df = df.sort_values('display_name', kind='stable')
+    elif sort_by == 'Name (Z-A)':
+        df = df.sort_values('display_name', ascending=False, kind='stable')
+    elif sort_by == 'Node Type (A-Z)':
+        df = df.sort_values('node_type', kind='stable')
+    elif sort_by == 'Category':
+        df = df.sort_values(['category', 'display_name'], kind='stable')
+    return df
+
+def has_fts_index(conn):
+    """Check whether the FTS5 search index (scripts/extend_database_schema.py) exists"""
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'node_search_fts'"
+    ).fetchone()
+    return row is not None
+
+def search_nodes_fts(conn, search_term, selected_categories, sort_by):
+    """
+    Search nodes inside SQLite using the FTS5 index
+    The index only selects the matching rows - they are ranked with
+    score_matrix like search_nodes, so both backends return the same order
+    """
+    search_terms = expand_search_terms(search_term)
+    lowered_terms = [term.lower() for term in search_terms]
+
+    # Trigram index needs at least 3 characters - shorter terms use LIKE
+    fts_terms = [term for term in lowered_terms if len(term) >= 3]
+    like_terms = [term for term in lowered_terms if len(term) < 3]
+
+    match_queries = []
+    params = []
+
+    if fts_terms:
+        match_queries.append('''
+            SELECT rowid FROM node_search_fts WHERE node_search_fts MATCH ?
+        ''')
+        params.append(' OR '.join('"' + term.replace('"', '""') + '"' for term in fts_terms))
+
+    for term in like_terms:
+        pattern = '%' + term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+        match_queries.append('''
+            SELECT rowid
+            FROM node_search_fts
+            WHERE node_type LIKE ? ESCAPE '\\'
+               OR display_name LIKE ? ESCAPE '\\'
+               OR description LIKE ? ESCAPE '\\'
+        ''')
+        params.extend([pattern] * 3)
+
+    # Rows shadowed by a higher priority source are dropped before matching,
+    # like the drop_duplicates in load_node_rows (API > GitHub > npm)
+    query = f'''
+        SELECT
+            f.node_type,
+            f.display_name,
+            f.description,
+            f.category,
+            f.version,
+            f.source
+        FROM node_search_fts f
+        WHERE f.rowid IN ({' UNION '.join(match_queries)})
+          AND NOT (f.source = 'GitHub' AND f.node_type IN (SELECT node_type FROM node_types_api))
+          AND NOT (f.source = 'npm' AND (
+              f.node_type IN (SELECT node_type FROM node_types_api)
+              OR f.node_type IN (SELECT node_type FROM node_types_github)
+          ))
+        ORDER BY CASE f.source WHEN 'API' THEN 0 WHEN 'GitHub' THEN 1 ELSE 2 END, f.rowid
+    '''
+
+    df = pd.read_sql_query(query, conn, params=params)
+
+    # Same post-processing as load_all_nodes
+    df = df.drop_duplicates(subset=['node_type'], keep='first')
+    df['version'] = df['version'].fillna('').astype(str).replace('nan', '').replace('None', '')
+    df['category'] = categorize_nodes(df)
+
+    if selected_categories and 'All' not in selected_categories:
+        df = df[df['category'].isin(selected_categories)]
+
+    if len(df) > 0:
+        df = df.assign(_relevance=score_matrix(df, search_terms))
+        df = df.sort_values('_relevance', ascending=False)
+
+    if sort_by != 'Relevance':
+        df = sort_nodes(df, sort_by)
+
+    return df.drop(columns=['_relevance'], errors='ignore').reset_index(drop=True)
+
+class SearchResultCache:
+    """
+    Bounded LRU cache of search results with hit/miss counters
+    Shared by all sessions - cached DataFrames must not be mutated
+    """
+
+    def __init__(self, maxsize=64):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+@st.cache_resource
+def get_search_cache():
+    """Process-wide search result cache"""
+    return SearchResultCache(SEARCH_CACHE_SIZE)
+
+def cached_search_nodes(df, search_term, selected_categories, sort_by, search_index=None, database_version=None):
+    """
+    search_nodes / search_nodes_fts with LRU memoization
+    Key: database version, normalized query, selected categories, sort mode and backend
+    """
+    search_term = search_term.strip().lower()
+    if not selected_categories or 'All' in selected_categories:
+        categories = ('All',)
+    else:
+        categories = tuple(sorted(selected_categories))
+
+    key = (database_version, search_term, categories, sort_by, SEARCH_BACKEND)
+    cache = get_search_cache()
+
+    result = cache.get(key)
+    if result is None:
+        if search_term and SEARCH_BACKEND == 'fts' and has_fts_index(get_database_connection()):
+            result = search_nodes_fts(get_database_connection(), search_term, list(categories), sort_by)
+        else:
+            result = search_nodes(df, search_term, list(categories), sort_by, search_index=search_index)
+        cache.put(key, result)
+
+    return result
+
 def get_category_color(category):
     """Get CSS class for category badge"""
     category_map = {
@@ -783,6 +1327,80 @@ def get_category_color(category):
     }
     return category_map.get(category, 'cat-app')
 
+def paginate(df, page, page_size):
+    """
+    Slice one result page - returns (page_df, page, total_pages)
+    page is clamped to the valid range
+    """
+    total_pages = max(1, -(-len(df) // page_size))
+    page = min(max(page, 1), total_pages)
+    start = (page - 1) * page_size
+    return df.iloc[start:start + page_size], page, total_pages
+
+def render_cards_html(page_df):
+    """Single HTML block with one card per node"""
+    cards = []
+    for row in page_df.itertuples(index=False):
+        description = ''
+        if pd.notna(row.description) and row.description:
+            text = str(row.description)
+            description = f"<p style='margin: 0.5rem 0 0 0;'><em>{html.escape(text[:200])}{'...' if len(text) > 200 else ''}</em></p>"
+
+        version = f"<strong>Version:</strong> {html.escape(str(row.version))}<br>" if pd.notna(row.version) else ''
+
+        cards.append(f"""
+        <div class="node-card" style="display: flex; gap: 1rem;">
+            <div style="flex: 3;">
+                <span class="node-category {get_category_color(row.category)}">{html.escape(str(row.category))}</span>
+                <h3 style="margin: 0.5rem 0;">{html.escape(str(row.display_name))}</h3>
+                <code class="node-type">{html.escape(str(row.node_type))}</code>
+                {description}
+            </div>
+            <div style="flex: 1;">
+                {version}<strong>Source:</strong> {html.escape(str(row.source))}
+            </div>
+        </div>
+        """)
+
+    # One line per card - blank/indented lines would break the markdown HTML block
+    return '\n'.join(' '.join(line.strip() for line in card.splitlines() if line.strip()) for card in cards)
+
+def render_compact_html(page_df):
+    """Single HTML block with one line per node"""
+    lines = []
+    for row in page_df.itertuples(index=False):
+        lines.append(f"""
+        <div style="padding: 0.5rem 0; border-bottom: 1px solid #eee;">
+            <span class="node-category {get_category_color(row.category)}">{html.escape(str(row.category))}</span>
+            <strong>{html.escape(str(row.display_name))}</strong>
+            <br>
+            <code style="font-size: 0.8rem; color: #666;">{html.escape(str(row.node_type))}</code>
+        </div>
+        """)
+
+    # One line per node - blank/indented lines would break the markdown HTML block
+    return '\n'.join(' '.join(part.strip() for part in line.splitlines() if part.strip()) for line in lines)
+
+def render_pager(page, total_pages, position):
+    """Previous/next controls - updates the page cursor in session state"""
+    prev_col, info_col, next_col = st.columns([1, 2, 1])
+
+    with prev_col:
+        if st.button("◀ Previous", width='stretch', key=f'page_prev_{position}', disabled=page <= 1):
+            st.session_state['results_page'] = page - 1
+            st.rerun()
+
+    with info_col:
+        st.markdown(
+            f"<div style='text-align: center; padding-top: 0.4rem;'>Page <strong>{page}</strong> of {total_pages}</div>",
+            unsafe_allow_html=True
+        )
+
+    with next_col:
+        if st.button("Next ▶", width='stretch', key=f'page_next_{position}', disabled=page >= total_pages):
+            st.session_state['results_page'] = page + 1
+            st.rerun()
+
 def main():
     # Professional Header with gradient background
     st.markdown("""
@@ -798,13 +1416,10 @@ def main():
     </div>
     """, unsafe_allow_html=True)
 
-    # Load data BEFORE tabs (cache in session state to avoid hashing issues)
-    if 'all_nodes_df' not in st.session_state:
-        with st.spinner('🔄 Loading node database...'):
-            st.session_state['all_nodes_df'] = load_all_nodes()
-
-    # Create a fresh copy to avoid mutation warnings
-    df = st.session_state['all_nodes_df'].copy()
+    # Load data BEFORE tabs (shared by all sessions, reloaded when the database changes)
+    database_version = get_database_version()
+    with st.spinner('🔄 Loading node database...'):
+        df, search_index = load_shared_nodes(database_version)
 
     # Main tabs with elegant icons
     tab1, tab2 = st.tabs(["🔍 Node Explorer", "🤖 AI Workflow Generator"])
@@ -858,6 +1473,13 @@ def main():
                 label_visibility="collapsed"
             )
 
+            page_size = st.selectbox(
+                "Results per page",
+                RESULTS_PAGE_SIZES,
+                index=1,
+                help="Cards and Compact views render one page at a time"
+            )
+
         # Statistics - very compact
         with st.sidebar.expander("📊 Statistics"):
             for category, count in sorted(stats.items()):
@@ -869,6 +1491,8 @@ def main():
                     </div>
                     """, unsafe_allow_html=True)
 
+            search_cache_stats = st.empty()
+
         # Main content - Search Section
         st.markdown("### 🔍 Search Nodes")
 
@@ -920,7 +1544,21 @@ def main():
                     st.rerun()
 
         # Filter and search
-        filtered_df = search_nodes(df, search_term, selected_categories, sort_by)
+        filtered_df = cached_search_nodes(
+            df, search_term, selected_categories, sort_by,
+            search_index=search_index,
+            database_version=database_version
+        )
+
+        # Search cache counters (placeholder lives in the Statistics expander)
+        search_cache = get_search_cache()
+        search_cache_stats.markdown(f"""
+        <div style='display: flex; justify-content: space-between; padding: 0.25rem 0; margin-top: 0.5rem;
+                    border-top: 1px solid rgba(100, 116, 139, 0.3);'>
+            <span style='font-size: 0.85rem;'>Search cache</span>
+            <span style='font-weight: 600; color: #3b82f6;'>{search_cache.hits:,} hits / {search_cache.misses:,} misses</span>
+        </div>
+        """, unsafe_allow_html=True)
 
         # Show expanded search terms if searching
         if search_term:
@@ -956,36 +1594,27 @@ def main():
         if len(filtered_df) == 0:
             st.info("No nodes found. Try a different search.")
 
-        elif view_mode == 'Cards':
-            # Card view
-            for idx, row in filtered_df.iterrows():
-                with st.container():
-                    col1, col2 = st.columns([3, 1])
-
-                    with col1:
-                        # Category badge
-                        category_class = get_category_color(row['category'])
-                        st.markdown(
-                            f'<span class="node-category {category_class}">{row["category"]}</span>',
-                            unsafe_allow_html=True
-                        )
-
-                        # Display name
-                        st.markdown(f"### {row['display_name']}")
+        elif view_mode in ('Cards', 'Compact'):
+            # Reset page cursor whenever the result set or layout changes
+            page_key = (search_term, tuple(selected_categories), sort_by, view_mode, page_size)
+            if st.session_state.get('results_page_key') != page_key:
+                st.session_state['results_page_key'] = page_key
+                st.session_state['results_page'] = 1
 
-                        # Node type (technical name)
-                        st.markdown(f'<code class="node-type">{row["node_type"]}</code>', unsafe_allow_html=True)
+            page_df, page, total_pages = paginate(filtered_df, st.session_state['results_page'], page_size)
+            st.session_state['results_page'] = page
 
-                        # Description
-                        if pd.notna(row['description']) and row['description']:
-                            st.markdown(f"*{row['description'][:200]}{'...' if len(str(row['description'])) > 200 else ''}*")
+            if total_pages > 1:
+                render_pager(page, total_pages, 'top')
 
-                    with col2:
-                        if pd.notna(row['version']):
-                            st.markdown(f"**Version:** {row['version']}")
-                        st.markdown(f"**Source:** {row['source']}")
+            # One HTML block per page instead of one widget per node
+            if view_mode == 'Cards':
+                st.markdown(render_cards_html(page_df), unsafe_allow_html=True)
+            else:
+                st.markdown(render_compact_html(page_df), unsafe_allow_html=True)
 
-                    st.markdown("---")
+            if total_pages > 1:
+                render_pager(page, total_pages, 'bottom')
 
         elif view_mode == 'Table':
             # Table view
@@ -1004,23 +1633,6 @@ def main():
                 height=600
             )
 
-        elif view_mode == 'Compact List':
-            # Compact list view
-            for idx, row in filtered_df.iterrows():
-                category_class = get_category_color(row['category'])
-
-                st.markdown(
-                    f'''
-                    <div style="padding: 0.5rem 0; border-bottom: 1px solid #eee;">
-                        <span class="node-category {category_class}">{row["category"]}</span>
-                        <strong>{row["display_name"]}</strong>
-                        <br>
-                        <code style="font-size: 0.8rem; color: #666;">{row["node_type"]}</code>
-                    </div>
-                    ''',
-                    unsafe_allow_html=True
-                )
-
         # Footer
         st.markdown("---")
         st.markdown(
@@ -1044,17 +1656,14 @@ def main():
             st.code("OPENAI_API_KEY=sk-your-key-here", language="bash")
             return
 
-        # Load node context for AI with comprehensive database info (cache in session_state)
-        if 'nodes_context' not in st.session_state:
-            with st.spinner('🔄 Loading comprehensive node data from database (operations, parameters, credentials)...'):
-                st.session_state['nodes_context'] = load_node_context_for_ai(limit=None)  # Load ALL nodes
-
-        nodes_context = st.session_state['nodes_context']
+        # Load node context for AI with comprehensive database info (shared by all sessions)
+        with st.spinner('🔄 Loading comprehensive node data from database (operations, parameters, credentials)...'):
+            nodes_context = load_shared_node_context(get_database_version())  # Load ALL nodes
 
         # Show what was loaded
-        total_ops = sum(len(n.get('operations', [])) for n in nodes_context)
-        total_params = sum(len(n.get('parameters', [])) for n in nodes_context)
-        total_creds = sum(len(n.get('credentials', [])) for n in nodes_context)
+        total_ops = sum(len(n.operations) for n in nodes_context)
+        total_params = sum(len(n.parameters) for n in nodes_context)
+        total_creds = sum(len(n.credentials) for n in nodes_context)
 
         st.success(f"✅ Loaded {len(nodes_context)} nodes with {total_ops} operations, {total_params} parameters, {total_creds} credentials from FULL database!")
 
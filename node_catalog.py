@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compact node catalog for AI workflow generation
+Slotted, immutable records with interned strings - shared by
+n8n_nodes_app.py and workflow_generator_app.py
+"""
+
+import os
+import sys
+from dataclasses import dataclass
+
+
+def database_version(database_path, conn):
+    """
+    Change marker for the database: file mtime plus PRAGMA data_version
+    data_version also catches commits that only touched the WAL file
+    Cache key of the shared node data in both apps
+    """
+    try:
+        mtime = os.stat(database_path).st_mtime_ns
+    except OSError:
+        mtime = None
+    data_version = conn.execute('PRAGMA data_version').fetchone()[0]
+    return mtime, data_version
+
+
+def _intern(value):
+    """Intern repeated short strings (types, names, categories)"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@dataclass(frozen=True, slots=True)
+class Operation:
+    operation: str
+    description: str
+
+    def to_dict(self):
+        return {'operation': self.operation, 'description': self.description}
+
+
+@dataclass(frozen=True, slots=True)
+class Parameter:
+    name: str
+    display_name: str
+    type: str
+    required: bool
+    description: str
+    default: object = None
+
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'display_name': self.display_name,
+            'type': self.type,
+            'required': self.required,
+            'description': self.description,
+            'default': self.default
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class Credential:
+    type: str
+    display_name: str
+
+    def to_dict(self):
+        return {'type': self.type, 'display_name': self.display_name}
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogNode:
+    node_id: int
+    node_type: str
+    display_name: str
+    description: str
+    category: str
+    operations: tuple = ()
+    parameters: tuple = ()
+    credentials: tuple = ()
+
+    def to_dict(self):
+        """Same structure as the dicts from load_node_context_for_ai"""
+        return {
+            'node_type': self.node_type,
+            'display_name': self.display_name,
+            'description': self.description,
+            'category': self.category,
+            'operations': [op.to_dict() for op in self.operations],
+            'parameters': [param.to_dict() for param in self.parameters],
+            'credentials': [cred.to_dict() for cred in self.credentials]
+        }
+
+
+class NodeCatalog:
+    """
+    Immutable list of CatalogNode records with integer ids per node_type
+    """
+
+    __slots__ = ('nodes', 'node_ids')
+
+    def __init__(self, nodes):
+        self.nodes = tuple(nodes)
+        self.node_ids = {node.node_type: node.node_id for node in self.nodes}
+
+    @classmethod
+    def from_context(cls, nodes_context):
+        """Build catalog from node dicts (load_node_context_for_ai format)"""
+        nodes = []
+        for node_id, node in enumerate(nodes_context):
+            operations = tuple(
+                Operation(_intern(op['operation']), op.get('description'))
+                for op in node.get('operations', [])
+            )
+            parameters = tuple(
+                Parameter(
+                    _intern(param['name']),
+                    _intern(param.get('display_name')),
+                    _intern(param.get('type')),
+                    bool(param.get('required')),
+                    param.get('description'),
+                    param.get('default')
+                )
+                for param in node.get('parameters', [])
+            )
+            credentials = tuple(
+                Credential(_intern(cred['type']), _intern(cred.get('display_name')))
+                for cred in node.get('credentials', [])
+            )
+            nodes.append(CatalogNode(
+                node_id,
+                _intern(node['node_type']),
+                node.get('display_name'),
+                node.get('description'),
+                _intern(node.get('category')),
+                operations,
+                parameters,
+                credentials
+            ))
+        return cls(nodes)
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def __iter__(self):
+        return iter(self.nodes)
+
+    def __getitem__(self, index):
+        return self.nodes[index]
+
+    def get(self, node_type):
+        """Node record by node_type (None if unknown)"""
+        node_id = self.node_ids.get(node_type)
+        return None if node_id is None else self.nodes[node_id]
+
+    def to_dicts(self):
+        return [node.to_dict() for node in self.nodes]
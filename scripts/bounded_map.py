@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+executor.map mit begrenztem Vorlauf
+executor.map reicht die komplette Eingabe sofort ein - bei einem gestreamten
+Tarball läge damit der ganze Inhalt im Speicher. bounded_map liest die Eingabe
+nur so weit, wie Ergebnisse ausstehen.
+"""
+
+from collections import deque
+from itertools import islice
+
+
+def _call_chunk(fn, chunk):
+    """Ein Chunk in einem Worker (Modulebene, damit der Prozess-Pool ihn picklen kann)"""
+    return [fn(item) for item in chunk]
+
+
+def bounded_map(executor, fn, items, window, chunksize=1):
+    """
+    Wie executor.map(fn, items, chunksize=chunksize), aber höchstens window
+    Chunks sind gleichzeitig eingereicht - ein neuer Chunk wird erst gelesen,
+    wenn der älteste abgeholt ist. Ergebnisse in der Reihenfolge von items.
+    Wird der Generator vorzeitig geschlossen, werden offene Chunks abgebrochen.
+    """
+    items = iter(items)
+    pending = deque()
+    try:
+        for chunk in iter(lambda: list(islice(items, chunksize)), []):
+            pending.append(executor.submit(_call_chunk, fn, chunk))
+            if len(pending) >= window:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
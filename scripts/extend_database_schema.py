@@ -6,8 +6,22 @@ Adds tables for: operations, parameters, credentials, io_schema, examples
 """
 
 import sqlite3
+import sys
 from datetime import datetime
 
+# FTS5 rowid = source row id * SEARCH_SOURCE_SLOTS + source code, so every
+# source table can map its rows into the shared search index
+SEARCH_SOURCE_SLOTS = 4
+
+# (table, source code, node_type column, display_name column, category expr, source label,
+#  row filter) - {row} in the expressions is replaced by 'new.' inside triggers
+SEARCH_SOURCES = [
+    ('node_types_api', 1, 'node_type', 'display_name', '{row}category', 'API', '1'),
+    ('node_types_github', 2, 'node_type', 'display_name', "'GitHub'", 'GitHub', '1'),
+    # Packages no longer listed on npm (search_community_nodes.py) stay out of the search
+    ('community_nodes', 3, 'package_name', 'package_name', "'Community'", 'npm', '{row}removed_at IS NULL'),
+]
+
 def extend_database_schema(db_path='../n8n_docs.db'):
     """
     Add new tables to existing database for AI workflow generation
@@ -188,6 +202,139 @@ def extend_database_schema(db_path='../n8n_docs.db'):
     print("  3. Export AI context with scripts/export_for_ai.py")
     print("=" * 60)
 
+def create_search_index(db_path='../n8n_docs.db'):
+    """
+    Create FTS5 search index over node_types_api, node_types_github and community_nodes
+    Kept in sync by triggers on the source tables
+    """
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    print("\nCreating FTS5 search index: node_search_fts")
+
+    # Trigram tokenizer gives case-insensitive substring matching like the app search
+    cursor.execute('''
+        CREATE VIRTUAL TABLE IF NOT EXISTS node_search_fts USING fts5(
+            node_type,
+            display_name,
+            description,
+            category UNINDEXED,
+            version UNINDEXED,
+            source UNINDEXED,
+            tokenize = 'trigram'
+        )
+    ''')
+
+    # FTS rowid per source row - INSERT OR REPLACE deletes the old row without
+    # firing delete triggers, so the insert trigger looks up its index row here
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS node_search_keys (
+            source_code INTEGER NOT NULL,
+            node_type TEXT NOT NULL,
+            fts_rowid INTEGER NOT NULL,
+            PRIMARY KEY (source_code, node_type)
+        )
+    ''')
+
+    # Older databases: community_nodes before search_community_nodes.py added removed_at
+    cursor.execute('PRAGMA table_info(community_nodes)')
+    columns = [column[1] for column in cursor.fetchall()]
+    if columns and 'removed_at' not in columns:
+        cursor.execute('ALTER TABLE community_nodes ADD COLUMN removed_at TIMESTAMP')
+
+    for table, code, type_col, name_col, category_expr, source, row_filter in SEARCH_SOURCES:
+        new_values = f'''
+            new.id * {SEARCH_SOURCE_SLOTS} + {code},
+            new.{type_col}, new.{name_col}, new.description,
+            {category_expr.format(row='new.')}, new.version, '{source}'
+        '''
+        insert_new = f'''
+            INSERT OR REPLACE INTO node_search_keys (source_code, node_type, fts_rowid)
+            SELECT {code}, new.{type_col}, new.id * {SEARCH_SOURCE_SLOTS} + {code}
+            WHERE {row_filter.format(row='new.')};
+            INSERT INTO node_search_fts
+                (rowid, node_type, display_name, description, category, version, source)
+            SELECT {new_values}
+            WHERE {row_filter.format(row='new.')};
+        '''
+        delete_old = f'''
+            DELETE FROM node_search_fts WHERE rowid = old.id * {SEARCH_SOURCE_SLOTS} + {code};
+            DELETE FROM node_search_keys
+            WHERE source_code = {code} AND fts_rowid = old.id * {SEARCH_SOURCE_SLOTS} + {code};
+        '''
+
+        # Triggers of older versions of this script (BEFORE INSERT keyed on node_type)
+        for trigger in ('fts_before_insert', 'fts_insert', 'fts_delete', 'fts_update'):
+            cursor.execute(f'DROP TRIGGER IF EXISTS {table}_{trigger}')
+
+        # AFTER triggers only run for rows that were actually written
+        cursor.execute(f'''
+            CREATE TRIGGER {table}_fts_insert
+            AFTER INSERT ON {table}
+            BEGIN
+                DELETE FROM node_search_fts WHERE rowid = (
+                    SELECT fts_rowid FROM node_search_keys
+                    WHERE source_code = {code} AND node_type = new.{type_col}
+                );
+                {insert_new}
+            END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER {table}_fts_delete
+            AFTER DELETE ON {table}
+            BEGIN
+                {delete_old}
+            END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER {table}_fts_update
+            AFTER UPDATE ON {table}
+            BEGIN
+                {delete_old}
+                {insert_new}
+            END
+        ''')
+        print(f"  [OK] Triggers on {table}")
+
+    conn.commit()
+    conn.close()
+
+    # Fill index with rows that existed before the triggers
+    rebuild_search_index(db_path)
+
+def rebuild_search_index(db_path='../n8n_docs.db'):
+    """
+    Rebuild FTS5 search index from the source tables
+    """
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    print("\nRebuilding FTS5 search index...")
+    cursor.execute('DELETE FROM node_search_fts')
+    cursor.execute('DELETE FROM node_search_keys')
+
+    for table, code, type_col, name_col, category_expr, source, row_filter in SEARCH_SOURCES:
+        cursor.execute(f'''
+            INSERT INTO node_search_fts
+                (rowid, node_type, display_name, description, category, version, source)
+            SELECT
+                id * {SEARCH_SOURCE_SLOTS} + {code},
+                {type_col}, {name_col}, description, {category_expr.format(row='')}, version, '{source}'
+            FROM {table}
+            WHERE {row_filter.format(row='')}
+        ''')
+        print(f"  [OK] {table}: {cursor.rowcount} rows indexed")
+        cursor.execute(f'''
+            INSERT OR REPLACE INTO node_search_keys (source_code, node_type, fts_rowid)
+            SELECT {code}, {type_col}, id * {SEARCH_SOURCE_SLOTS} + {code}
+            FROM {table}
+            WHERE {row_filter.format(row='')}
+        ''')
+
+    cursor.execute("INSERT INTO node_search_fts(node_search_fts) VALUES('optimize')")
+    conn.commit()
+    conn.close()
+
 def add_sample_data(db_path='../n8n_docs.db'):
     """
     Add sample data to demonstrate the schema
@@ -416,9 +563,17 @@ def show_sample_query(db_path='../n8n_docs.db'):
     conn.close()
 
 if __name__ == '__main__':
+    # Only rebuild search index: python extend_database_schema.py --rebuild-search-index
+    if '--rebuild-search-index' in sys.argv[1:]:
+        rebuild_search_index('../n8n_docs.db')
+        sys.exit(0)
+
     # Extend schema
     extend_database_schema('../n8n_docs.db')
 
+    # Full-text search index for the Node Explorer
+    create_search_index('../n8n_docs.db')
+
     # Add sample data
     add_sample_data('../n8n_docs.db')
 
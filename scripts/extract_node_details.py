@@ -6,21 +6,45 @@ This is needed to build AI-powered workflow generators
 """
 
 import os
+import io
+import sys
+import gzip
 import json
 import sqlite3
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 from datetime import datetime
 
+from ts_node_parser import parse_node_file
+
+def decode_json(text):
+    """JSON column value - older rows store plain text (e.g. 'GET'), kept as is"""
+    if not text:
+        return None
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
 class NodeDetailsExtractor:
-    def __init__(self, n8n_repo_path=None):
+    def __init__(self, n8n_repo_path=None, max_workers=None, batch_size=50):
         """
         Initialize extractor
 
         Args:
             n8n_repo_path: Path to cloned n8n repository
                           If None, will use GitHub API (limited)
+            max_workers: Processes for parsing node files (None = CPU count)
+            batch_size: Nodes per insert batch / commit
         """
         self.n8n_repo_path = n8n_repo_path
+        self.max_workers = max_workers
+        self.batch_size = batch_size
         self.conn = sqlite3.connect('../n8n_docs.db')
         self.create_tables()
 
@@ -116,38 +140,68 @@ class NodeDetailsExtractor:
 
         print(f"🔍 Scanning nodes in {nodes_path}")
 
-        # Find all .node.ts files
-        node_files = list(nodes_path.glob("**/*.node.ts"))
+        # Find all .node.ts files (sorted, so files sharing description
+        # modules land in the same worker chunk and hit its parse cache)
+        node_files = sorted(str(path) for path in nodes_path.glob("**/*.node.ts"))
         print(f"📄 Found {len(node_files)} node files")
 
-        for node_file in node_files:
-            self.extract_node_file(node_file)
+        start = time.perf_counter()
 
-    def extract_node_file(self, file_path):
-        """Extract details from a single node file"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+        # Versioned nodes have one file per version - keep the newest
+        nodes = {}
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            for details in executor.map(parse_node_file, node_files, chunksize=8):
+                if not details:
+                    continue
+                current = nodes.get(details['node_type'])
+                if current is None or details['version'] > current['version']:
+                    nodes[details['node_type']] = details
 
-            # Extract node class name
-            # Look for: export class NodeName implements INodeType
-            import re
+        details_list = list(nodes.values())
+        for i in range(0, len(details_list), self.batch_size):
+            self.save_node_details(details_list[i:i + self.batch_size])
 
-            # Find node properties
-            properties_match = re.search(r'properties:\s*INodeProperties\[\]\s*=\s*\[(.*?)\];', content, re.DOTALL)
-            if properties_match:
-                properties_str = properties_match.group(1)
-                # This would need proper TypeScript parsing
-                # For now, we'll use a simpler approach
-                print(f"✓ Found properties in {file_path.name}")
+        parameters = sum(len(details['parameters']) for details in details_list)
+        print(f"✓ Extracted {len(details_list)} nodes ({parameters} parameters) "
+              f"in {time.perf_counter() - start:.1f}s")
+        return len(details_list)
 
-            # Find credentials
-            credentials_match = re.search(r'credentials:\s*ICredentialDataDecryptedObject\[\]\s*=\s*\[(.*?)\];', content, re.DOTALL)
-            if credentials_match:
-                print(f"✓ Found credentials in {file_path.name}")
+    def extract_node_file(self, file_path):
+        """Extract and save details from a single node file"""
+        details = parse_node_file(file_path)
+        if details:
+            self.save_node_details([details])
+        return details
 
-        except Exception as e:
-            print(f"❌ Error processing {file_path}: {e}")
+    def save_node_details(self, batch):
+        """
+        Replace operations, parameters and credentials of the nodes in batch
+        (one transaction per batch)
+        """
+        node_types = [(details['node_type'],) for details in batch]
+
+        with self.conn:
+            for table in ('node_operations', 'node_parameters', 'node_credentials'):
+                self.conn.executemany(f'DELETE FROM {table} WHERE node_type = ?', node_types)
+
+            self.conn.executemany('''
+                INSERT OR REPLACE INTO node_operations
+                (node_type, resource, operation, description)
+                VALUES (?, ?, ?, ?)
+            ''', [(details['node_type'],) + row for details in batch for row in details['operations']])
+
+            self.conn.executemany('''
+                INSERT OR REPLACE INTO node_parameters
+                (node_type, resource, operation, parameter_name, parameter_type, required,
+                 default_value, description, options)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', [(details['node_type'],) + row for details in batch for row in details['parameters']])
+
+            self.conn.executemany('''
+                INSERT OR REPLACE INTO node_credentials
+                (node_type, credential_type, required)
+                VALUES (?, ?, ?)
+            ''', [(details['node_type'],) + row for details in batch for row in details['credentials']])
 
     def extract_from_api_docs(self):
         """
@@ -214,97 +268,228 @@ class NodeDetailsExtractor:
         self.conn.commit()
         print("[OK] Generated example data for common nodes")
 
-    def export_for_ai(self, output_file='node_details_for_ai.json'):
+    def node_type_query(self):
         """
-        Export all node details in AI-friendly format
+        Node types to export, sorted: node_types_api if present,
+        otherwise every node with extracted details
         """
-        cursor = self.conn.cursor()
-
-        # Get all nodes
-        cursor.execute('SELECT DISTINCT node_type FROM node_types_api')
-        nodes = cursor.fetchall()
-
-        ai_data = []
-
-        for (node_type,) in nodes[:10]:  # Limit to 10 for testing
+        has_api_table = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'node_types_api'"
+        ).fetchone()
+        if has_api_table:
+            return 'SELECT DISTINCT node_type FROM node_types_api WHERE node_type IS NOT NULL ORDER BY node_type'
+        return '''
+            SELECT node_type FROM node_operations
+            UNION SELECT node_type FROM node_parameters
+            UNION SELECT node_type FROM node_credentials
+            ORDER BY node_type
+        '''
+
+    def iter_node_details(self):
+        """
+        Yield one AI export record per node
+        Operations, parameters and credentials are read with one query per
+        table, each sorted by node_type, and merged node by node - only the
+        rows of the current node are held in memory (plus the small
+        example_workflows table, see load_examples)
+        """
+        streams = {
+            'operations': groupby(self.conn.execute('''
+                SELECT node_type, resource, operation, description
+                FROM node_operations
+                ORDER BY node_type, resource, operation
+            '''), key=itemgetter(0)),
+            'parameters': groupby(self.conn.execute('''
+                SELECT node_type, resource, operation, parameter_name, parameter_type,
+                       required, default_value, description, options
+                FROM node_parameters
+                ORDER BY node_type, resource, operation, parameter_name
+            '''), key=itemgetter(0)),
+            'credentials': groupby(self.conn.execute('''
+                SELECT node_type, credential_type, required
+                FROM node_credentials
+                ORDER BY node_type, credential_type
+            '''), key=itemgetter(0)),
+        }
+        examples = self.load_examples()
+        # Current (node_type, rows) of each stream
+        heads = {name: next(stream, (None, None)) for name, stream in streams.items()}
+
+        def rows_for(name, node_type):
+            """Rows of node_type in stream name (skips nodes missing from the export list)"""
+            key, rows = heads[name]
+            while key is not None and key < node_type:
+                key, rows = heads[name] = next(streams[name], (None, None))
+            if key != node_type:
+                return []
+            # Read the group before advancing - groupby invalidates it
+            rows = list(rows)
+            heads[name] = next(streams[name], (None, None))
+            return rows
+
+        for (node_type,) in self.conn.execute(self.node_type_query()):
             node_data = {
                 'node_type': node_type,
                 'operations': [],
+                'parameters': [],
                 'credentials': [],
                 'examples': []
             }
 
-            # Get operations
-            cursor.execute('''
-                SELECT resource, operation, description
-                FROM node_operations
-                WHERE node_type = ?
-            ''', (node_type,))
-
-            for resource, operation, description in cursor.fetchall():
+            operations = {}
+            for _, resource, operation, description in rows_for('operations', node_type):
                 op_data = {
                     'resource': resource,
                     'operation': operation,
                     'description': description,
                     'parameters': []
                 }
-
-                # Get parameters for this operation
-                cursor.execute('''
-                    SELECT parameter_name, parameter_type, required, description, options
-                    FROM node_parameters
-                    WHERE node_type = ? AND resource = ? AND operation = ?
-                ''', (node_type, resource, operation))
-
-                for param_name, param_type, required, desc, options in cursor.fetchall():
-                    op_data['parameters'].append({
-                        'name': param_name,
-                        'type': param_type,
-                        'required': bool(required),
-                        'description': desc,
-                        'options': json.loads(options) if options else None
-                    })
-
+                operations[(resource, operation)] = op_data
                 node_data['operations'].append(op_data)
 
-            # Get credentials
-            cursor.execute('''
-                SELECT credential_type, required
-                FROM node_credentials
-                WHERE node_type = ?
-            ''', (node_type,))
-
-            for cred_type, required in cursor.fetchall():
+            for (_, resource, operation, param_name, param_type, required,
+                 default_value, desc, options) in rows_for('parameters', node_type):
+                param_data = {
+                    'name': param_name,
+                    'type': param_type,
+                    'required': bool(required),
+                    'default': decode_json(default_value),
+                    'description': desc,
+                    'options': decode_json(options)
+                }
+                # Parameters without a matching operation belong to the node itself
+                op_data = operations.get((resource, operation))
+                if op_data is not None:
+                    op_data['parameters'].append(param_data)
+                else:
+                    node_data['parameters'].append(param_data)
+
+            for _, cred_type, required in rows_for('credentials', node_type):
                 node_data['credentials'].append({
                     'type': cred_type,
                     'required': bool(required)
                 })
 
-            ai_data.append(node_data)
+            node_data['examples'] = examples.get(node_type, [])
+
+            yield node_data
 
-        # Export to JSON
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(ai_data, f, indent=2, ensure_ascii=False)
+    def load_examples(self):
+        """
+        Example workflows per node_type
+        The schema from extend_database_schema.py lists the nodes of a workflow
+        in node_types_used (comma separated), create_tables() uses node_type
+        """
+        columns = {row[1] for row in self.conn.execute('PRAGMA table_info(example_workflows)')}
+        if 'node_types_used' in columns:
+            node_column = 'node_types_used'
+        elif 'node_type' in columns:
+            node_column = 'node_type'
+        else:
+            return {}
+
+        examples = {}
+        for node_types, workflow_json, description, use_case in self.conn.execute(f'''
+            SELECT {node_column}, workflow_json, description, use_case
+            FROM example_workflows
+            ORDER BY id
+        '''):
+            example = {
+                'workflow': decode_json(workflow_json),
+                'description': description,
+                'use_case': use_case
+            }
+            for node_type in (node_types or '').split(','):
+                if node_type.strip():
+                    examples.setdefault(node_type.strip(), []).append(example)
+        return examples
+
+    def open_export_file(self, path, compression=None):
+        """Text file for writing, optionally gzip or zstd compressed"""
+        if compression == 'gzip':
+            return gzip.open(path, 'wt', encoding='utf-8')
+        if compression == 'zstd':
+            import zstandard
+            compressor = zstandard.ZstdCompressor()
+            return io.TextIOWrapper(compressor.stream_writer(open(path, 'wb')), encoding='utf-8')
+        return open(path, 'w', encoding='utf-8')
+
+    def export_for_ai(self, output_file='node_details_for_ai.jsonl', shards=1, compression=None):
+        """
+        Export all node details in AI-friendly format
+        JSON Lines, one node per line, streamed from the database
 
-        print(f"[OK] Exported {len(ai_data)} nodes to {output_file}")
+        Args:
+            output_file: Target file (.gz / .zst is appended when compressed)
+            shards: Split into this many files (output-00001-of-00004.jsonl, ...),
+                    a node always lands in the same shard (CRC32 of its node_type)
+            compression: None, 'gzip' or 'zstd' (needs: pip install zstandard)
+        """
+        if compression not in (None, 'gzip', 'zstd'):
+            print(f"❌ Unknown compression: {compression}")
+            return []
+
+        base, ext = os.path.splitext(output_file)
+        suffix = {None: '', 'gzip': '.gz', 'zstd': '.zst'}[compression]
+        if shards > 1:
+            paths = [f"{base}-{i + 1:05d}-of-{shards:05d}{ext}{suffix}" for i in range(shards)]
+        else:
+            paths = [output_file + suffix]
+
+        directory = os.path.dirname(output_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        try:
+            files = [self.open_export_file(path, compression) for path in paths]
+        except ImportError:
+            print("❌ zstandard package not installed. Run: pip install zstandard")
+            return []
+
+        exported = 0
+        try:
+            for node_data in self.iter_node_details():
+                line = json.dumps(node_data, ensure_ascii=False, separators=(',', ':'))
+                shard = zlib.crc32(node_data['node_type'].encode('utf-8')) % shards if shards > 1 else 0
+                files[shard].write(line + '\n')
+                exported += 1
+        finally:
+            for f in files:
+                f.close()
+
+        print(f"[OK] Exported {exported} nodes to {', '.join(paths)}")
         print(f"[INFO] This file can be used as context for AI workflow generation")
+        return paths
 
 def main():
     print("Node Details Extractor")
     print("=" * 60)
 
-    extractor = NodeDetailsExtractor()
+    args = sys.argv[1:]
+
+    # --repo-path PATH: parse the node sources of a local n8n clone
+    repo_path = args[args.index('--repo-path') + 1] if '--repo-path' in args else None
+    extractor = NodeDetailsExtractor(repo_path)
 
-    # Generate example data for demonstration
-    print("\nGenerating example data...")
-    extractor.generate_example_data()
+    if repo_path:
+        print("\nExtracting node details from local repository...")
+        extractor.extract_from_local_repo()
+    else:
+        # Generate example data for demonstration
+        print("\nGenerating example data...")
+        extractor.generate_example_data()
 
     # Export for AI
+    # --shards N: split into N files, --compress gzip|zstd
+    shards = int(args[args.index('--shards') + 1]) if '--shards' in args else 1
+    compression = args[args.index('--compress') + 1] if '--compress' in args else None
     print("\nExporting for AI...")
-    extractor.export_for_ai('../output/node_details_for_ai.json')
+    extractor.export_for_ai('../output/node_details_for_ai.jsonl', shards=shards, compression=compression)
 
     print("\n" + "=" * 60)
     print("Done!")
+    if repo_path:
+        return
     print("\nTo get full node details:")
     print("   1. Clone n8n repo: git clone https://github.com/n8n-io/n8n.git")
     print("   2. Run with --repo-path flag")
@@ -14,15 +14,74 @@ if sys.platform == 'win32':
 
 import requests
 import json
+import os
+import posixpath
 import sqlite3
-import time
+import tarfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 
+from bounded_map import bounded_map
+from http_cache import HttpCache
+from http_client import HttpClient
+
+
+def parse_node_json(json_content, folder_path):
+    """Node-Informationen aus dem Inhalt einer .node.json (None bei ungültigem JSON)"""
+    try:
+        data = json.loads(json_content)
+    except json.JSONDecodeError as e:
+        print(f"  ⚠️  JSON Parse Error: {e}")
+        return None
+
+    return {
+        'node_type': data.get('node'),
+        'display_name': data.get('displayName'),
+        'description': data.get('description'),
+        'version': str(data.get('version', 1)),
+        'folder_path': folder_path
+    }
+
+
+def parse_node_json_item(item):
+    """parse_node_json für (Pfad, Inhalt) - Einstieg für den Prozess-Pool"""
+    path, content = item
+    return parse_node_json(content.decode('utf-8'), posixpath.dirname(path))
+
+
+def iter_tarball_node_json(tarball_path, nodes_path):
+    """
+    Streamt (Pfad, Inhalt) aller .node.json unter nodes_path aus einem Repo-Tarball
+    Ohne Entpacken auf die Platte; der oberste Ordner (z.B. n8n-master/) wird entfernt
+    """
+    with tarfile.open(tarball_path, 'r|*') as tar:
+        for member in tar:
+            if not member.isfile() or not member.name.endswith('.node.json'):
+                continue
+            path = member.name.split('/', 1)[-1]
+            if path.startswith(nodes_path + '/'):
+                yield path, tar.extractfile(member).read()
+
+
 class GitHubNodeScraper:
-    def __init__(self, db_name='n8n_docs.db'):
+    def __init__(self, db_name='n8n_docs.db', http_cache=None, max_workers=16, batch_size=100):
+        """
+        max_workers: Parallele Raw-Downloads im Tree-Modus
+        batch_size: Node-Types pro Datenbank-Transaktion im Tree-Modus
+        """
         self.db_name = db_name
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        # API-Limit gilt nur für api.github.com, Raw-Downloads sind nicht limitiert
+        self.http_client = HttpClient(pool_size=max_workers, host_rates={'api.github.com': 2},
+                                      max_per_host=max_workers)
+        self.http_cache = http_cache or HttpCache(session=self.http_client)
+        # Ein übergebener Cache nutzt denselben Client (Pool, Rate-Limit pro Host)
+        self.http_cache.use_session(self.http_client)
         self.github_api = 'https://api.github.com'
+        self.raw_base = 'https://raw.githubusercontent.com'
         self.repo = 'n8n-io/n8n'
+        self.branch = 'master'
         self.nodes_path = 'packages/nodes-base/nodes'
         self.conn = None
         self.setup_database()
@@ -54,7 +113,7 @@ class GitHubNodeScraper:
         headers = {'Accept': 'application/vnd.github.v3+json'}
 
         try:
-            response = requests.get(url, headers=headers, timeout=30)
+            response = self.http_cache.get(url, headers=headers)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -63,10 +122,10 @@ class GitHubNodeScraper:
 
     def get_file_content(self, path):
         """Holt Dateiinhalt von GitHub (Raw)"""
-        url = f"https://raw.githubusercontent.com/{self.repo}/master/{path}"
+        url = f"{self.raw_base}/{self.repo}/{self.branch}/{path}"
 
         try:
-            response = requests.get(url, timeout=30)
+            response = self.http_cache.get(url)
             response.raise_for_status()
             return response.text
         except requests.exceptions.RequestException as e:
@@ -75,19 +134,7 @@ class GitHubNodeScraper:
 
     def extract_node_info(self, json_content, folder_path):
         """Extrahiert Node-Informationen aus der .node.json Datei"""
-        try:
-            data = json.loads(json_content)
-
-            return {
-                'node_type': data.get('node'),
-                'display_name': data.get('displayName'),
-                'description': data.get('description'),
-                'version': str(data.get('version', 1)),
-                'folder_path': folder_path
-            }
-        except json.JSONDecodeError as e:
-            print(f"  ⚠️  JSON Parse Error: {e}")
-            return None
+        return parse_node_json(json_content, folder_path)
 
     def save_node_type(self, node_info):
         """Speichert Node-Type in der Datenbank"""
@@ -118,6 +165,112 @@ class GitHubNodeScraper:
             print(f"  ❌ Datenbankfehler: {e}")
             return False
 
+    def save_node_types(self, node_infos):
+        """Speichert mehrere Node-Types in einer Transaktion"""
+        rows = [
+            (
+                node_info['node_type'],
+                node_info['display_name'],
+                node_info['description'],
+                node_info['version'],
+                node_info['folder_path'],
+                datetime.now()
+            )
+            for node_info in node_infos
+            if node_info and node_info.get('node_type')
+        ]
+
+        try:
+            self.conn.executemany('''
+                INSERT OR REPLACE INTO node_types_github
+                (node_type, display_name, description, version, folder_path, scraped_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', rows)
+            self.conn.commit()
+            return len(rows)
+
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            print(f"  ❌ Datenbankfehler: {e}")
+            return 0
+
+    def get_node_json_paths(self):
+        """
+        Alle .node.json Pfade unter nodes_path über die Git Tree API
+        Zwei API-Calls: SHA des nodes-Ordners, dann dessen Tree rekursiv
+        Returns: Liste von Pfaden oder None (Fehler / Tree abgeschnitten)
+        """
+        parent_path, folder_name = posixpath.split(self.nodes_path)
+        parent = self.get_directory_contents(f"{parent_path}?ref={self.branch}")
+        tree_sha = next(
+            (item['sha'] for item in parent if item['type'] == 'dir' and item['name'] == folder_name),
+            None
+        )
+        if not tree_sha:
+            print(f"❌ Ordner {self.nodes_path} nicht gefunden")
+            return None
+
+        url = f"{self.github_api}/repos/{self.repo}/git/trees/{tree_sha}"
+        headers = {'Accept': 'application/vnd.github.v3+json'}
+
+        try:
+            response = self.http_cache.get(url, params={'recursive': 1}, headers=headers)
+            response.raise_for_status()
+            tree = response.json()
+        except requests.exceptions.RequestException as e:
+            print(f"❌ Fehler beim Abrufen des Git Trees: {e}")
+            return None
+
+        if tree.get('truncated'):
+            print("⚠️  Git Tree ist abgeschnitten (zu viele Einträge)")
+            return None
+
+        return sorted(
+            posixpath.join(self.nodes_path, item['path'])
+            for item in tree.get('tree', [])
+            if item['type'] == 'blob' and item['path'].endswith('.node.json')
+        )
+
+    def fetch_node_info(self, path):
+        """Lädt eine .node.json (Raw) und extrahiert die Node-Informationen"""
+        json_content = self.get_file_content(path)
+        if not json_content:
+            return None
+        return self.extract_node_info(json_content, posixpath.dirname(path))
+
+    def crawl_all_nodes_tree(self):
+        """
+        Crawlt alle .node.json Dateien über die Git Tree API (auch verschachtelte Ordner)
+        Raw-Downloads laufen parallel, gespeichert wird in Batches
+        Returns: False wenn der Tree nicht geholt werden konnte
+        """
+        print(f"\n🚀 Starte GitHub Node-Type Crawling (Git Tree)...\n")
+
+        paths = self.get_node_json_paths()
+        if paths is None:
+            return False
+
+        total = len(paths)
+        print(f"📊 Gefunden: {total} .node.json Dateien\n")
+
+        saved = 0
+        batch = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for idx, (path, node_info) in enumerate(zip(paths, executor.map(self.fetch_node_info, paths)), 1):
+                print(f"[{idx}/{total}] {path}")
+                if node_info:
+                    batch.append(node_info)
+                if len(batch) >= self.batch_size:
+                    saved += self.save_node_types(batch)
+                    batch = []
+
+        if batch:
+            saved += self.save_node_types(batch)
+
+        print(f"\n✅ Crawling abgeschlossen! {saved} Node-Types gespeichert")
+        self.print_stats()
+        return True
+
     def crawl_node_folder(self, folder_path):
         """Crawlt einen Node-Ordner nach .node.json Dateien"""
         contents = self.get_directory_contents(folder_path)
@@ -133,8 +286,6 @@ class GitHubNodeScraper:
                     if node_info:
                         self.save_node_type(node_info)
 
-                time.sleep(0.5)  # Rate limiting
-
     def crawl_all_nodes(self):
         """Crawlt alle Node-Ordner"""
         print(f"\n🚀 Starte GitHub Node-Type Crawling...\n")
@@ -150,11 +301,38 @@ class GitHubNodeScraper:
         for idx, folder in enumerate(node_folders, 1):
             print(f"[{idx}/{total}] {folder['name']}")
             self.crawl_node_folder(folder['path'])
-            time.sleep(1)  # Rate limiting zwischen Ordnern
 
         print(f"\n✅ Crawling abgeschlossen!")
         self.print_stats()
 
+    def ingest_tarball(self, tarball_path, workers=None):
+        """
+        Offline-Import aus einem n8n Repo-Tarball (z.B. n8n-master.tar.gz)
+        Die .node.json Dateien werden gestreamt und in einem Prozess-Pool geparst
+        workers: Anzahl Prozesse (None = CPU-Anzahl)
+        """
+        print(f"\n📦 Importiere Node-Types aus {tarball_path}...\n")
+
+        saved = 0
+        batch = []
+        # Der Tarball wird nur so weit gelesen, wie Chunks ausstehen (höchstens 4 pro Prozess)
+        window = 4 * (workers or os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            items = iter_tarball_node_json(tarball_path, self.nodes_path)
+            for node_info in bounded_map(executor, parse_node_json_item, items, window, chunksize=64):
+                if node_info:
+                    batch.append(node_info)
+                if len(batch) >= self.batch_size:
+                    saved += self.save_node_types(batch)
+                    batch = []
+
+        if batch:
+            saved += self.save_node_types(batch)
+
+        print(f"✅ {saved} Node-Types aus dem Tarball gespeichert")
+        self.print_stats()
+        return saved
+
     def print_stats(self):
         """Zeigt Statistiken"""
         cursor = self.conn.cursor()
@@ -167,6 +345,8 @@ class GitHubNodeScraper:
 
     def close(self):
         """Schließt die Datenbankverbindung"""
+        self.http_cache.close()
+        self.http_client.close()
         if self.conn:
             self.conn.close()
             print(f"\n💾 Datenbank geschlossen")
@@ -176,8 +356,15 @@ def main():
     """Hauptfunktion"""
     scraper = GitHubNodeScraper()
 
+    args = sys.argv[1:]
+
     try:
-        scraper.crawl_all_nodes()
+        # --tarball PFAD: Offline-Import aus einem Repo-Tarball
+        # Standard: Git Tree API, --walk für den alten Ordner-für-Ordner Durchlauf
+        if '--tarball' in args:
+            scraper.ingest_tarball(args[args.index('--tarball') + 1])
+        elif '--walk' in args or not scraper.crawl_all_nodes_tree():
+            scraper.crawl_all_nodes()
     except KeyboardInterrupt:
         print("\n\n⚠️  Crawling durch Benutzer abgebrochen")
     except Exception as e:
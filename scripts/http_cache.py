@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gemeinsamer HTTP-Cache für alle Scraper
+Speichert ETag, Last-Modified und SHA-256 des Bodys pro URL in SQLite und
+fragt bei erneutem Abruf mit If-None-Match / If-Modified-Since an.
+Ein 304 liefert den gespeicherten Body ohne erneuten Download.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+
+from http_client import HttpClient
+
+HTTP_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'http_cache.db')
+
+# Sekunden, in denen ein gespeicherter Eintrag ohne Anfrage verwendet wird (pro Host)
+# 0 = immer mit dem Server abgleichen (Conditional Request)
+DEFAULT_TTLS = {
+    'registry.npmjs.org': 6 * 3600,
+    'api.github.com': 3600,
+    'raw.githubusercontent.com': 3600,
+    'r.jina.ai': 24 * 3600,
+}
+
+
+class CachedResponse:
+    """
+    Minimale Response: status_code, text, headers, json(), raise_for_status()
+    from_cache: ohne Netzwerkzugriff aus dem Cache (TTL noch gültig)
+    not_modified: Server hat mit 304 geantwortet
+    changed: Body unterscheidet sich vom zuletzt gespeicherten (per SHA-256)
+    """
+
+    def __init__(self, url, status_code, text, headers, from_cache=False, not_modified=False, changed=True):
+        self.url = url
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers
+        self.from_cache = from_cache
+        self.not_modified = not_modified
+        self.changed = changed
+
+    def json(self):
+        return json.loads(self.text)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} Error for url: {self.url}")
+
+
+class HttpCache:
+    def __init__(self, db_path=HTTP_CACHE_PATH, ttls=None, default_ttl=0, session=None):
+        """
+        ttls: TTL in Sekunden pro Host (ergänzt/überschreibt DEFAULT_TTLS)
+        session: HttpClient (oder Objekt mit get(...)) - Standard ist ein eigener HttpClient
+        """
+        self.db_path = db_path
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.default_ttl = default_ttl
+        self.owns_session = session is None
+        self.session = session or HttpClient()
+        self.lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self.conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS http_cache (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                body_hash TEXT,
+                body TEXT,
+                content_type TEXT,
+                fetched_at REAL
+            )
+        ''')
+        self.conn.commit()
+
+    def use_session(self, session):
+        """
+        Requests über session senden, z.B. den HttpClient eines Scrapers mit
+        dessen Rate-Limit - ein eigener HttpClient wird dabei geschlossen
+        """
+        if session is self.session:
+            return
+        if self.owns_session:
+            self.session.close()
+        self.session = session
+        self.owns_session = False
+
+    def ttl_for(self, url):
+        return self.ttls.get(urlparse(url).netloc, self.default_ttl)
+
+    def lookup(self, url):
+        with self.lock:
+            return self.conn.execute('''
+                SELECT etag, last_modified, body_hash, body, content_type, fetched_at
+                FROM http_cache WHERE url = ?
+            ''', (url,)).fetchone()
+
+    def is_fresh(self, url, params=None):
+        """True wenn get() ohne Netzwerkzugriff aus dem Cache antworten würde"""
+        entry = self.lookup(self.cache_key(url, params))
+        return entry is not None and time.time() - entry[5] < self.ttl_for(url)
+
+    def cache_key(self, url, params=None):
+        if not params:
+            return url
+        return requests.Request('GET', url, params=params).prepare().url
+
+    def store(self, url, etag, last_modified, body_hash, body, content_type):
+        with self.lock:
+            self.conn.execute('''
+                INSERT OR REPLACE INTO http_cache (url, etag, last_modified, body_hash, body, content_type, fetched_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', (url, etag, last_modified, body_hash, body, content_type, time.time()))
+            self.conn.commit()
+
+    def touch(self, url):
+        with self.lock:
+            self.conn.execute('UPDATE http_cache SET fetched_at = ? WHERE url = ?', (time.time(), url))
+            self.conn.commit()
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        """
+        GET mit Cache: frischer Eintrag -> sofort, sonst Conditional Request
+        timeout=None: Standard-Timeout des HttpClient
+        Netzwerkfehler werden wie bei requests.get() als RequestException weitergereicht
+        """
+        key = self.cache_key(url, params)
+        entry = self.lookup(key)
+
+        if entry is not None:
+            etag, last_modified, body_hash, body, content_type, fetched_at = entry
+            cached_headers = {'Content-Type': content_type} if content_type else {}
+
+            if time.time() - fetched_at < self.ttl_for(url):
+                return CachedResponse(key, 200, body, cached_headers, from_cache=True, changed=False)
+
+            headers = dict(headers or {})
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+
+        response = self.session.get(url, params=params, headers=headers, timeout=timeout)
+
+        if response.status_code == 304 and entry is not None:
+            self.touch(key)
+            return CachedResponse(key, 200, body, cached_headers, not_modified=True, changed=False)
+
+        if response.status_code != 200:
+            return CachedResponse(key, response.status_code, response.text, response.headers)
+
+        text = response.text
+        new_hash = hashlib.sha256(text.encode('utf-8')).hexdigest()
+        self.store(
+            key,
+            response.headers.get('ETag'),
+            response.headers.get('Last-Modified'),
+            new_hash,
+            text,
+            response.headers.get('Content-Type')
+        )
+        changed = entry is None or entry[2] != new_hash
+        return CachedResponse(key, 200, text, response.headers, changed=changed)
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+        if self.owns_session:
+            self.session.close()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gemeinsamer HTTP-Client für alle Scraper
+Eine requests.Session mit Connection-Pool (Keep-Alive), Retries mit
+exponentiellem Backoff + Jitter bei 429/5xx, Beachtung von Retry-After und
+GitHub X-RateLimit-Reset, Rate-Limit und Parallelitäts-Grenze pro Host.
+"""
+
+import random
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class RateLimitError(requests.exceptions.HTTPError):
+    """
+    Rate-Limit (429 oder GitHub 403 mit X-RateLimit-Remaining: 0), dessen Reset
+    weiter als max_backoff entfernt ist - wait: Sekunden bis zum Reset
+    """
+
+    def __init__(self, response, wait):
+        self.wait = wait
+        host = urlparse(response.url).netloc if response.url else 'Host'
+        super().__init__(
+            f"{response.status_code} Rate-Limit für {host} erschöpft - Reset in {wait:.0f}s",
+            response=response
+        )
+
+
+class TokenBucket:
+    """
+    Thread-sicherer Token Bucket: rate Tokens pro Sekunde, maximal capacity auf Vorrat
+    """
+
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Blockiert bis ein Token verfügbar ist"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                wait_time = (1 - self.tokens) / self.rate
+
+            time.sleep(wait_time)
+
+
+class HostRateLimiter:
+    """Ein Token Bucket pro Host (host_rates überschreibt rate, None = unbegrenzt)"""
+
+    def __init__(self, rate, capacity=1, host_rates=None):
+        self.rate = rate
+        self.capacity = capacity
+        self.host_rates = host_rates or {}
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def acquire(self, url):
+        host = urlparse(url).netloc
+        rate = self.host_rates.get(host, self.rate)
+        if not rate:
+            return
+
+        with self.lock:
+            bucket = self.buckets.get(host)
+            if bucket is None:
+                bucket = self.buckets[host] = TokenBucket(rate, self.capacity)
+        bucket.acquire()
+
+
+class HttpClient:
+    def __init__(self, pool_size=10, timeout=30, max_retries=3, backoff_factor=1.0,
+                 max_backoff=60, requests_per_second=None, host_rates=None, max_per_host=None,
+                 headers=None):
+        """
+        pool_size: Offene Verbindungen pro Host (Keep-Alive)
+        timeout: Standard-Timeout in Sekunden
+        max_retries: Wiederholungen bei Verbindungsfehlern, 429 und 5xx
+        backoff_factor: Wartezeit = backoff_factor * 2^Versuch (mit Jitter)
+        max_backoff: Längste Wartezeit - verlangt ein Rate-Limit (429, GitHub
+                     Rate-Limit-Reset) länger, wird RateLimitError ausgelöst;
+                     bei 5xx mit langem Retry-After kommt die Antwort zurück
+        requests_per_second: Rate pro Host (None = unbegrenzt)
+        host_rates: Abweichende Rate für einzelne Hosts, z.B. {'api.github.com': 1}
+        max_per_host: Gleichzeitige Requests pro Host (None = unbegrenzt)
+        """
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.max_per_host = max_per_host
+        self.rate_limiter = None
+        if requests_per_second or host_rates:
+            self.rate_limiter = HostRateLimiter(requests_per_second, host_rates=host_rates)
+        self.host_slots = {}
+        self.lock = threading.Lock()
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        if headers:
+            self.session.headers.update(headers)
+
+    @contextmanager
+    def host_slot(self, host):
+        """Begrenzt gleichzeitige Requests auf max_per_host"""
+        if not self.max_per_host:
+            yield
+            return
+
+        with self.lock:
+            slot = self.host_slots.get(host)
+            if slot is None:
+                slot = self.host_slots[host] = threading.BoundedSemaphore(self.max_per_host)
+        with slot:
+            yield
+
+    def backoff_delay(self, attempt):
+        """Exponentieller Backoff mit Jitter (halbe Wartezeit fix, halbe zufällig)"""
+        delay = min(self.max_backoff, self.backoff_factor * (2 ** attempt))
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def retry_delay(self, response, attempt):
+        """
+        Wartezeit vor dem nächsten Versuch oder None wenn kein Retry sinnvoll ist
+        Retry-After (Sekunden oder HTTP-Datum) und X-RateLimit-Reset haben Vorrang
+        RateLimitError wenn ein Rate-Limit länger als max_backoff gilt
+        """
+        rate_limited = (response.status_code == 403
+                        and response.headers.get('X-RateLimit-Remaining') == '0')
+        if response.status_code not in RETRY_STATUS_CODES and not rate_limited:
+            return None
+
+        delay = None
+        retry_after = response.headers.get('Retry-After')
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+                except (TypeError, ValueError):
+                    delay = None
+
+        reset = response.headers.get('X-RateLimit-Reset')
+        if delay is None and reset and (rate_limited or response.status_code == 429):
+            try:
+                delay = float(reset) - time.time()
+            except ValueError:
+                delay = None
+
+        if delay is None:
+            return self.backoff_delay(attempt)
+        if delay > self.max_backoff:
+            if rate_limited or response.status_code == 429:
+                raise RateLimitError(response, delay)
+            return None
+        return max(delay, 0)
+
+    def request(self, method, url, **kwargs):
+        """Wie requests.request(), aber mit Pool, Rate-Limit und Retries"""
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.timeout
+        host = urlparse(url).netloc
+
+        for attempt in range(self.max_retries + 1):
+            last_attempt = attempt == self.max_retries
+
+            with self.host_slot(host):
+                if self.rate_limiter:
+                    self.rate_limiter.acquire(url)
+                try:
+                    response = self.session.request(method, url, **kwargs)
+                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                    if last_attempt:
+                        raise
+                    delay = self.backoff_delay(attempt)
+                else:
+                    delay = self.retry_delay(response, attempt)
+                    if delay is None or last_attempt:
+                        return response
+                    response.close()
+
+            time.sleep(delay)
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def close(self):
+        self.session.close()
@@ -16,11 +16,14 @@ import json
 import sqlite3
 from datetime import datetime
 
+from http_client import HttpClient
+
 class N8nApiScraper:
     def __init__(self, api_url, api_key, db_name='n8n_docs.db'):
         self.api_url = api_url.rstrip('/')
         self.api_key = api_key
         self.db_name = db_name
+        self.http_client = HttpClient()
         self.conn = None
         self.setup_database()
 
@@ -66,7 +69,7 @@ class N8nApiScraper:
             print(f"  Versuche: {url}")
 
             try:
-                response = requests.get(url, headers=headers, timeout=30)
+                response = self.http_client.get(url, headers=headers)
                 if response.status_code == 200:
                     print(f"  ✓ Erfolg mit: {endpoint}")
                     return response.json()
@@ -88,7 +91,7 @@ class N8nApiScraper:
 
         try:
             print(f"📥 Fetching node types from: {url}")
-            response = requests.get(url, headers=headers, timeout=30)
+            response = self.http_client.get(url, headers=headers)
             response.raise_for_status()
 
             data = response.json()
@@ -175,7 +178,7 @@ class N8nApiScraper:
 
         try:
             print(f"📥 Fetching workflows from: {url}")
-            response = requests.get(url, headers=headers, timeout=30)
+            response = self.http_client.get(url, headers=headers)
             response.raise_for_status()
 
             workflows_data = response.json()
@@ -233,6 +236,7 @@ class N8nApiScraper:
 
     def close(self):
         """Schließt die Datenbankverbindung"""
+        self.http_client.close()
         if self.conn:
             self.conn.close()
             print(f"\n💾 Datenbank geschlossen")
@@ -5,18 +5,94 @@ Scrape n8n node documentation using Jina AI Reader
 Extract parameters, operations, credentials for AI workflow generation
 """
 
-import requests
+import sys
+import hashlib
 import sqlite3
 import json
 import re
-import time
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+from bounded_map import bounded_map
+from http_cache import HttpCache
+from http_client import HttpClient
+
+# Part of the doc_snapshots hash - bump it when the extractors or the save
+# logic change, so unchanged pages are parsed again on the next run
+PARSER_VERSION = 3
+
+# Example: ### Send an email
+OPERATION_PATTERN = re.compile(r'###\s+([A-Z][a-z]+.*?)(?:\n|$)')
+# Example: **To** - Email recipients
+PARAMETER_PATTERN = re.compile(r'\*\*([A-Za-z\s]+)\*\*\s*[-:]\s*(.*?)(?:\n|$)', re.MULTILINE)
+# "#" / "##" heading, e.g. "## Templates and examples" - ends an operation section
+SECTION_END_PATTERN = re.compile(r'^##?[ \t]', re.MULTILINE)
+
+
+def operation_headings(markdown_content):
+    """(position, operation name) of every operation heading on the page"""
+    return [
+        (match.start(), match.group(1).strip().replace('*', '').strip())
+        for match in OPERATION_PATTERN.finditer(markdown_content)
+    ]
+
+
+def snapshot_digest(markdown_content):
+    """Hash of a doc page as parsed by this PARSER_VERSION"""
+    return hashlib.sha256(f'{PARSER_VERSION}\n{markdown_content}'.encode('utf-8')).hexdigest()
+
+
 class JinaNodeDocsScraper:
-    def __init__(self, db_path='../data/n8n_docs.db'):
+    def __init__(self, db_path='../data/n8n_docs.db', http_cache=None, requests_per_minute=30,
+                 max_workers=1, jina_reader_base="https://r.jina.ai/", force=False):
+        """
+        requests_per_minute: Request budget for the Jina reader (shared by all workers)
+        max_workers: Concurrent fetches in scrape_all (1 = serial)
+        jina_reader_base: Overridable, e.g. for a local fixture server
+        force: Parse and save every page, even if doc_snapshots says it is unchanged
+        """
         self.conn = sqlite3.connect(db_path)
         self.cursor = self.conn.cursor()
-        self.jina_reader_base = "https://r.jina.ai/"
+        self.force = force
+        self.create_snapshot_table()
+        self.jina_reader_base = jina_reader_base
+        self.unchanged_count = 0
+        self.max_workers = max_workers
+        self.http_client = HttpClient(pool_size=max_workers, requests_per_second=requests_per_minute / 60,
+                                      max_per_host=max_workers)
+        self.http_cache = http_cache or HttpCache(session=self.http_client)
+        # An injected cache sends its requests through the same client (pool, per-host rate limit)
+        self.http_cache.use_session(self.http_client)
+
+    def create_snapshot_table(self):
+        """SHA-256 of the last parsed markdown per node and doc URL"""
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS doc_snapshots (
+                node_type TEXT NOT NULL,
+                url TEXT NOT NULL,
+                sha256 TEXT NOT NULL,
+                fetched_at TIMESTAMP,
+                PRIMARY KEY (node_type, url)
+            )
+        ''')
+        self.conn.commit()
+
+    def get_snapshot_hash(self, node_type, url):
+        """Stored markdown hash for the node's doc page (None if never parsed)"""
+        self.cursor.execute(
+            'SELECT sha256 FROM doc_snapshots WHERE node_type = ? AND url = ?',
+            (node_type, url)
+        )
+        row = self.cursor.fetchone()
+        return row[0] if row else None
+
+    def save_snapshot(self, node_type, url, digest):
+        """Record the parsed page - committed together with the next save or at the end of scrape_all"""
+        self.cursor.execute('''
+            INSERT OR REPLACE INTO doc_snapshots (node_type, url, sha256, fetched_at)
+            VALUES (?, ?, ?, ?)
+        ''', (node_type, url, digest, datetime.now()))
 
     def get_nodes_to_scrape(self, limit=None):
         """Get list of nodes that need documentation"""
@@ -60,7 +136,7 @@ class JinaNodeDocsScraper:
             jina_url = f"{self.jina_reader_base}{url}"
 
             print(f"  Fetching: {jina_url}")
-            response = requests.get(jina_url, timeout=30)
+            response = self.http_cache.get(jina_url)
 
             if response.status_code == 200:
                 return response.text
@@ -79,17 +155,7 @@ class JinaNodeDocsScraper:
         """
         operations = []
 
-        # Pattern for operation sections
-        # Example: ### Send an email
-        operation_pattern = r'###\s+([A-Z][a-z]+.*?)(?:\n|$)'
-
-        matches = re.findall(operation_pattern, markdown_content)
-
-        for match in matches:
-            operation_name = match.strip()
-            # Clean up operation name
-            operation_name = operation_name.replace('*', '').strip()
-
+        for _, operation_name in operation_headings(markdown_content):
             operations.append({
                 'operation': operation_name.lower().replace(' ', '_'),
                 'display_name': operation_name,
@@ -101,17 +167,17 @@ class JinaNodeDocsScraper:
     def extract_parameters_from_markdown(self, markdown_content):
         """
         Extract parameters from markdown documentation
-        Look for parameter descriptions
+        Each parameter gets the operation whose heading it follows, up to the
+        next "#" / "##" heading (None outside of an operation section)
         """
         parameters = []
 
-        # Pattern for parameter descriptions
-        # Example: **To** - Email recipients
-        param_pattern = r'\*\*([A-Za-z\s]+)\*\*\s*[-:]\s*(.*?)(?:\n|$)'
-
-        matches = re.findall(param_pattern, markdown_content, re.MULTILINE)
+        headings = operation_headings(markdown_content)
+        operation_starts = [position for position, _ in headings]
+        section_ends = [match.start() for match in SECTION_END_PATTERN.finditer(markdown_content)]
 
-        for param_name, description in matches:
+        for match in PARAMETER_PATTERN.finditer(markdown_content):
+            param_name, description = match.groups()
             param_name = param_name.strip()
             description = description.strip()
 
@@ -122,12 +188,21 @@ class JinaNodeDocsScraper:
             # Determine if required (heuristic)
             required = 'required' in description.lower() or 'must' in description.lower()
 
+            # Last operation heading before the parameter, unless a section ended since
+            operation = None
+            index = bisect_right(operation_starts, match.start()) - 1
+            if index >= 0:
+                end_index = bisect_right(section_ends, match.start()) - 1
+                if end_index < 0 or section_ends[end_index] < operation_starts[index]:
+                    operation = headings[index][1].lower().replace(' ', '_')
+
             parameters.append({
                 'parameter_name': param_name.lower().replace(' ', '_'),
                 'display_name': param_name,
                 'description': description,
                 'required': required,
-                'parameter_type': 'string'  # Default, would need better detection
+                'parameter_type': 'string',  # Default, would need better detection
+                'operation': operation
             })
 
         return parameters
@@ -162,7 +237,7 @@ class JinaNodeDocsScraper:
         return credentials
 
     def save_operations(self, node_type, operations):
-        """Save operations to database"""
+        """Save operations to database (committed by save_node_docs)"""
         for op in operations:
             try:
                 self.cursor.execute('''
@@ -179,10 +254,8 @@ class JinaNodeDocsScraper:
             except Exception as e:
                 print(f"    [ERROR] Saving operation: {e}")
 
-        self.conn.commit()
-
     def save_parameters(self, node_type, operation, parameters):
-        """Save parameters to database"""
+        """Save parameters to database (committed by save_node_docs)"""
         for param in parameters:
             try:
                 self.cursor.execute('''
@@ -203,10 +276,8 @@ class JinaNodeDocsScraper:
             except Exception as e:
                 print(f"    [ERROR] Saving parameter: {e}")
 
-        self.conn.commit()
-
     def save_credentials(self, node_type, credentials):
-        """Save credentials to database"""
+        """Save credentials to database (committed by save_node_docs)"""
         for cred in credentials:
             try:
                 self.cursor.execute('''
@@ -223,24 +294,18 @@ class JinaNodeDocsScraper:
             except Exception as e:
                 print(f"    [ERROR] Saving credential: {e}")
 
-        self.conn.commit()
-
-    def scrape_node(self, node_type, display_name, category):
-        """Scrape documentation for a single node"""
-        print(f"\n[{display_name}] ({node_type})")
-
-        # Get documentation URL
-        doc_url = self.get_doc_url(node_type, display_name)
-        print(f"  URL: {doc_url}")
-
-        # Scrape with Jina AI
-        markdown_content = self.scrape_with_jina(doc_url)
-
-        if not markdown_content:
-            print(f"  [SKIP] No content retrieved")
-            return False
+    def fetch_node_docs(self, node):
+        """Fetch stage: (node, doc_url, markdown_content) - runs in worker threads"""
+        node_type, display_name, category = node
+        try:
+            doc_url = self.get_doc_url(node_type, display_name)
+        except Exception as e:
+            print(f"  [ERROR] {e}")
+            return node, None, None
+        return node, doc_url, self.scrape_with_jina(doc_url)
 
-        # Extract data
+    def parse_node_docs(self, node_type, display_name, markdown_content):
+        """Parse stage: operations, parameters and credentials of the markdown"""
         operations = self.extract_operations_from_markdown(markdown_content, node_type)
         print(f"  Operations found: {len(operations)}")
 
@@ -250,76 +315,142 @@ class JinaNodeDocsScraper:
         credentials = self.extract_credentials_from_markdown(markdown_content, node_type, display_name)
         print(f"  Credentials found: {len(credentials)}")
 
-        # Save to database
-        if operations:
-            self.save_operations(node_type, operations)
+        return operations, parameters, credentials
 
-            # Save parameters for first operation (would need better operation detection)
-            if parameters and operations:
-                self.save_parameters(node_type, operations[0]['operation'], parameters)
+    def save_node_docs(self, node_type, operations, parameters, credentials):
+        """
+        Save stage: write the parsed documentation to the database
+        Operations and parameters replace all earlier rows of the node, in one transaction
+        """
+        with self.conn:
+            if operations:
+                # Earlier runs saved every parameter under the first operation
+                for table in ('node_operations', 'node_parameters'):
+                    self.cursor.execute(f'DELETE FROM {table} WHERE node_type = ?', (node_type,))
+
+                self.save_operations(node_type, operations)
+
+                # Parameters are saved for the operation section they appear under,
+                # parameters outside any operation section for the first operation
+                by_operation = {}
+                for param in parameters:
+                    operation = param['operation'] or operations[0]['operation']
+                    by_operation.setdefault(operation, []).append(param)
+
+                for operation, operation_parameters in by_operation.items():
+                    self.save_parameters(node_type, operation, operation_parameters)
+
+            if credentials:
+                self.save_credentials(node_type, credentials)
+
+    def process_node_docs(self, node, doc_url, markdown_content):
+        """Parse and save one fetched node (always in the main thread)"""
+        node_type, display_name, category = node
+        print(f"\n[{display_name}] ({node_type})")
+        print(f"  URL: {doc_url}")
 
-        if credentials:
-            self.save_credentials(node_type, credentials)
+        if not markdown_content:
+            print(f"  [SKIP] No content retrieved")
+            return False
+
+        # Unchanged page: nothing to parse or rewrite
+        digest = snapshot_digest(markdown_content)
+        if not self.force and self.get_snapshot_hash(node_type, doc_url) == digest:
+            self.save_snapshot(node_type, doc_url, digest)
+            self.unchanged_count += 1
+            print(f"  [UNCHANGED] Skipped")
+            return True
+
+        operations, parameters, credentials = self.parse_node_docs(node_type, display_name, markdown_content)
+        self.save_node_docs(node_type, operations, parameters, credentials)
+        self.save_snapshot(node_type, doc_url, digest)
 
         print(f"  [OK] Data saved")
         return True
 
-    def scrape_all(self, limit=10, delay=2):
+    def scrape_node(self, node_type, display_name, category):
+        """Scrape documentation for a single node"""
+        node = (node_type, display_name, category)
+        return self.process_node_docs(*self.fetch_node_docs(node))
+
+    def scrape_all(self, limit=10):
         """
         Scrape documentation for all nodes
 
         Args:
             limit: Maximum number of nodes to scrape (None for all)
-            delay: Delay between requests in seconds
+
+        With max_workers > 1 the fetches overlap in a thread pool while parsing
+        and saving stay in this thread, in node order - the resulting tables are
+        the same as in a serial run. The request rate is limited by
+        requests_per_minute in either mode. At most 2 * max_workers fetches are
+        queued, so an interrupted run stops after those instead of fetching every node.
         """
         nodes = self.get_nodes_to_scrape(limit)
 
         print("=" * 60)
-        print(f"Scraping {len(nodes)} nodes with Jina AI")
+        print(f"Scraping {len(nodes)} nodes with Jina AI ({self.max_workers} workers)")
         print("=" * 60)
 
         success_count = 0
         fail_count = 0
+        self.unchanged_count = 0
 
-        for i, (node_type, display_name, category) in enumerate(nodes, 1):
-            print(f"\n[{i}/{len(nodes)}]", end=" ")
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            fetched = bounded_map(executor, self.fetch_node_docs, nodes, 2 * self.max_workers)
 
             try:
-                success = self.scrape_node(node_type, display_name, category)
-                if success:
-                    success_count += 1
-                else:
-                    fail_count += 1
-
-            except Exception as e:
-                print(f"  [ERROR] {e}")
-                fail_count += 1
+                for i, (node, doc_url, markdown_content) in enumerate(fetched, 1):
+                    print(f"\n[{i}/{len(nodes)}]", end=" ")
+
+                    try:
+                        success = self.process_node_docs(node, doc_url, markdown_content)
+                        if success:
+                            success_count += 1
+                        else:
+                            fail_count += 1
+
+                    except Exception as e:
+                        print(f"  [ERROR] {e}")
+                        fail_count += 1
+            finally:
+                # Ctrl+C: cancel the queued fetches before the executor waits for them
+                fetched.close()
 
-            # Rate limiting
-            if i < len(nodes):
-                time.sleep(delay)
+        self.conn.commit()
 
         print("\n" + "=" * 60)
         print(f"Scraping complete!")
-        print(f"  Success: {success_count}")
+        print(f"  Success: {success_count} ({self.unchanged_count} unchanged)")
         print(f"  Failed: {fail_count}")
         print("=" * 60)
 
     def close(self):
         """Close database connection"""
+        self.conn.commit()
         self.conn.close()
+        self.http_cache.close()
+        self.http_client.close()
 
 def main():
     print("n8n Node Documentation Scraper (Jina AI)")
     print("=" * 60)
 
-    scraper = JinaNodeDocsScraper('../data/n8n_docs.db')
+    # --workers N: concurrent fetches, --rpm N: requests per minute (default 30)
+    # --force: re-parse pages even if their content hash is unchanged
+    args = sys.argv[1:]
+    max_workers = int(args[args.index('--workers') + 1]) if '--workers' in args else 1
+    requests_per_minute = int(args[args.index('--rpm') + 1]) if '--rpm' in args else 30
+
+    scraper = JinaNodeDocsScraper('../data/n8n_docs.db', requests_per_minute=requests_per_minute,
+                                  max_workers=max_workers, force='--force' in args)
 
     # Scrape ALL nodes
     print("\nScraping ALL nodes from database...")
-    print("This will take approximately 15-20 minutes\n")
+    print(f"At {requests_per_minute} requests/minute this takes about "
+          f"{len(scraper.get_nodes_to_scrape()) / requests_per_minute:.0f} minutes\n")
 
-    scraper.scrape_all(limit=None, delay=2)
+    scraper.scrape_all(limit=None)
 
     scraper.close()
 
@@ -5,28 +5,69 @@ Scraped die komplette n8n Dokumentation und speichert sie in einer SQLite-Datenb
 """
 
 import sqlite3
+import sys
 import requests
 import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from urllib.parse import urljoin, urlparse
 from bs4 import BeautifulSoup
 import re
 from datetime import datetime
 
+from http_cache import HttpCache
+from http_client import HttpClient
+
+
 class N8nDocScraper:
-    def __init__(self, db_name='n8n_docs.db', jina_api_key=None):
+    def __init__(self, db_name='n8n_docs.db', jina_api_key=None, max_workers=4,
+                 requests_per_second=1.0, base_url='https://docs.n8n.io',
+                 jina_api_base='https://r.jina.ai/', max_attempts=3, claim_timeout=600,
+                 write_batch_size=50, write_interval=5.0, http_cache=None):
+        """
+        max_workers: Parallele Requests
+        requests_per_second: Erlaubte Request-Rate pro Host (Token Bucket im HttpClient)
+        base_url / jina_api_base: Überschreibbar, z.B. für einen lokalen Test-Server
+        max_attempts: Versuche pro URL bevor sie als Fehler gilt
+        claim_timeout: Sekunden nach denen eine beanspruchte URL wieder freigegeben wird
+                       (z.B. wenn ein anderer Crawler-Prozess abgestürzt ist)
+        write_batch_size: Gepufferte Seiten bis zum Schreiben in die Datenbank
+        write_interval: Spätestens nach so vielen Sekunden wird der Puffer geschrieben
+        http_cache: HttpCache für Conditional Requests (Standard: data/http_cache.db)
+        """
         self.db_name = db_name
-        self.base_url = 'https://docs.n8n.io'
-        self.jina_api_base = 'https://r.jina.ai/'
+        self.base_url = base_url
+        self.jina_api_base = jina_api_base
         self.jina_api_key = jina_api_key
+        self.max_workers = max_workers
+        self.max_attempts = max_attempts
+        self.claim_timeout = claim_timeout
+        self.http_client = HttpClient(pool_size=max_workers, requests_per_second=requests_per_second,
+                                      max_per_host=max_workers)
+        self.http_cache = http_cache or HttpCache(session=self.http_client)
+        # Ein übergebener Cache nutzt denselben Client (Pool, Rate-Limit pro Host)
+        self.http_cache.use_session(self.http_client)
         self.visited_urls = set()
+        self.fetch_errors = {}
+        self.claimed_urls = set()
+        self.write_batch_size = write_batch_size
+        self.write_interval = write_interval
+        self.pending_pages = []
+        self.pending_links = []
+        self.pending_completions = []
+        self.last_flush = time.monotonic()
         self.conn = None
         self.setup_database()
 
     def setup_database(self):
         """Erstellt die SQLite-Datenbank und Tabellen"""
-        self.conn = sqlite3.connect(self.db_name)
+        # timeout: mehrere Crawler-Prozesse warten auf Schreibsperren statt zu scheitern
+        self.conn = sqlite3.connect(self.db_name, timeout=30)
         cursor = self.conn.cursor()
 
+        # WAL: Leser blockieren Schreiber nicht, Commits ohne fsync pro Transaktion
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+
         # Tabelle für gescrapte Seiten
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS pages (
@@ -61,6 +102,37 @@ class N8nDocScraper:
             CREATE INDEX IF NOT EXISTS idx_source_url ON links(source_url)
         ''')
 
+        # Doppelte Links aus älteren Crawls entfernen, danach verhindert der Index neue Duplikate
+        cursor.execute('''
+            DELETE FROM links WHERE id NOT IN (
+                SELECT MIN(id) FROM links GROUP BY source_url, target_url
+            )
+        ''')
+        if cursor.rowcount > 0:
+            print(f"🧹 {cursor.rowcount} doppelte Links entfernt")
+
+        cursor.execute('''
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_links_source_target ON links(source_url, target_url)
+        ''')
+
+        # Crawl-Frontier: überlebt Abbrüche und wird von mehreren Prozessen geteilt
+        # state: pending -> in_progress -> done / error
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS crawl_frontier (
+                url TEXT PRIMARY KEY,
+                depth INTEGER NOT NULL DEFAULT 0,
+                state TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                last_error TEXT,
+                claimed_at TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_crawl_frontier_state ON crawl_frontier(state, attempts)
+        ''')
+
         self.conn.commit()
         print(f"✓ Datenbank '{self.db_name}' initialisiert")
 
@@ -81,7 +153,7 @@ class N8nDocScraper:
 
         try:
             print(f"  📥 Fetching via Jina AI: {url}")
-            response = requests.get(jina_url, headers=headers, timeout=30)
+            response = self.http_cache.get(jina_url, headers=headers)
             response.raise_for_status()
 
             markdown_content = response.text
@@ -100,6 +172,7 @@ class N8nDocScraper:
 
         except requests.exceptions.RequestException as e:
             print(f"  ❌ Fehler beim Abrufen von {url}: {e}")
+            self.fetch_errors[url] = str(e)
             return None, None, None, []
 
     def extract_node_type(self, url):
@@ -144,37 +217,56 @@ class N8nDocScraper:
         return links
 
     def save_page(self, url, title, markdown_content, node_type=None, status='success'):
-        """Speichert eine Seite in der Datenbank"""
-        cursor = self.conn.cursor()
+        """Puffert eine Seite - geschrieben wird gebündelt in flush_writes()"""
+        self.pending_pages.append((url, title, node_type, markdown_content, status, datetime.now()))
+        print(f"  ✓ Gespeichert: {title}")
+        self.maybe_flush_writes()
+        return True
+
+    def save_links(self, source_url, links):
+        """Puffert gefundene Links (Duplikate ignoriert der Unique-Index)"""
+        self.pending_links.extend((source_url, link['url'], link['text']) for link in links)
+        self.maybe_flush_writes()
+
+    def maybe_flush_writes(self):
+        """Schreibt den Puffer wenn write_batch_size oder write_interval erreicht ist"""
+        if (len(self.pending_pages) >= self.write_batch_size
+                or time.monotonic() - self.last_flush >= self.write_interval):
+            self.flush_writes()
+
+    def flush_writes(self):
+        """
+        Schreibt gepufferte Seiten, Links und abgeschlossene Frontier-URLs in einer Transaktion
+        Eine URL gilt erst als 'done', wenn ihre Seite tatsächlich gespeichert ist -
+        bei einem Absturz wird sie nach claim_timeout erneut gecrawlt.
+        """
+        self.last_flush = time.monotonic()
+        if not (self.pending_pages or self.pending_links or self.pending_completions):
+            return
 
+        cursor = self.conn.cursor()
         try:
-            cursor.execute('''
+            cursor.executemany('''
                 INSERT OR REPLACE INTO pages (url, title, node_type, markdown_content, status, scraped_at)
                 VALUES (?, ?, ?, ?, ?, ?)
-            ''', (url, title, node_type, markdown_content, status, datetime.now()))
-
+            ''', self.pending_pages)
+            cursor.executemany('''
+                INSERT OR IGNORE INTO links (source_url, target_url, link_text)
+                VALUES (?, ?, ?)
+            ''', self.pending_links)
+            cursor.executemany('''
+                UPDATE crawl_frontier SET state = 'done', last_error = NULL, updated_at = ?
+                WHERE url = ?
+            ''', self.pending_completions)
             self.conn.commit()
-            print(f"  ✓ Gespeichert: {title}")
-            return True
-
         except sqlite3.Error as e:
+            self.conn.rollback()
             print(f"  ❌ Datenbankfehler: {e}")
-            return False
+            raise
 
-    def save_links(self, source_url, links):
-        """Speichert gefundene Links in der Datenbank"""
-        cursor = self.conn.cursor()
-
-        for link in links:
-            try:
-                cursor.execute('''
-                    INSERT INTO links (source_url, target_url, link_text)
-                    VALUES (?, ?, ?)
-                ''', (source_url, link['url'], link['text']))
-            except sqlite3.Error:
-                pass  # Link existiert bereits
-
-        self.conn.commit()
+        self.pending_pages.clear()
+        self.pending_links.clear()
+        self.pending_completions.clear()
 
     def should_crawl(self, url):
         """Prüft, ob eine URL gecrawlt werden soll"""
@@ -201,49 +293,171 @@ class N8nDocScraper:
 
         return True
 
-    def crawl(self, start_url, max_pages=None):
+    def enqueue_urls(self, urls, depth):
+        """Fügt URLs als 'pending' zur Frontier hinzu (bekannte URLs werden ignoriert)"""
+        cursor = self.conn.cursor()
+        cursor.executemany('''
+            INSERT OR IGNORE INTO crawl_frontier (url, depth, state, updated_at)
+            VALUES (?, ?, 'pending', ?)
+        ''', [(url, depth, datetime.now()) for url in urls])
+        self.conn.commit()
+
+    def claim_urls(self, limit):
         """
-        Startet das rekursive Crawling
-        start_url: Die Start-URL
-        max_pages: Maximale Anzahl zu crawlender Seiten (None = unbegrenzt)
+        Beansprucht bis zu limit offene URLs in einer Schreib-Transaktion
+        Returns: Liste von (url, depth) - kein anderer Prozess erhält dieselben URLs
         """
-        to_visit = [start_url]
-        pages_crawled = 0
+        if limit <= 0:
+            return []
 
-        print(f"\n🚀 Starte Crawling von: {start_url}")
-        print(f"📊 Max. Seiten: {max_pages if max_pages else 'unbegrenzt'}\n")
+        cursor = self.conn.cursor()
+        self.conn.commit()
+        cursor.execute('BEGIN IMMEDIATE')
+        try:
+            cursor.execute('''
+                SELECT url, depth FROM crawl_frontier
+                WHERE state = 'pending'
+                ORDER BY attempts, rowid
+                LIMIT ?
+            ''', (limit,))
+            claimed = cursor.fetchall()
+
+            now = datetime.now()
+            cursor.executemany('''
+                UPDATE crawl_frontier
+                SET state = 'in_progress', attempts = attempts + 1, claimed_at = ?, updated_at = ?
+                WHERE url = ?
+            ''', [(now, now, url) for url, depth in claimed])
+            self.conn.commit()
+        except sqlite3.Error:
+            self.conn.rollback()
+            raise
 
-        while to_visit and (max_pages is None or pages_crawled < max_pages):
-            url = to_visit.pop(0)
+        self.claimed_urls.update(url for url, depth in claimed)
+        return claimed
 
-            if not self.should_crawl(url):
-                continue
+    def complete_url(self, url):
+        """Markiert eine URL als erfolgreich gecrawlt (zusammen mit ihrer Seite geschrieben)"""
+        self.pending_completions.append((datetime.now(), url))
+        self.claimed_urls.discard(url)
+        self.maybe_flush_writes()
 
-            self.visited_urls.add(url)
-            pages_crawled += 1
+    def fail_url(self, url, error):
+        """
+        Vermerkt einen Fehlschlag - erneut 'pending' bis max_attempts erreicht ist
+        Returns: True wenn die URL endgültig als Fehler gilt
+        """
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            UPDATE crawl_frontier
+            SET state = CASE WHEN attempts >= ? THEN 'error' ELSE 'pending' END,
+                last_error = ?, updated_at = ?
+            WHERE url = ?
+        ''', (self.max_attempts, error, datetime.now(), url))
+        cursor.execute('SELECT state FROM crawl_frontier WHERE url = ?', (url,))
+        row = cursor.fetchone()
+        self.conn.commit()
+        self.claimed_urls.discard(url)
+        return row is not None and row[0] == 'error'
+
+    def release_urls(self, urls):
+        """Gibt beanspruchte, nicht abgeschlossene URLs wieder frei (z.B. bei Abbruch)"""
+        self.conn.executemany('''
+            UPDATE crawl_frontier SET state = 'pending', attempts = MAX(attempts - 1, 0), updated_at = ?
+            WHERE url = ? AND state = 'in_progress'
+        ''', [(datetime.now(), url) for url in urls])
+        self.conn.commit()
+        self.claimed_urls.difference_update(urls)
 
-            print(f"\n[{pages_crawled}/{max_pages if max_pages else '∞'}] Crawling: {url}")
+    def release_stale_claims(self):
+        """Gibt URLs frei, deren Claim älter als claim_timeout ist (abgestürzte Prozesse)"""
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            UPDATE crawl_frontier SET state = 'pending', updated_at = ?
+            WHERE state = 'in_progress' AND claimed_at < ?
+        ''', (datetime.now(), datetime.fromtimestamp(time.time() - self.claim_timeout)))
+        self.conn.commit()
+        if cursor.rowcount:
+            print(f"♻️  {cursor.rowcount} verwaiste URLs wieder freigegeben")
 
-            # Mit Jina AI abrufen
-            markdown_content, title, node_type, links = self.fetch_with_jina(url)
+    def reset_crawl_state(self):
+        """Leert die Frontier für einen kompletten Neu-Crawl"""
+        self.conn.execute('DELETE FROM crawl_frontier')
+        self.conn.commit()
+        self.visited_urls.clear()
+        print("🗑️  Crawl-Frontier zurückgesetzt")
 
-            if markdown_content:
-                # In Datenbank speichern
-                self.save_page(url, title, markdown_content, node_type)
-                self.save_links(url, links)
+    def crawl(self, start_url, max_pages=None, max_depth=None):
+        """
+        Startet das rekursive Crawling
+        start_url: Die Start-URL
+        max_pages: Maximale Anzahl zu crawlender Seiten (None = unbegrenzt)
+        max_depth: Maximale Link-Tiefe ab start_url (None = unbegrenzt)
+
+        Bis zu max_workers Seiten werden parallel geholt (Rate pro Host über
+        Token Bucket), Speichern und Link-Verarbeitung laufen im Haupt-Thread.
+        Die Warteschlange liegt in crawl_frontier: ein abgebrochener Crawl setzt
+        beim nächsten Aufruf fort, mehrere Prozesse können sich die Frontier teilen.
+        """
+        in_flight = {}
+        pages_crawled = 0
 
-                # Neue Links zur Warteschlange hinzufügen
-                for link in links:
-                    if link['url'] not in self.visited_urls and link['url'] not in to_visit:
-                        to_visit.append(link['url'])
+        print(f"\n🚀 Starte Crawling von: {start_url}")
+        print(f"📊 Max. Seiten: {max_pages if max_pages else 'unbegrenzt'}")
+        print(f"⚡ Worker: {self.max_workers}\n")
 
-                print(f"  📎 {len(links)} Links gefunden, {len(to_visit)} in Warteschlange")
-            else:
-                # Fehlerseite speichern
-                self.save_page(url, f"Error: {url}", "", status='error')
+        self.release_stale_claims()
+        if self.should_crawl(start_url):
+            self.enqueue_urls([start_url], depth=0)
 
-            # Höfliche Verzögerung zwischen Requests
-            time.sleep(1)
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                while True:
+                    # Worker auffüllen
+                    free_slots = self.max_workers - len(in_flight)
+                    if max_pages is not None:
+                        free_slots = min(free_slots, max_pages - pages_crawled)
+
+                    for url, depth in self.claim_urls(free_slots):
+                        self.visited_urls.add(url)
+                        pages_crawled += 1
+
+                        print(f"\n[{pages_crawled}/{max_pages if max_pages else '∞'}] Crawling: {url}")
+                        in_flight[executor.submit(self.fetch_with_jina, url)] = (url, depth)
+
+                    if not in_flight:
+                        break
+
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+
+                    for future in done:
+                        url, depth = in_flight.pop(future)
+                        markdown_content, title, node_type, links = future.result()
+
+                        if markdown_content:
+                            # In Datenbank speichern
+                            self.save_page(url, title, markdown_content, node_type)
+                            self.save_links(url, links)
+
+                            # Neue Links sofort zur Frontier hinzufügen (andere Prozesse brauchen sie)
+                            if max_depth is None or depth < max_depth:
+                                self.enqueue_urls(
+                                    [link['url'] for link in links if self.should_crawl(link['url'])],
+                                    depth + 1
+                                )
+                            self.complete_url(url)
+
+                            print(f"  📎 {len(links)} Links gefunden")
+                        else:
+                            error = self.fetch_errors.pop(url, 'Kein Inhalt')
+                            if self.fail_url(url, error):
+                                # Fehlerseite speichern
+                                self.save_page(url, f"Error: {url}", "", status='error')
+        finally:
+            # Gepufferte Seiten schreiben, bei Abbruch eigene Claims sofort freigeben
+            self.flush_writes()
+            if self.claimed_urls:
+                self.release_urls(list(self.claimed_urls))
 
         print(f"\n✅ Crawling abgeschlossen!")
         print(f"📊 Insgesamt {pages_crawled} Seiten gecrawlt")
@@ -251,6 +465,7 @@ class N8nDocScraper:
 
     def print_stats(self):
         """Zeigt Statistiken über die gescrapten Daten"""
+        self.flush_writes()
         cursor = self.conn.cursor()
 
         cursor.execute("SELECT COUNT(*) FROM pages WHERE status='success'")
@@ -262,15 +477,22 @@ class N8nDocScraper:
         cursor.execute("SELECT COUNT(*) FROM links")
         links_count = cursor.fetchone()[0]
 
+        cursor.execute("SELECT COUNT(*) FROM crawl_frontier WHERE state = 'pending'")
+        pending_count = cursor.fetchone()[0]
+
         print(f"\n📈 Statistiken:")
         print(f"   ✓ Erfolgreiche Seiten: {success_count}")
         print(f"   ✗ Fehlerhafte Seiten: {error_count}")
         print(f"   🔗 Gespeicherte Links: {links_count}")
+        print(f"   ⏳ Offen in Frontier: {pending_count}")
 
     def close(self):
         """Schließt die Datenbankverbindung"""
         if self.conn:
+            self.flush_writes()
             self.conn.close()
+            self.http_cache.close()
+            self.http_client.close()
             print(f"\n💾 Datenbank geschlossen")
 
 
@@ -281,6 +503,10 @@ def main():
 
     scraper = N8nDocScraper(jina_api_key=jina_api_key)
 
+    # Standard: abgebrochenen Crawl fortsetzen, --restart für kompletten Neu-Crawl
+    if '--restart' in sys.argv[1:]:
+        scraper.reset_crawl_state()
+
     try:
         # Wichtige Bereiche die gecrawlt werden sollen
         start_urls = [
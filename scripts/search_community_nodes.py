@@ -7,19 +7,60 @@ Sucht nach Community Nodes auf npm und GitHub
 
 import sys
 import io
+import json
+import os
+import queue
 import requests
 import sqlite3
+import tarfile
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-import time
+
+from bounded_map import bounded_map
+from http_cache import HttpCache
+from http_client import HttpClient
 
 # Fix für Windows Console Encoding
 if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
 
+def read_package_tarball(tarball_path):
+    """
+    Liest package.json aus einem npm-Tarball (.tgz) ohne zu entpacken
+    Returns: (package, node_types_list) wie aus Suche + /latest, oder None
+    """
+    try:
+        with tarfile.open(tarball_path, 'r|*') as tar:
+            for member in tar:
+                # npm packt nach package/, manche Pakete nutzen einen anderen Ordner
+                if member.isfile() and member.name.count('/') == 1 and member.name.endswith('/package.json'):
+                    pkg_data = json.loads(tar.extractfile(member).read().decode('utf-8'))
+                    return pkg_data, pkg_data.get('n8n', {}).get('nodes', [])
+    except (tarfile.TarError, OSError, ValueError) as e:
+        print(f"  ⚠️  {os.path.basename(tarball_path)}: {e}")
+    return None
+
+
 class CommunityNodesSearcher:
-    def __init__(self, db_name='n8n_docs.db'):
+    def __init__(self, db_name='n8n_docs.db', http_cache=None, max_workers=8,
+                 requests_per_second=20, batch_size=100, registry_url='https://registry.npmjs.org'):
+        """
+        max_workers: Parallele Abrufe der Paket-Metadaten (1 = seriell)
+        requests_per_second: Rate auf dem Registry-Host
+        batch_size: Pakete pro Datenbank-Transaktion
+        registry_url: Überschreibbar, z.B. für einen lokalen Test-Server
+        """
         self.db_name = db_name
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.registry_url = registry_url.rstrip('/')
+        self.http_client = HttpClient(pool_size=max_workers, requests_per_second=requests_per_second,
+                                      max_per_host=max_workers)
+        self.http_cache = http_cache or HttpCache(session=self.http_client)
+        # Ein übergebener Cache nutzt denselben Client (Pool, Rate-Limit pro Host)
+        self.http_cache.use_session(self.http_client)
         self.conn = None
         self.setup_database()
 
@@ -43,20 +84,45 @@ class CommunityNodesSearcher:
             )
         ''')
 
+        # Nicht mehr auf npm gelistete Pakete bleiben erhalten, werden aber markiert
+        cursor.execute("PRAGMA table_info(community_nodes)")
+        if 'removed_at' not in [column[1] for column in cursor.fetchall()]:
+            cursor.execute('ALTER TABLE community_nodes ADD COLUMN removed_at TIMESTAMP')
+
+        # Zusammenfassung jedes Laufs von search_and_save
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS community_refresh_runs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                mode TEXT NOT NULL,
+                started_at TIMESTAMP,
+                finished_at TIMESTAMP,
+                listed INTEGER,
+                new_packages INTEGER,
+                changed_packages INTEGER,
+                unchanged_packages INTEGER,
+                removed_packages INTEGER,
+                fetched INTEGER,
+                saved INTEGER
+            )
+        ''')
+
         self.conn.commit()
         print(f"✓ Datenbank '{self.db_name}' verbunden")
 
-    def search_npm_community_nodes(self):
-        """Sucht nach n8n Community Nodes auf npm"""
-        print("\n🔍 Suche n8n Community Nodes auf npm...\n")
-
+    def iter_search_pages(self, page_retries=3):
+        """
+        Generator: eine Seite der npm-Suche nach der anderen (Liste von Paket-Objekten)
+        Eine fehlgeschlagene Seite wird bis zu page_retries Mal erneut abgerufen,
+        danach endet die Suche mit search_complete = False
+        """
         # NPM Registry API
         # Suche nach Paketen mit "n8n-nodes" im Namen
-        search_url = "https://registry.npmjs.org/-/v1/search"
+        search_url = f"{self.registry_url}/-/v1/search"
 
-        all_packages = []
         page = 0
         size = 250  # Max items per page
+        # False wenn eine Seite fehlschlägt - dann werden keine Pakete als entfernt markiert
+        self.search_complete = True
 
         while True:
             params = {
@@ -65,31 +131,83 @@ class CommunityNodesSearcher:
                 'from': page * size
             }
 
-            try:
-                print(f"📄 Seite {page + 1} wird abgerufen...")
-                response = requests.get(search_url, params=params, timeout=30)
-                response.raise_for_status()
-
-                data = response.json()
-                objects = data.get('objects', [])
-
-                if not objects:
+            for attempt in range(1, page_retries + 1):
+                try:
+                    print(f"📄 Seite {page + 1} wird abgerufen...")
+                    response = self.http_cache.get(search_url, params=params)
+                    response.raise_for_status()
+                    data = response.json()
                     break
+                except (requests.exceptions.RequestException, ValueError) as e:
+                    print(f"❌ Fehler (Versuch {attempt}/{page_retries}): {e}")
+            else:
+                self.search_complete = False
+                return
+
+            objects = data.get('objects', [])
+            if not objects:
+                return
+
+            print(f"   ✓ {len(objects)} Pakete gefunden")
+            yield objects
+
+            # Prüfe ob es weitere Seiten gibt
+            total = data.get('total', 0)
+            if page * size + len(objects) >= total:
+                return
+
+            page += 1
+
+    def prefetch_search_pages(self):
+        """
+        iter_search_pages() in einem Hintergrund-Thread: die nächste Seite wird
+        geladen, während die aktuelle verarbeitet wird (höchstens eine Seite auf Vorrat)
+        Bricht der Verbraucher vorzeitig ab, beendet sich der Thread nach der laufenden Seite
+        """
+        pages = queue.Queue(maxsize=1)
+        done = object()
+        stop = threading.Event()
+
+        def put(item):
+            """Wartet auf einen freien Platz, gibt False zurück wenn der Verbraucher aufgehört hat"""
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
 
-                all_packages.extend(objects)
-                print(f"   ✓ {len(objects)} Pakete gefunden")
+        def producer():
+            try:
+                for objects in self.iter_search_pages():
+                    if not put(objects):
+                        return
+            except Exception as e:
+                print(f"❌ Fehler: {e}")
+                self.search_complete = False
+            finally:
+                put(done)
 
-                # Prüfe ob es weitere Seiten gibt
-                total = data.get('total', 0)
-                if len(all_packages) >= total:
+        thread = threading.Thread(target=producer, daemon=True)
+        thread.start()
+        try:
+            while True:
+                objects = pages.get()
+                if objects is done:
                     break
+                yield objects
+            thread.join()
+        finally:
+            stop.set()
 
-                page += 1
-                time.sleep(0.5)  # Rate limiting
+    def search_npm_community_nodes(self):
+        """Sucht nach n8n Community Nodes auf npm (alle Seiten als Liste)"""
+        print("\n🔍 Suche n8n Community Nodes auf npm...\n")
 
-            except requests.exceptions.RequestException as e:
-                print(f"❌ Fehler: {e}")
-                break
+        all_packages = []
+        for objects in self.iter_search_pages():
+            all_packages.extend(objects)
 
         print(f"\n📊 Gesamt: {len(all_packages)} Pakete gefunden")
         return all_packages
@@ -114,11 +232,14 @@ class CommunityNodesSearcher:
         return community_nodes
 
     def extract_node_types_from_package(self, package_name):
-        """Versucht Node-Types aus dem Package zu extrahieren"""
+        """
+        Versucht Node-Types aus dem Package zu extrahieren
+        Returns: Liste der Node-Types oder None, wenn /latest nicht geholt werden konnte
+        """
         # Hole package.json vom npm registry
         try:
-            url = f"https://registry.npmjs.org/{package_name}/latest"
-            response = requests.get(url, timeout=10)
+            url = f"{self.registry_url}/{package_name}/latest"
+            response = self.http_cache.get(url)
             response.raise_for_status()
 
             pkg_data = response.json()
@@ -135,111 +256,302 @@ class CommunityNodesSearcher:
             return node_types
 
         except Exception as e:
-            return []
+            print(f"  ⚠️  {package_name}: {e}")
+            return None
+
+    def build_community_node_row(self, package, node_types_list):
+        """Datenbankzeile für community_nodes aus Suchergebnis und Node-Types"""
+        name = package.get('name', '')
+        description = package.get('description', '')
+        version = package.get('version', '')
+
+        # Author extrahieren
+        author = ''
+        if 'author' in package:
+            if isinstance(package['author'], dict):
+                author = package['author'].get('name', '')
+            else:
+                author = str(package['author'])
 
-    def save_community_node(self, package):
-        """Speichert Community Node in der Datenbank"""
+        # Repository
+        repository = ''
+        if 'repository' in package:
+            if isinstance(package['repository'], dict):
+                repository = package['repository'].get('url', '')
+            else:
+                repository = str(package['repository'])
+
+        # Downloads (falls verfügbar in npm metadata)
+        downloads = 0
+
+        # Handle both string and dict node types
+        if node_types_list:
+            node_types_str = ', '.join([
+                str(nt) if isinstance(nt, str) else str(nt.get('name', nt))
+                for nt in node_types_list
+            ])
+        else:
+            node_types_str = ''
+
+        return (
+            name,
+            node_types_str,
+            description,
+            version,
+            author,
+            repository,
+            downloads,
+            datetime.now()
+        )
+
+    def save_community_nodes(self, rows):
+        """Speichert mehrere Community Nodes in einer Transaktion"""
         cursor = self.conn.cursor()
 
         try:
-            name = package.get('name', '')
-            description = package.get('description', '')
-            version = package.get('version', '')
-
-            # Author extrahieren
-            author = ''
-            if 'author' in package:
-                if isinstance(package['author'], dict):
-                    author = package['author'].get('name', '')
-                else:
-                    author = str(package['author'])
-
-            # Repository
-            repository = ''
-            if 'repository' in package:
-                if isinstance(package['repository'], dict):
-                    repository = package['repository'].get('url', '')
-                else:
-                    repository = str(package['repository'])
-
-            # Downloads (falls verfügbar in npm metadata)
-            downloads = 0
-
-            # Versuche Node-Types zu extrahieren
-            node_types_list = self.extract_node_types_from_package(name)
-            # Handle both string and dict node types
-            if node_types_list:
-                node_types_str = ', '.join([
-                    str(nt) if isinstance(nt, str) else str(nt.get('name', nt))
-                    for nt in node_types_list
-                ])
-            else:
-                node_types_str = ''
-
-            cursor.execute('''
+            cursor.executemany('''
                 INSERT OR REPLACE INTO community_nodes
                 (package_name, node_types, description, version, author, repository, downloads, scraped_at)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                name,
-                node_types_str,
-                description,
-                version,
-                author,
-                repository,
-                downloads,
-                datetime.now()
-            ))
+            ''', rows)
 
             self.conn.commit()
             return True
 
         except sqlite3.Error as e:
+            self.conn.rollback()
             print(f"  ❌ Datenbankfehler: {e}")
             return False
 
-    def search_and_save(self):
-        """Sucht und speichert alle Community Nodes"""
-        # Suche auf npm
-        packages = self.search_npm_community_nodes()
+    def save_community_node(self, package):
+        """Speichert Community Node in der Datenbank"""
+        # Versuche Node-Types zu extrahieren
+        node_types_list = self.extract_node_types_from_package(package.get('name', ''))
+        if node_types_list is None:
+            return False
+        return self.save_community_nodes([self.build_community_node_row(package, node_types_list)])
+
+    def fetch_node_types(self, packages, executor):
+        """
+        Holt die Node-Types der Pakete parallel über executor
+        Liefert (package, node_types_list) in der Reihenfolge von packages,
+        sobald das jeweilige Ergebnis vorliegt (node_types_list None = Abruf fehlgeschlagen)
+        """
+        names = [pkg.get('name', '') for pkg in packages]
+        yield from zip(packages, executor.map(self.extract_node_types_from_package, names))
+
+    def load_stored_versions(self):
+        """Gespeicherte Pakete: {package_name: (version, removed_at)}"""
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT package_name, version, removed_at FROM community_nodes")
+        return {name: (version, removed_at) for name, version, removed_at in cursor.fetchall()}
 
-        # Filtere Community Nodes
-        community_nodes = self.filter_community_nodes(packages)
+    def mark_removed_packages(self, listed_names):
+        """Markiert gespeicherte Pakete, die nicht mehr in der npm-Suche auftauchen"""
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT package_name FROM community_nodes WHERE removed_at IS NULL")
+        removed = [name for (name,) in cursor.fetchall() if name not in listed_names]
+
+        now = datetime.now()
+        cursor.executemany(
+            "UPDATE community_nodes SET removed_at = ? WHERE package_name = ?",
+            [(now, name) for name in removed]
+        )
+        self.conn.commit()
+        return removed
+
+    def record_refresh_run(self, summary):
+        """Speichert die Zusammenfassung eines Laufs in community_refresh_runs"""
+        columns = ', '.join(summary)
+        placeholders = ', '.join('?' for _ in summary)
+        self.conn.execute(
+            f"INSERT INTO community_refresh_runs ({columns}) VALUES ({placeholders})",
+            list(summary.values())
+        )
+        self.conn.commit()
 
-        print(f"\n✅ {len(community_nodes)} Community Nodes gefunden")
-        print(f"\n💾 Speichere in Datenbank...\n")
+    def classify_package(self, stored, package):
+        """'new', 'changed' oder 'unchanged' gegenüber load_stored_versions()"""
+        name = package.get('name', '')
+        if name not in stored:
+            return 'new'
+        if stored[name][0] != package.get('version', '') or stored[name][1] is not None:
+            return 'changed'
+        return 'unchanged'
+
+    def search_and_save(self, incremental=False):
+        """
+        Sucht und speichert alle Community Nodes - Seite für Seite:
+        Seite holen -> filtern -> Node-Types holen -> speichern
+        Die nächste Suchseite lädt bereits im Hintergrund (höchstens eine wartet),
+        jede Seite ist committet bevor die nächste verarbeitet wird.
+        incremental: Metadaten nur für neue Pakete oder geänderte Versionen holen
+        (Vergleich von package_name/version mit community_nodes)
+        """
+        started_at = datetime.now()
+        print("\n🔍 Suche n8n Community Nodes auf npm...\n")
 
+        stored = self.load_stored_versions()
+        listed_names = set()
+        counts = {'new': 0, 'changed': 0, 'unchanged': 0}
+        fetched = 0
+        failed = 0
         saved = 0
-        for idx, pkg in enumerate(community_nodes, 1):
-            name = pkg.get('name', '')
-            desc = pkg.get('description', '')[:50] if pkg.get('description') else ''
-
-            print(f"[{idx}/{len(community_nodes)}] {name}")
-            if desc:
-                print(f"    {desc}...")
-
-            if self.save_community_node(pkg):
-                saved += 1
 
-            time.sleep(0.2)  # Rate limiting
-
-        print(f"\n✅ {saved}/{len(community_nodes)} Community Nodes gespeichert!")
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for objects in self.prefetch_search_pages():
+                # Filtere Community Nodes (Duplikate über Seitengrenzen ignorieren)
+                page_nodes = []
+                for pkg in self.filter_community_nodes(objects):
+                    name = pkg.get('name', '')
+                    if name not in listed_names:
+                        listed_names.add(name)
+                        page_nodes.append(pkg)
+
+                # Mit gespeicherten Versionen vergleichen
+                to_fetch = []
+                for pkg in page_nodes:
+                    status = self.classify_package(stored, pkg)
+                    counts[status] += 1
+                    if status != 'unchanged' or not incremental:
+                        to_fetch.append(pkg)
+
+                batch = []
+                for pkg, node_types_list in self.fetch_node_types(to_fetch, executor):
+                    fetched += 1
+                    name = pkg.get('name', '')
+                    desc = pkg.get('description', '')[:50] if pkg.get('description') else ''
+
+                    print(f"[{fetched}] {name}")
+                    if desc:
+                        print(f"    {desc}...")
+
+                    # Abruf fehlgeschlagen: gespeicherte Zeile (alte Version) behalten,
+                    # damit der nächste inkrementelle Lauf das Paket erneut holt
+                    if node_types_list is None:
+                        failed += 1
+                        continue
+
+                    batch.append(self.build_community_node_row(pkg, node_types_list))
+                    if len(batch) >= self.batch_size:
+                        if self.save_community_nodes(batch):
+                            saved += len(batch)
+                        batch = []
+
+                # Seite vollständig speichern bevor die nächste verarbeitet wird
+                if batch and self.save_community_nodes(batch):
+                    saved += len(batch)
+
+        print(f"\n✅ {len(listed_names)} Community Nodes gefunden")
+        print(f"   🆕 {counts['new']} neu, 🔄 {counts['changed']} geändert, "
+              f"= {counts['unchanged']} unverändert")
+        print(f"✅ {saved}/{fetched} Community Nodes gespeichert!")
+        if failed:
+            print(f"⚠️  {failed} Pakete nicht abrufbar - beim nächsten Lauf erneut versucht")
+
+        # Entfernte Pakete nur bei vollständiger Suchliste markieren
+        if self.search_complete:
+            removed = self.mark_removed_packages(listed_names)
+            if removed:
+                print(f"🗑️  {len(removed)} Pakete nicht mehr auf npm gelistet (als entfernt markiert)")
+        else:
+            removed = []
+            print("⚠️  Suche unvollständig - entfernte Pakete werden nicht markiert")
+
+        summary = {
+            'mode': 'incremental' if incremental else 'full',
+            'started_at': started_at,
+            'finished_at': datetime.now(),
+            'listed': len(listed_names),
+            'new_packages': counts['new'],
+            'changed_packages': counts['changed'],
+            'unchanged_packages': counts['unchanged'],
+            'removed_packages': len(removed),
+            'fetched': fetched,
+            'saved': saved
+        }
+        self.record_refresh_run(summary)
+        return summary
+
+    def ingest_tarballs(self, tarball_dir, workers=None):
+        """
+        Offline-Import aus einem Ordner mit npm-Tarballs (*.tgz, z.B. von einem Mirror)
+        package.json wird gestreamt und in einem Prozess-Pool gelesen; es gelten
+        dieselben Filter und Zeilen wie bei der npm-Suche
+        workers: Anzahl Prozesse (None = CPU-Anzahl)
+        """
+        started_at = datetime.now()
+        tarballs = sorted(
+            os.path.join(tarball_dir, name)
+            for name in os.listdir(tarball_dir)
+            if name.endswith(('.tgz', '.tar.gz'))
+        )
+        print(f"\n📦 Importiere {len(tarballs)} npm-Tarballs aus {tarball_dir}...\n")
+
+        stored = self.load_stored_versions()
+        listed_names = set()
+        counts = {'new': 0, 'changed': 0, 'unchanged': 0}
+        saved = 0
+        batch = []
+
+        # Höchstens 4 Chunks pro Prozess eingereicht (Ergebnisse stauen sich nicht)
+        window = 4 * (workers or os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for result in bounded_map(executor, read_package_tarball, tarballs, window, chunksize=16):
+                if result is None:
+                    continue
+                pkg, node_types_list = result
+                if not self.filter_community_nodes([{'package': pkg}]):
+                    continue
+
+                listed_names.add(pkg.get('name', ''))
+                counts[self.classify_package(stored, pkg)] += 1
+                batch.append(self.build_community_node_row(pkg, node_types_list))
+                if len(batch) >= self.batch_size:
+                    if self.save_community_nodes(batch):
+                        saved += len(batch)
+                    batch = []
+
+        if batch and self.save_community_nodes(batch):
+            saved += len(batch)
+
+        print(f"✅ {saved}/{len(listed_names)} Community Nodes aus Tarballs gespeichert")
+
+        summary = {
+            'mode': 'tarballs',
+            'started_at': started_at,
+            'finished_at': datetime.now(),
+            'listed': len(listed_names),
+            'new_packages': counts['new'],
+            'changed_packages': counts['changed'],
+            'unchanged_packages': counts['unchanged'],
+            'removed_packages': 0,
+            'fetched': len(tarballs),
+            'saved': saved
+        }
+        self.record_refresh_run(summary)
+        return summary
 
     def print_stats(self):
         """Zeigt Statistiken"""
         cursor = self.conn.cursor()
 
-        cursor.execute("SELECT COUNT(*) FROM community_nodes")
+        cursor.execute("SELECT COUNT(*) FROM community_nodes WHERE removed_at IS NULL")
         total = cursor.fetchone()[0]
 
+        cursor.execute("SELECT COUNT(*) FROM community_nodes WHERE removed_at IS NOT NULL")
+        removed = cursor.fetchone()[0]
+
         print(f"\n📈 Statistiken:")
         print(f"   ✓ Community Nodes: {total}")
+        print(f"   🗑️  Entfernt: {removed}")
 
         # Top 10 Community Nodes
         print(f"\n🏆 Beispiele:")
         cursor.execute("""
             SELECT package_name, description
             FROM community_nodes
+            WHERE removed_at IS NULL
             LIMIT 10
         """)
 
@@ -259,6 +571,7 @@ class CommunityNodesSearcher:
         cursor.execute("""
             SELECT package_name, node_types, description
             FROM community_nodes
+            WHERE removed_at IS NULL
         """)
 
         community_nodes = cursor.fetchall()
@@ -312,6 +625,8 @@ class CommunityNodesSearcher:
 
     def close(self):
         """Schließt die Datenbankverbindung"""
+        self.http_cache.close()
+        self.http_client.close()
         if self.conn:
             self.conn.close()
 
@@ -321,7 +636,13 @@ def main():
     searcher = CommunityNodesSearcher()
 
     try:
-        searcher.search_and_save()
+        args = sys.argv[1:]
+        # --tarballs ORDNER: Offline-Import aus npm-Tarballs
+        # --incremental: nur neue/geänderte Paketversionen abrufen
+        if '--tarballs' in args:
+            searcher.ingest_tarballs(args[args.index('--tarballs') + 1])
+        else:
+            searcher.search_and_save(incremental='--incremental' in args)
         searcher.print_stats()
         searcher.export_to_node_types_api()
 
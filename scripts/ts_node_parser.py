@@ -0,0 +1,770 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Static parser for n8n node source files (.node.ts)
+Reads the INodeTypeDescription object literal of a node (including the
+INodeProperties[] arrays it spreads in from imported description files)
+without running TypeScript, and turns it into operation, parameter and
+credential rows for extract_node_details.py
+"""
+
+import json
+import os
+import re
+
+# Tokens of the TypeScript subset used in node descriptions; whitespace and
+# comments before a token are consumed, so findall() returns the tokens only
+TOKEN_PATTERN = re.compile(r'''
+    (?:\s+|//[^\n]*|/\*.*?\*/)*
+    (
+        '(?:[^'\\\n]|\\.)*'|"(?:[^"\\\n]|\\.)*"|`(?:[^`\\]|\\.)*`
+      | \d+(?:\.\d+)?(?:[eE][-+]?\d+)?
+      | [A-Za-z_$][\w$]*
+      | \.\.\.|=>|===|!==|==|!=|<=|>=|&&|\|\||\?\?
+      | .
+    )
+''', re.VERBOSE | re.DOTALL)
+QUOTES = '\'"`'
+
+OPENING = {'{': '}', '[': ']', '(': ')'}
+CLOSING = {'}', ']', ')'}
+VALUE_END = {',', ';', '}', ']', ')'}
+LITERALS = {'true': True, 'false': False, 'null': None, 'undefined': None}
+# Class fields / constants that hold the node description
+DESCRIPTION_NAMES = ('description', 'versionDescription')
+# Parsed modules kept per process (description files shared by versions/nodes)
+MODULE_CACHE_SIZE = 256
+
+
+class Unresolved:
+    """Value that cannot be evaluated statically (function, runtime expression, ...)"""
+
+    def __repr__(self):
+        return 'UNRESOLVED'
+
+
+UNRESOLVED = Unresolved()
+
+
+class Reference:
+    """Identifier or member chain, e.g. messageFields or send.description"""
+
+    def __init__(self, parts):
+        self.parts = parts
+
+
+class Call:
+    """Function call with parsed arguments, e.g. updateDisplayOptions(options, properties)"""
+
+    def __init__(self, parts, args):
+        self.parts = parts
+        self.args = args
+
+
+class ObjectLiteral:
+    """Entries are ('property', key, value) or ('spread', value)"""
+
+    def __init__(self, entries):
+        self.entries = entries
+
+
+class ArrayLiteral:
+    """Items are ('item', value) or ('spread', value)"""
+
+    def __init__(self, items):
+        self.items = items
+
+
+def tokenize(source):
+    """List of token strings without whitespace and comments"""
+    return TOKEN_PATTERN.findall(source)
+
+
+def is_name(token):
+    return token[0].isalpha() or token[0] in '_$'
+
+
+def unquote(text):
+    """Value of a string token (escapes are resolved, template literals keep ${...})"""
+    body = text[1:-1]
+    if '\\' not in body:
+        return body
+    return re.sub(r'\\(.)', lambda m: {'n': '\n', 't': '\t'}.get(m.group(1), m.group(1)), body)
+
+
+class Parser:
+    """Recursive descent over the token list of one module"""
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.pos = 0
+
+    def peek(self, offset=0):
+        index = self.pos + offset
+        if index < len(self.tokens):
+            return self.tokens[index]
+        return None
+
+    def skip_balanced(self):
+        """Skip one token, or a whole bracketed group when it opens one"""
+        depth = 0
+        while self.pos < len(self.tokens):
+            text = self.tokens[self.pos]
+            self.pos += 1
+            if text in OPENING:
+                depth += 1
+            elif text in CLOSING:
+                depth -= 1
+            if depth <= 0:
+                return
+
+    def skip_expression(self):
+        """Skip to the next ',' ';' or closing bracket of the enclosing literal"""
+        while self.pos < len(self.tokens):
+            text = self.tokens[self.pos]
+            if text in (',', ';') or text in CLOSING:
+                return
+            self.skip_balanced()
+
+    def skip_type(self):
+        """Skip a type annotation up to '=' (or ';' / ')' for declarations without value)"""
+        while self.pos < len(self.tokens):
+            text = self.tokens[self.pos]
+            if text in ('=', ';', ')', '{'):
+                return
+            self.skip_balanced()
+
+    def parse_value(self):
+        """Parse one expression; anything beyond literals and references is UNRESOLVED"""
+        # Fast path: single-token value followed by ',' / closing bracket
+        pos = self.pos
+        if pos + 1 < len(self.tokens) and self.tokens[pos + 1] in VALUE_END:
+            text = self.tokens[pos]
+            if text[0] in QUOTES:
+                self.pos += 1
+                return unquote(text)
+            if text in LITERALS:
+                self.pos += 1
+                return LITERALS[text]
+
+        value = self.parse_primary()
+
+        # Type assertions: value as const / value as INodeProperties[] / value satisfies X
+        while self.peek() in ('as', 'satisfies'):
+            self.pos += 1
+            self.skip_balanced()
+            while self.peek() == '[' and self.peek(1) == ']':
+                self.pos += 2
+
+        text = self.peek()
+        if text is not None and text not in (',', ';') and text not in CLOSING:
+            # Operators, ternaries, arrow functions, ...
+            self.skip_expression()
+            return UNRESOLVED
+        return value
+
+    def parse_primary(self):
+        if self.pos >= len(self.tokens):
+            return UNRESOLVED
+        text = self.tokens[self.pos]
+
+        if text == '{':
+            return self.parse_object()
+        if text == '[':
+            return self.parse_array()
+        if text[0] in QUOTES:
+            self.pos += 1
+            return unquote(text)
+        if text[0].isdigit():
+            self.pos += 1
+            return float(text) if '.' in text or 'e' in text.lower() else int(text)
+        if text == '-' and (self.peek(1) or ' ')[0].isdigit():
+            self.pos += 1
+            return -self.parse_primary()
+        if is_name(text):
+            if text in LITERALS:
+                self.pos += 1
+                return LITERALS[text]
+            return self.parse_reference()
+
+        self.skip_expression()
+        return UNRESOLVED
+
+    def parse_reference(self):
+        parts = [self.tokens[self.pos]]
+        self.pos += 1
+        while self.peek() == '.' and is_name(self.peek(1) or '.'):
+            parts.append(self.tokens[self.pos + 1])
+            self.pos += 2
+
+        if self.peek() == '(':
+            self.pos += 1
+            args = []
+            while self.peek() not in (None, ')'):
+                args.append(self.parse_value())
+                if self.peek() == ',':
+                    self.pos += 1
+                elif self.peek() != ')':
+                    # Malformed source - leave the closing bracket to the caller
+                    return UNRESOLVED
+            self.pos += 1
+            return Call(parts, args)
+
+        return Reference(parts)
+
+    def parse_object(self):
+        tokens = self.tokens
+        self.pos += 1
+        entries = []
+        while self.pos < len(tokens):
+            text = tokens[self.pos]
+            if text == '}':
+                self.pos += 1
+                break
+            if text == ',':
+                self.pos += 1
+                continue
+
+            # Common case: key: value
+            if self.pos + 1 < len(tokens) and tokens[self.pos + 1] == ':':
+                self.pos += 2
+                key = unquote(text) if text[0] in QUOTES else text
+                entries.append(('property', key, self.parse_value()))
+                continue
+
+            if text == '...':
+                self.pos += 1
+                entries.append(('spread', self.parse_value()))
+                continue
+
+            # Modifiers of methods / getters
+            if text in ('async', 'get', 'set') and self.peek(1) not in (':', ',', '}', '('):
+                self.pos += 1
+                text = self.tokens[self.pos]
+
+            if text[0] in QUOTES:
+                key = unquote(text)
+                self.pos += 1
+            elif is_name(text) or text[0].isdigit():
+                key = text
+                self.pos += 1
+            elif text == '[':
+                # Computed key
+                key = None
+                self.skip_balanced()
+            else:
+                # Stray token (e.g. ';' in malformed source)
+                self.pos += 1
+                continue
+
+            following = self.peek()
+            if following == '?':
+                self.pos += 1
+                following = self.peek()
+            if following == ':':
+                self.pos += 1
+                value = self.parse_value()
+            elif following == '(' or following == '<':
+                # Method: name(args) { body }
+                while self.peek() not in (None, '{'):
+                    self.skip_balanced()
+                self.skip_balanced()
+                value = UNRESOLVED
+            else:
+                # Shorthand property: { properties }
+                value = Reference([key])
+
+            if key is not None:
+                entries.append(('property', key, value))
+        return ObjectLiteral(entries)
+
+    def parse_array(self):
+        self.pos += 1
+        items = []
+        while self.pos < len(self.tokens):
+            text = self.tokens[self.pos]
+            if text == ']':
+                self.pos += 1
+                break
+            if text == ',':
+                self.pos += 1
+                continue
+            if text in (';', ')', '}'):
+                # Malformed source - end of the array
+                break
+            if text == '...':
+                self.pos += 1
+                items.append(('spread', self.parse_value()))
+            else:
+                items.append(('item', self.parse_value()))
+        return ArrayLiteral(items)
+
+
+class Module:
+    """Declarations, imports and re-exports of one source file"""
+
+    def __init__(self, path):
+        self.path = path
+        self.declarations = {}
+        self.imports = {}
+        self.reexports = {}
+        self.star_exports = []
+        self.resolved = {}
+
+    def resolve_import_path(self, specifier):
+        """Absolute path of a relative import ('./Description' -> Description.ts / index.ts)"""
+        if not specifier.startswith('.'):
+            return None
+        base = os.path.normpath(os.path.join(os.path.dirname(self.path), specifier))
+        for candidate in (base + '.ts', os.path.join(base, 'index.ts'), base):
+            if os.path.isfile(candidate):
+                return candidate
+        return None
+
+
+def parse_module(path):
+    """Scan a source file for top-level constants, class fields and imports"""
+    with open(path, 'r', encoding='utf-8') as f:
+        tokens = tokenize(f.read())
+
+    module = Module(path)
+    parser = Parser(tokens)
+    depth = 0
+
+    while parser.pos < len(tokens):
+        text = tokens[parser.pos]
+
+        if text == 'import' and depth == 0:
+            parse_import(parser, module)
+        elif text == 'export' and parser.peek(1) in ('*', '{') and depth == 0:
+            parse_reexport(parser, module)
+        elif text in ('const', 'let', 'var') and depth == 0 and parser.peek(2) in (':', '='):
+            name = parser.peek(1)
+            parser.pos += 2
+            parser.skip_type()
+            if parser.peek() == '=':
+                parser.pos += 1
+                module.declarations.setdefault(name, parser.parse_value())
+        elif (depth == 1 and parser.peek(1) == ':' and is_name(text)
+              and is_name(parser.peek(2) or '.')):
+            # Class field: description: INodeTypeDescription = { ... }
+            name = text
+            start = parser.pos
+            parser.pos += 2
+            parser.skip_type()
+            if parser.peek() == '=':
+                parser.pos += 1
+                module.declarations.setdefault(name, parser.parse_value())
+            else:
+                parser.pos = start + 1
+        elif text == 'this' and parser.peek(1) == '.' and parser.peek(3) == '=' and parser.peek(4) != '>':
+            # Constructor assignment: this.description = { ...baseDescription, ...versionDescription }
+            name = parser.peek(2)
+            parser.pos += 4
+            module.declarations.setdefault(name, parser.parse_value())
+        elif text in OPENING:
+            depth += 1
+            parser.pos += 1
+        elif text in CLOSING:
+            depth -= 1
+            parser.pos += 1
+        else:
+            parser.pos += 1
+
+    return module
+
+
+def parse_import(parser, module):
+    """import { a, b as c } from './x'; import * as ns from './x'; import x from './x'"""
+    parser.pos += 1
+    names = []
+    while parser.peek() not in (None, 'from', ';'):
+        text = parser.peek()
+        if text == '*' and parser.peek(1) == 'as':
+            names.append(('*', parser.peek(2)))
+            parser.pos += 3
+        elif text == '{':
+            parser.pos += 1
+            while parser.peek() not in (None, '}'):
+                if parser.peek() in (',', 'type'):
+                    parser.pos += 1
+                    continue
+                imported = parser.peek()
+                local = imported
+                parser.pos += 1
+                if parser.peek() == 'as':
+                    local = parser.peek(1)
+                    parser.pos += 2
+                names.append((imported, local))
+            parser.pos += 1
+        else:
+            parser.pos += 1
+
+    if parser.peek() == 'from':
+        parser.pos += 1
+        specifier = parser.peek()
+        parser.pos += 1
+        if specifier and specifier[0] in '\'"':
+            path = module.resolve_import_path(unquote(specifier))
+            for imported, local in names:
+                module.imports[local] = (path, imported)
+
+
+def parse_reexport(parser, module):
+    """export * from './x'; export { a, b as c } from './x'"""
+    parser.pos += 1
+    names = []
+    if parser.peek() == '*':
+        parser.pos += 1
+    else:
+        parser.pos += 1
+        while parser.peek() not in (None, '}'):
+            if parser.peek() == ',':
+                parser.pos += 1
+                continue
+            exported = local = parser.peek()
+            parser.pos += 1
+            if parser.peek() == 'as':
+                exported = parser.peek(1)
+                parser.pos += 2
+            names.append((local, exported))
+        parser.pos += 1
+
+    if parser.peek() != 'from':
+        # export { a, b } without source only re-exports local declarations
+        return
+    parser.pos += 1
+    specifier = parser.peek()
+    parser.pos += 1
+    if not specifier or specifier[0] not in '\'"':
+        return
+    path = module.resolve_import_path(unquote(specifier))
+    if names:
+        for local, exported in names:
+            module.reexports[exported] = (path, local)
+    else:
+        module.star_exports.append(path)
+
+
+class Resolver:
+    """Evaluates parsed values across modules (one instance per worker process)"""
+
+    def __init__(self):
+        self.modules = {}
+        self.resolving = set()
+
+    def module(self, path):
+        module = self.modules.get(path)
+        if module is None:
+            try:
+                module = parse_module(path)
+            except (OSError, UnicodeDecodeError):
+                module = Module(path)
+            self.modules[path] = module
+        return module
+
+    def lookup(self, module, name):
+        """Value of a name visible in module (declaration or import)"""
+        if name in module.declarations:
+            return self.declaration(module, name)
+        if name in module.imports:
+            path, imported = module.imports[name]
+            if path is None:
+                return UNRESOLVED
+            if imported == '*':
+                return self.module(path)
+            return self.export(self.module(path), imported)
+        return UNRESOLVED
+
+    def declaration(self, module, name):
+        if name in module.resolved:
+            return module.resolved[name]
+        key = (module.path, name)
+        if key in self.resolving:
+            return UNRESOLVED
+        self.resolving.add(key)
+        try:
+            value = self.resolve(module.declarations[name], module)
+        finally:
+            self.resolving.discard(key)
+        module.resolved[name] = value
+        return value
+
+    def export(self, module, name, seen=None):
+        if name in module.declarations or name in module.imports:
+            return self.lookup(module, name)
+        if name in module.reexports:
+            path, local = module.reexports[name]
+            return self.export(self.module(path), local) if path else UNRESOLVED
+
+        seen = seen or set()
+        seen.add(module.path)
+        for path in module.star_exports:
+            if path and path not in seen:
+                value = self.export(self.module(path), name, seen)
+                if value is not UNRESOLVED:
+                    return value
+        return UNRESOLVED
+
+    def resolve(self, value, module):
+        if value is None or isinstance(value, (str, int, float)):
+            return value
+        if isinstance(value, ObjectLiteral):
+            result = {}
+            for entry in value.entries:
+                if entry[0] == 'spread':
+                    spread = self.resolve(entry[1], module)
+                    if isinstance(spread, dict):
+                        result.update(spread)
+                else:
+                    result[entry[1]] = self.resolve(entry[2], module)
+            return result
+
+        if isinstance(value, ArrayLiteral):
+            result = []
+            for kind, item in value.items:
+                item = self.resolve(item, module)
+                if kind == 'spread':
+                    if isinstance(item, list):
+                        result.extend(item)
+                else:
+                    result.append(item)
+            return result
+
+        if isinstance(value, Reference):
+            return self.member(self.lookup(module, value.parts[0]), value.parts[1:])
+
+        if isinstance(value, Call):
+            return self.call(value, module)
+
+        return value
+
+    def member(self, value, parts):
+        for part in parts:
+            if isinstance(value, Module):
+                value = self.export(value, part)
+            elif isinstance(value, dict):
+                value = value.get(part, UNRESOLVED)
+            else:
+                return UNRESOLVED
+        return value
+
+    def call(self, value, module):
+        """Only updateDisplayOptions() is evaluated (used by the versioned router nodes)"""
+        if value.parts[-1] != 'updateDisplayOptions' or len(value.args) != 2:
+            return UNRESOLVED
+
+        display_options = self.resolve(value.args[0], module)
+        properties = self.resolve(value.args[1], module)
+        if not isinstance(display_options, dict) or not isinstance(properties, list):
+            return UNRESOLVED
+
+        updated = []
+        for prop in properties:
+            if not isinstance(prop, dict):
+                continue
+            prop = dict(prop)
+            merged = {}
+            for key in ('show', 'hide'):
+                own = display_conditions(prop.get('displayOptions'), key)
+                extra = display_conditions(display_options, key)
+                if own or extra:
+                    merged[key] = dict(own, **extra)
+            prop['displayOptions'] = merged
+            updated.append(prop)
+        return updated
+
+
+_resolver = None
+
+
+def get_resolver():
+    """Resolver of the current process - keeps parsed description files cached"""
+    global _resolver
+    if _resolver is None:
+        _resolver = Resolver()
+    return _resolver
+
+
+def node_name_from_path(path):
+    """Fallback node name: GmailV2.node.ts -> gmail"""
+    stem = os.path.basename(path).split('.')[0]
+    stem = re.sub(r'V\d+$', '', stem)
+    return stem[:1].lower() + stem[1:]
+
+
+def display_conditions(display_options, key):
+    """show / hide conditions of a displayOptions value ({} if missing or not resolvable)"""
+    if not isinstance(display_options, dict):
+        return {}
+    conditions = display_options.get(key)
+    return conditions if isinstance(conditions, dict) else {}
+
+
+def resolved_list(value):
+    """value if it resolved to a list, else []"""
+    return value if isinstance(value, list) else []
+
+
+def string_values(values):
+    if not isinstance(values, list):
+        return []
+    return [value for value in values if isinstance(value, str)]
+
+
+def option_values(prop):
+    """Possible values of an options field, or the sub-field names of a collection"""
+    options = prop.get('options')
+    if not isinstance(options, list):
+        return None
+    values = []
+    for option in options:
+        if not isinstance(option, dict):
+            continue
+        if 'value' in option and not isinstance(option['value'], Unresolved):
+            values.append(option['value'])
+        elif isinstance(option.get('name'), str):
+            values.append(option['name'])
+    return values or None
+
+
+def plain(value):
+    """JSON-compatible copy of a resolved value (unresolved parts become None)"""
+    if isinstance(value, dict):
+        return {key: plain(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [plain(item) for item in value]
+    if isinstance(value, (Unresolved, Module)):
+        return None
+    return value
+
+
+def text(value):
+    return value if isinstance(value, str) else None
+
+
+def build_node_details(description, path):
+    """
+    Rows for node_operations, node_parameters and node_credentials
+    from a resolved INodeTypeDescription
+
+    Parameters are stored for each resource/operation pair that exists and
+    that displayOptions.show allows; pairs excluded by displayOptions.hide
+    resource/operation lists are dropped. Other show/hide conditions
+    (authentication, @version, other fields) are not evaluated.
+    """
+    name = description.get('name')
+    if not isinstance(name, str):
+        name = node_name_from_path(path)
+    node_type = f'n8n-nodes-base.{name}'
+
+    version = description.get('defaultVersion', description.get('version'))
+    if isinstance(version, list):
+        version = max((v for v in version if isinstance(v, (int, float))), default=1)
+    if not isinstance(version, (int, float)):
+        version = 1
+
+    properties = [prop for prop in resolved_list(description.get('properties')) if isinstance(prop, dict)]
+
+    resources = []
+    for prop in properties:
+        if prop.get('name') == 'resource':
+            for value in option_values(prop) or []:
+                if isinstance(value, str) and value not in resources:
+                    resources.append(value)
+
+    # (resource, operation) -> description, in declaration order
+    operations = {}
+    for prop in properties:
+        if prop.get('name') != 'operation' or not isinstance(prop.get('options'), list):
+            continue
+        show = display_conditions(prop.get('displayOptions'), 'show')
+        for resource in string_values(show.get('resource')) or [None]:
+            for option in prop['options']:
+                if isinstance(option, dict) and isinstance(option.get('value'), str):
+                    operations.setdefault((resource, option['value']), text(
+                        option.get('description')) or text(option.get('action')) or text(option.get('name')))
+
+    operations_by_resource = {}
+    for resource, operation in operations:
+        operations_by_resource.setdefault(resource, []).append(operation)
+
+    # (resource, operation, name) -> row; the first definition wins
+    parameters = {}
+    for prop in properties:
+        param_name = prop.get('name')
+        if not isinstance(param_name, str) or param_name in ('resource', 'operation') or prop.get('type') == 'notice':
+            continue
+
+        show = display_conditions(prop.get('displayOptions'), 'show')
+        hide = display_conditions(prop.get('displayOptions'), 'hide')
+        prop_resources = string_values(show.get('resource')) or resources or [None]
+        prop_operations = string_values(show.get('operation'))
+        hidden_resources = string_values(hide.get('resource'))
+        hidden_operations = string_values(hide.get('operation'))
+
+        options = option_values(prop)
+        default = prop.get('default')
+        row = (
+            text(prop.get('type')),
+            bool(prop.get('required') is True),
+            None if isinstance(default, Unresolved) else json.dumps(plain(default), ensure_ascii=False),
+            text(prop.get('description')) or text(prop.get('displayName')),
+            json.dumps(plain(options), ensure_ascii=False) if options else None
+        )
+
+        for resource in prop_resources:
+            if resource in hidden_resources:
+                continue
+            known_operations = operations_by_resource.get(resource)
+            if not prop_operations:
+                resource_operations = known_operations or [None]
+            elif known_operations:
+                # Only pairs that exist, e.g. not 'get' for a resource without it
+                resource_operations = [op for op in prop_operations if op in known_operations]
+            elif operations:
+                # The node has operations, but none for this resource
+                resource_operations = []
+            else:
+                resource_operations = prop_operations
+
+            for operation in resource_operations:
+                if operation not in hidden_operations:
+                    parameters.setdefault((resource, operation, param_name), row)
+
+    credentials = {}
+    for credential in resolved_list(description.get('credentials')):
+        if isinstance(credential, dict) and isinstance(credential.get('name'), str):
+            credentials.setdefault(credential['name'], bool(credential.get('required') is True))
+
+    return {
+        'node_type': node_type,
+        'version': version,
+        'file': path,
+        'operations': [(resource, operation, desc) for (resource, operation), desc in operations.items()],
+        'parameters': [key + row for key, row in parameters.items()],
+        'credentials': list(credentials.items())
+    }
+
+
+def parse_node_file(path):
+    """
+    Node details of one .node.ts file, or None if it has no description
+    Module-level entry point for the process pool
+    """
+    path = os.path.abspath(str(path))
+    resolver = get_resolver()
+    if len(resolver.modules) > MODULE_CACHE_SIZE:
+        resolver.modules.clear()
+
+    try:
+        module = resolver.module(path)
+        for name in DESCRIPTION_NAMES:
+            if name in module.declarations:
+                description = resolver.declaration(module, name)
+                if isinstance(description, dict) and (description.get('properties') or description.get('name')):
+                    return build_node_details(description, path)
+    except Exception as e:
+        # One unparseable file must not abort the whole process pool run
+        print(f"❌ Error processing {path}: {type(e).__name__}: {e}")
+    return None
@@ -0,0 +1,36 @@
+import type { INodeTypeDescription } from 'n8n-workflow';
+
+const versionDescription: INodeTypeDescription = {
+	displayName: 'Gmail',
+	name: 'gmail',
+	version: 1,
+	credentials: [{ name: 'gmailOAuth2', required: true }],
+	properties: [
+		{
+			displayName: 'Resource',
+			name: 'resource',
+			type: 'options',
+			options: [{ name: 'Message', value: 'message' }],
+			default: 'message',
+		},
+		{
+			displayName: 'Operation',
+			name: 'operation',
+			type: 'options',
+			displayOptions: { show: { resource: ['message'] } },
+			options: [{ name: 'Send', value: 'send', description: 'Old send' }],
+			default: 'send',
+		},
+	],
+};
+
+export class GmailV1 implements INodeType {
+	description: INodeTypeDescription;
+
+	constructor(baseDescription: INodeTypeBaseDescription) {
+		this.description = {
+			...baseDescription,
+			...versionDescription,
+		};
+	}
+}
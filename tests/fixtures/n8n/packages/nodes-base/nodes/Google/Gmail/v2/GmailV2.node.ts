@@ -0,0 +1,24 @@
+import type { IExecuteFunctions, INodeType, INodeTypeBaseDescription, INodeTypeDescription } from 'n8n-workflow';
+import { versionDescription } from './actions/versionDescription';
+import { router } from './actions/router';
+
+export class GmailV2 implements INodeType {
+	description: INodeTypeDescription;
+
+	constructor(baseDescription: INodeTypeBaseDescription) {
+		this.description = {
+			...baseDescription,
+			...versionDescription,
+		};
+	}
+
+	methods = { loadOptions: { async getLabels(this: ILoadOptionsFunctions) { return []; } } };
+
+	async execute(this: IExecuteFunctions) {
+		const items = this.getInputData();
+		if (items.length === 0 && /['"{]/.test('x')) {
+			return [[]];
+		}
+		return await router.call(this);
+	}
+}
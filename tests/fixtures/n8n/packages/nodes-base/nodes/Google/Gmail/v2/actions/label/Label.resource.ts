@@ -0,0 +1,32 @@
+import type { INodeProperties } from 'n8n-workflow';
+
+export const description: INodeProperties[] = [
+	{
+		displayName: 'Operation',
+		name: 'operation',
+		type: 'options',
+		displayOptions: { show: { resource: ['label'] } },
+		options: [
+			{ name: 'Create', value: 'create', action: 'Create a label' },
+			{ name: 'Delete', value: 'delete', action: 'Delete a label' },
+		],
+		default: 'create',
+	},
+	{
+		displayName: 'Name',
+		name: 'name',
+		type: 'string',
+		default: '',
+		required: true,
+		displayOptions: { show: { resource: ['label'], operation: ['create'] } },
+		description: 'Label Name',
+	},
+	{
+		displayName: 'Label ID',
+		name: 'labelId',
+		type: 'string',
+		default: '',
+		required: true,
+		displayOptions: { show: { resource: ['label'], operation: ['delete'] } },
+	},
+];
@@ -0,0 +1,31 @@
+import type { INodeProperties } from 'n8n-workflow';
+import * as send from './send.operation';
+import * as get from './get.operation';
+
+export { send, get };
+
+export const description: INodeProperties[] = [
+	{
+		displayName: 'Operation',
+		name: 'operation',
+		type: 'options',
+		noDataExpression: true,
+		displayOptions: {
+			show: {
+				resource: ['message'],
+			},
+		},
+		options: [
+			{
+				name: 'Send',
+				value: 'send',
+				description: 'Send a message',
+				action: 'Send a message',
+			},
+			{ name: 'Get', value: 'get', description: 'Get a message', action: 'Get a message' },
+		],
+		default: 'send',
+	},
+	...send.description,
+	...get.description,
+];
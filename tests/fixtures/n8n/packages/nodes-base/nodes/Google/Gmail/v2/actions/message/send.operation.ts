@@ -0,0 +1,62 @@
+import type { IExecuteFunctions, INodeExecutionData, INodeProperties } from 'n8n-workflow';
+import { updateDisplayOptions } from '@utils/utilities';
+import { appendAttributionOption } from '../../../../../../utils/descriptions';
+
+export const properties: INodeProperties[] = [
+	{
+		displayName: 'To',
+		name: 'sendTo',
+		type: 'string',
+		default: '',
+		required: true,
+		placeholder: 'info@example.com',
+		description: "The email addresses of the recipients. Multiple addresses can be separated by a comma. e.g. jay@getsby.com, jon@smith.com.",
+	},
+	{
+		displayName: 'Subject',
+		name: 'subject',
+		type: 'string',
+		default: '',
+		required: true,
+		placeholder: 'Hello World!',
+	},
+	{
+		displayName: 'Email Type',
+		name: 'emailType',
+		type: 'options',
+		default: 'html',
+		required: true,
+		noDataExpression: true,
+		options: [
+			{ name: 'HTML', value: 'html' },
+			{ name: 'Text', value: 'text' },
+		],
+	},
+	{
+		displayName: 'Options',
+		name: 'options',
+		type: 'collection',
+		placeholder: 'Add option',
+		default: {},
+		options: [
+			appendAttributionOption,
+			{ displayName: 'BCC', name: 'bccList', type: 'string', default: '' },
+			{ displayName: 'CC', name: 'ccList', type: 'string', default: '' },
+		],
+	},
+];
+
+const displayOptions = {
+	show: {
+		resource: ['message'],
+		operation: ['send'],
+	},
+};
+
+export const description = updateDisplayOptions(displayOptions, properties);
+
+export async function execute(this: IExecuteFunctions, index: number) {
+	const options = this.getNodeParameter('options', index, {});
+	const to = `${options.x}`;
+	return [{ json: { to } }] as INodeExecutionData[];
+}
@@ -0,0 +1,54 @@
+/* eslint-disable n8n-nodes-base/node-filename-against-convention */
+import { NodeConnectionTypes, type INodeTypeDescription } from 'n8n-workflow';
+import * as message from './message/Message.resource';
+import * as label from './label/Label.resource';
+
+export const versionDescription: INodeTypeDescription = {
+	displayName: 'Gmail',
+	name: 'gmail',
+	icon: 'file:gmail.svg',
+	group: ['transform'],
+	version: [2, 2.1],
+	subtitle: '={{$parameter["operation"] + ": " + $parameter["resource"]}}',
+	description: 'Consume the Gmail API',
+	defaults: { name: 'Gmail' },
+	inputs: [NodeConnectionTypes.Main],
+	outputs: [NodeConnectionTypes.Main],
+	credentials: [
+		{
+			name: 'googleApi',
+			required: true,
+			displayOptions: { show: { authentication: ['serviceAccount'] } },
+		},
+		{
+			name: 'gmailOAuth2',
+			required: true,
+			displayOptions: { show: { authentication: ['oAuth2'] } },
+		},
+	],
+	properties: [
+		{
+			displayName: 'Authentication',
+			name: 'authentication',
+			type: 'options',
+			options: [
+				{ name: 'OAuth2 (recommended)', value: 'oAuth2' },
+				{ name: 'Service Account', value: 'serviceAccount' },
+			],
+			default: 'oAuth2',
+		},
+		{
+			displayName: 'Resource',
+			name: 'resource',
+			type: 'options',
+			noDataExpression: true,
+			options: [
+				{ name: 'Message', value: 'message' },
+				{ name: 'Label', value: 'label' },
+			],
+			default: 'message',
+		},
+		...message.description,
+		...label.description,
+	],
+};
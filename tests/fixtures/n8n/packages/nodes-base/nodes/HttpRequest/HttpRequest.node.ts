@@ -0,0 +1,45 @@
+import { INodeType, INodeTypeDescription } from 'n8n-workflow';
+
+export class HttpRequest implements INodeType {
+	description: INodeTypeDescription = {
+		displayName: 'HTTP Request',
+		name: 'httpRequest',
+		group: ['output'],
+		version: [1, 2, 3],
+		properties: [
+			{
+				displayName: 'Method',
+				name: 'method',
+				type: 'options',
+				options: [
+					{ name: 'DELETE', value: 'DELETE' },
+					{ name: 'GET', value: 'GET' },
+					{ name: 'POST', value: 'POST' },
+				],
+				default: 'GET',
+				description: 'The request method to use',
+			},
+			{
+				displayName: 'URL',
+				name: 'url',
+				type: 'string',
+				default: '',
+				required: true,
+				description: 'The URL to make the request to',
+			},
+			{
+				displayName: 'Timeout',
+				name: 'timeout',
+				type: 'number',
+				default: 10000,
+				typeOptions: { minValue: -1 },
+			},
+			{
+				displayName: 'Note',
+				name: 'notice',
+				type: 'notice',
+				default: '',
+			},
+		],
+	};
+}
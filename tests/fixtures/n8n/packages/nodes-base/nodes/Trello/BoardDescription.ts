@@ -0,0 +1,153 @@
+import type { INodeProperties } from 'n8n-workflow';
+
+import { boardRLC } from '@utils/descriptions';
+
+export const boardOperations: INodeProperties[] = [
+	{
+		displayName: 'Operation',
+		name: 'operation',
+		type: 'options',
+		noDataExpression: true,
+		displayOptions: {
+			show: {
+				resource: ['board'],
+			},
+		},
+		options: [
+			{
+				name: 'Create',
+				value: 'create',
+				description: 'Create a new board',
+				action: 'Create a board',
+			},
+			{
+				name: 'Get',
+				value: 'get',
+				description: 'Get the data of a board',
+				action: 'Get a board',
+			},
+		],
+		default: 'create',
+	},
+];
+
+export const boardFields: INodeProperties[] = [
+	// ----------------------------------
+	//         board:create
+	// ----------------------------------
+	{
+		displayName: 'Name',
+		name: 'name',
+		type: 'string',
+		default: '',
+		placeholder: 'My board',
+		required: true,
+		displayOptions: {
+			show: {
+				operation: ['create'],
+				resource: ['board'],
+			},
+		},
+		description: 'The name of the board',
+	},
+	{
+		displayName: 'Board ID',
+		name: 'id',
+		type: 'resourceLocator',
+		default: { mode: 'list', value: '' },
+		required: true,
+		modes: [
+			{
+				displayName: 'From List',
+				name: 'list',
+				type: 'list',
+				typeOptions: { searchListMethod: 'searchBoards', searchFilterRequired: false },
+			},
+			{
+				displayName: 'By URL',
+				name: 'url',
+				type: 'string',
+				validation: [
+					{
+						type: 'regex',
+						properties: {
+							regex: 'http(s)?://trello.com/b/([a-zA-Z0-9]{2,})/.*',
+							errorMessage: 'Not a valid Trello Board URL',
+						},
+					},
+				],
+				extractValue: { type: 'regex', regex: 'https://trello.com/b/([a-zA-Z0-9]{2,})' },
+			},
+		],
+		displayOptions: {
+			show: {
+				operation: ['get'],
+				resource: ['board'],
+			},
+		},
+	},
+	{
+		displayName: 'Additional Fields',
+		name: 'additionalFields',
+		type: 'collection',
+		placeholder: 'Add Field',
+		displayOptions: { show: { resource: ['board'] } },
+		default: {},
+		options: [
+			{ displayName: 'Fields', name: 'fields', type: 'string', default: 'all' },
+			{ displayName: 'Limit', name: 'limit', type: 'number', default: 50, typeOptions: { minValue: 1, maxValue: 1000 } },
+		],
+	},
+	{
+		displayName: 'Include Members',
+		name: 'includeMembers',
+		type: 'boolean',
+		default: false,
+		displayOptions: {
+			show: {
+				operation: ['get'],
+			},
+		},
+	},
+	{
+		displayName: 'Simplify',
+		name: 'simplify',
+		type: 'boolean',
+		default: true,
+		displayOptions: {
+			hide: {
+				operation: ['create'],
+			},
+		},
+	},
+	{
+		displayName: 'Board',
+		name: 'board',
+		type: 'resourceLocator',
+		default: { mode: 'list', value: '' },
+		displayOptions: boardRLC.displayOptions,
+	},
+];
+
+export const cardOperations: INodeProperties[] = [
+	{
+		displayName: 'Operation',
+		name: 'operation',
+		type: 'options',
+		noDataExpression: true,
+		displayOptions: {
+			show: {
+				resource: ['card'],
+			},
+		},
+		options: [
+			{
+				name: 'Create',
+				value: 'create',
+				description: 'Create a new card',
+				action: 'Create a card',
+			},
+		],
+		default: 'create',
+	},
+];
@@ -0,0 +1,82 @@
+import type {
+	IExecuteFunctions,
+	INodeType,
+	INodeTypeDescription,
+} from 'n8n-workflow';
+import { NodeApiError } from 'n8n-workflow';
+
+import { boardFields, boardOperations, cardOperations } from './BoardDescription';
+import { trelloApiRequest } from './GenericFunctions';
+
+export class Trello implements INodeType {
+	description: INodeTypeDescription = {
+		displayName: 'Trello',
+		name: 'trello',
+		// eslint-disable-next-line n8n-nodes-base/node-class-description-icon-not-svg
+		icon: 'file:trello.png',
+		group: ['transform'],
+		version: 1,
+		subtitle: '={{$parameter["operation"] + ": " + $parameter["resource"]}}',
+		description: 'Create, change and delete boards and cards',
+		defaults: {
+			name: 'Trello',
+		},
+		usableAsTool: true,
+		inputs: ['main'],
+		outputs: ['main'],
+		credentials: [
+			{
+				name: 'trelloApi',
+				required: true,
+			},
+		],
+		properties: [
+			{
+				displayName: 'Resource',
+				name: 'resource',
+				type: 'options',
+				noDataExpression: true,
+				options: [
+					{
+						name: 'Board',
+						value: 'board',
+					},
+					{
+						name: 'Card',
+						value: 'card',
+					},
+				],
+				default: 'board',
+			},
+
+			// ----------------------------------
+			//         operations
+			// ----------------------------------
+			...boardOperations,
+			...cardOperations,
+
+			// ----------------------------------
+			//         fields
+			// ----------------------------------
+			...boardFields,
+		],
+	};
+
+	methods = {
+		listSearch: {
+			searchBoards,
+		},
+	};
+
+	async execute(this: IExecuteFunctions): Promise<INodeExecutionData[][]> {
+		const items = this.getInputData();
+		const returnData = [];
+		for (let i = 0; i < items.length; i++) {
+			const description = 'not the node description';
+			if (i > 0 && items[i].json !== undefined) {
+				throw new NodeApiError(this.getNode(), { message: `Item ${i}` });
+			}
+		}
+		return [returnData];
+	}
+}
@@ -0,0 +1,8 @@
+import type { INodeProperties } from 'n8n-workflow';
+
+export const appendAttributionOption: INodeProperties = {
+	displayName: 'Append n8n Attribution',
+	name: 'appendAttribution',
+	type: 'boolean',
+	default: true,
+};
@@ -0,0 +1,36 @@
+"""
+Tests for scripts/bounded_map.py
+"""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from bounded_map import bounded_map  # noqa: E402
+
+
+def test_results_come_in_input_order():
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        assert list(bounded_map(executor, lambda n: n * n, range(100), window=3, chunksize=4)) == [
+            n * n for n in range(100)
+        ]
+
+
+def test_input_is_read_only_as_far_as_the_window_allows():
+    read = []
+
+    def items():
+        for n in range(1000):
+            read.append(n)
+            yield n
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = bounded_map(executor, lambda n: n * n, items(), window=3, chunksize=5)
+        assert next(results) == 0
+        # window chunks of chunksize items are read before the first result
+        assert len(read) == 3 * 5
+
+        assert sum(1 for _ in results) == 999
+        assert len(read) == 1000
@@ -0,0 +1,99 @@
+"""
+Tests for the FTS5 search index triggers of scripts/extend_database_schema.py
+"""
+
+import shutil
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from extend_database_schema import SEARCH_SOURCE_SLOTS, SEARCH_SOURCES, create_search_index  # noqa: E402
+
+SHIPPED_DB = Path(__file__).resolve().parent.parent / 'data' / 'n8n_docs.db'
+
+
+@pytest.fixture
+def conn(tmp_path):
+    db_path = tmp_path / 'n8n_docs.db'
+    shutil.copy(SHIPPED_DB, db_path)
+    create_search_index(str(db_path))
+    conn = sqlite3.connect(db_path)
+    yield conn
+    conn.close()
+
+
+def index_rows(conn, node_type):
+    return conn.execute(
+        "SELECT rowid, description FROM node_search_fts WHERE node_type = ? AND source = 'API'", (node_type,)
+    ).fetchall()
+
+
+def assert_index_in_sync(conn):
+    expected = set()
+    for table, code, type_col, *_, row_filter in SEARCH_SOURCES:
+        expected.update(
+            (row_id * SEARCH_SOURCE_SLOTS + code, node_type)
+            for row_id, node_type in conn.execute(
+                f"SELECT id, {type_col} FROM {table} WHERE {row_filter.format(row='')}"
+            )
+        )
+    assert set(conn.execute('SELECT rowid, node_type FROM node_search_fts')) == expected
+
+
+def insert_node(conn, verb, node_type, description):
+    conn.execute(f'''
+        {verb} INTO node_types_api (node_type, display_name, description, version, icon, category, scraped_at)
+        VALUES (?, 'Gmail', ?, '2', NULL, 'App', NULL)
+    ''', (node_type, description))
+
+
+def test_insert_or_replace_replaces_the_index_row(conn):
+    insert_node(conn, 'INSERT OR REPLACE', 'n8n-nodes-base.gmail', 'Replaced description')
+
+    row_id = conn.execute("SELECT id FROM node_types_api WHERE node_type = 'n8n-nodes-base.gmail'").fetchone()[0]
+    assert index_rows(conn, 'n8n-nodes-base.gmail') == [(row_id * SEARCH_SOURCE_SLOTS + 1, 'Replaced description')]
+    assert_index_in_sync(conn)
+
+
+def test_ignored_and_failed_inserts_keep_the_index_row(conn):
+    before = index_rows(conn, 'n8n-nodes-base.gmail')
+    assert len(before) == 1
+
+    insert_node(conn, 'INSERT OR IGNORE', 'n8n-nodes-base.gmail', 'Ignored')
+    with pytest.raises(sqlite3.IntegrityError):
+        insert_node(conn, 'INSERT', 'n8n-nodes-base.gmail', 'Duplicate')
+
+    assert index_rows(conn, 'n8n-nodes-base.gmail') == before
+    assert_index_in_sync(conn)
+
+
+def test_update_and_delete(conn):
+    conn.execute("UPDATE node_types_api SET description = 'Updated' WHERE node_type = 'n8n-nodes-base.gmail'")
+    assert [description for _, description in index_rows(conn, 'n8n-nodes-base.gmail')] == ['Updated']
+
+    conn.execute("UPDATE node_types_api SET node_type = 'n8n-nodes-base.gmailRenamed' WHERE node_type = 'n8n-nodes-base.gmail'")
+    insert_node(conn, 'INSERT OR REPLACE', 'n8n-nodes-base.gmailRenamed', 'Replaced after rename')
+    assert [description for _, description in index_rows(conn, 'n8n-nodes-base.gmailRenamed')] == ['Replaced after rename']
+
+    conn.execute("DELETE FROM node_types_api WHERE node_type = 'n8n-nodes-base.gmailRenamed'")
+    assert index_rows(conn, 'n8n-nodes-base.gmailRenamed') == []
+    assert_index_in_sync(conn)
+
+
+def test_removed_community_packages_leave_the_index(conn):
+    package = conn.execute('SELECT package_name FROM community_nodes ORDER BY id LIMIT 1').fetchone()[0]
+
+    def indexed():
+        return conn.execute(
+            "SELECT COUNT(*) FROM node_search_fts WHERE node_type = ? AND source = 'npm'", (package,)
+        ).fetchone()[0]
+
+    assert indexed() == 1
+    conn.execute("UPDATE community_nodes SET removed_at = CURRENT_TIMESTAMP WHERE package_name = ?", (package,))
+    assert indexed() == 0
+    conn.execute("UPDATE community_nodes SET removed_at = NULL WHERE package_name = ?", (package,))
+    assert indexed() == 1
@@ -0,0 +1,115 @@
+"""
+Tests for the streaming AI export of scripts/extract_node_details.py on a small fixture database
+"""
+
+import gzip
+import json
+import sys
+import zlib
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from extract_node_details import NodeDetailsExtractor  # noqa: E402
+
+SHARDS = 3
+
+
+def node_type(i):
+    return f'n8n-nodes-base.node{i:02d}'
+
+
+def node_details(i):
+    """Up to three message operations with one parameter each, every other node an auth parameter"""
+    operations = [('message', name, f'{name} a message') for name in ('send', 'get', 'delete')[:i % 4]]
+    parameters = [('message', name, 'messageId', 'string', 1, None, 'ID', None) for _, name, _ in operations]
+    if i % 2:
+        parameters.append((None, None, 'authentication', 'options', 0, json.dumps('oAuth2'), 'Auth',
+                           json.dumps(['oAuth2', 'serviceAccount'])))
+    credentials = [('gmailOAuth2', 1)] if i % 3 == 0 else []
+    return {'node_type': node_type(i), 'operations': operations, 'parameters': parameters,
+            'credentials': credentials}
+
+
+def expected_record(i):
+    details = node_details(i)
+    message_id = {'name': 'messageId', 'type': 'string', 'required': True, 'default': None,
+                  'description': 'ID', 'options': None}
+    return {
+        'node_type': node_type(i),
+        'operations': [
+            {'resource': resource, 'operation': name, 'description': description, 'parameters': [message_id]}
+            for resource, name, description in sorted(details['operations'])
+        ],
+        'parameters': [
+            {'name': 'authentication', 'type': 'options', 'required': False, 'default': 'oAuth2',
+             'description': 'Auth', 'options': ['oAuth2', 'serviceAccount']}
+        ] if i % 2 else [],
+        'credentials': [{'type': 'gmailOAuth2', 'required': True}] if i % 3 == 0 else [],
+        'examples': [{'workflow': {'nodes': []}, 'description': 'Send mail', 'use_case': 'email'}] if i == 4 else []
+    }
+
+
+@pytest.fixture
+def extractor(tmp_path, monkeypatch):
+    # The extractor opens ../n8n_docs.db relative to the scripts folder
+    scripts_dir = tmp_path / 'scripts'
+    scripts_dir.mkdir()
+    monkeypatch.chdir(scripts_dir)
+    extractor = NodeDetailsExtractor()
+
+    # Saved out of order - the export sorts by node_type
+    extractor.save_node_details([node_details(i) for i in reversed(range(20))])
+    extractor.conn.execute('''
+        INSERT INTO example_workflows (node_type, workflow_json, description, use_case)
+        VALUES (?, ?, ?, ?)
+    ''', (node_type(4), json.dumps({'nodes': []}), 'Send mail', 'email'))
+    extractor.conn.commit()
+    yield extractor
+    extractor.conn.close()
+
+
+def read_jsonl(path, compressed):
+    opener = gzip.open if compressed else open
+    with opener(path, 'rt', encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+def test_sharded_gzip_export_contains_every_node_once(extractor, tmp_path):
+    paths = extractor.export_for_ai(str(tmp_path / 'output' / 'nodes.jsonl'), shards=SHARDS, compression='gzip')
+
+    assert paths == [str(tmp_path / 'output' / f'nodes-{i:05d}-of-{SHARDS:05d}.jsonl.gz')
+                     for i in range(1, SHARDS + 1)]
+
+    # Without node_types_api only nodes with extracted details are exported
+    exported = [i for i in range(20)
+                if any(node_details(i)[key] for key in ('operations', 'parameters', 'credentials'))]
+    assert len(exported) == 17
+
+    expected_shards = [[] for _ in range(SHARDS)]
+    for i in exported:
+        expected_shards[zlib.crc32(node_type(i).encode('utf-8')) % SHARDS].append(expected_record(i))
+
+    shards = [read_jsonl(path, compressed=True) for path in paths]
+    assert [len(records) for records in shards] == [len(records) for records in expected_shards]
+    assert all(shards)
+    assert shards == expected_shards
+
+
+def test_export_lists_api_nodes_without_details_and_skips_unlisted_ones(extractor, tmp_path):
+    # node_types_api decides which nodes are exported
+    listed = [node_type(i) for i in (1, 4, 7)] + ['n8n-nodes-base.aaa', 'n8n-nodes-base.zzz']
+    extractor.conn.execute('CREATE TABLE node_types_api (node_type TEXT)')
+    extractor.conn.executemany('INSERT INTO node_types_api VALUES (?)', [(name,) for name in listed])
+    extractor.conn.commit()
+
+    [path] = extractor.export_for_ai(str(tmp_path / 'nodes.jsonl'))
+
+    empty = {'operations': [], 'parameters': [], 'credentials': [], 'examples': []}
+    assert read_jsonl(path, compressed=False) == (
+        [dict(empty, node_type='n8n-nodes-base.aaa')]
+        + [expected_record(i) for i in (1, 4, 7)]
+        + [dict(empty, node_type='n8n-nodes-base.zzz')]
+    )
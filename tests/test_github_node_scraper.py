@@ -0,0 +1,120 @@
+"""
+Tests for the Git Tree crawl and tarball import of scripts/github_node_scraper.py against a local fixture server
+"""
+
+import io
+import json
+import posixpath
+import sys
+import tarfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from github_node_scraper import GitHubNodeScraper  # noqa: E402
+from http_cache import HttpCache  # noqa: E402
+
+NODES_PATH = 'packages/nodes-base/nodes'
+CONTENTS = '/api/repos/n8n-io/n8n/contents/'
+
+
+def node_files(count=40):
+    """.node.json and .node.ts per node, every fourth node in a nested Google/ folder"""
+    files = {}
+    for i in range(count):
+        folder = f'{NODES_PATH}/Google/G{i}' if i % 4 == 0 else f'{NODES_PATH}/N{i}'
+        files[f'{folder}/N{i}.node.json'] = json.dumps({
+            'node': f'n8n-nodes-base.n{i}', 'displayName': f'N {i}', 'description': f'Node {i}',
+            'version': i % 3 + 1
+        })
+        files[f'{folder}/N{i}.node.ts'] = 'export class Node {}'
+    return files
+
+
+def serve_repository(fixture_server, files):
+    """Contents API for every folder, Git Tree API for the nodes folder and raw downloads"""
+    folders = {}
+    for path in files:
+        parts = path.split('/')
+        for depth in range(1, len(parts)):
+            folder, name = '/'.join(parts[:depth]), parts[depth]
+            kind = 'file' if depth == len(parts) - 1 else 'dir'
+            folders.setdefault(folder, {})[name] = {
+                'name': name, 'type': kind, 'path': f'{folder}/{name}', 'sha': f'sha-{folder}/{name}'
+            }
+    for folder, entries in folders.items():
+        listing = json.dumps([entries[name] for name in sorted(entries)])
+        fixture_server.routes[f'{CONTENTS}{folder}'] = (200, {}, listing)
+        fixture_server.routes[f'{CONTENTS}{folder}?ref=master'] = (200, {}, listing)
+
+    tree = [{'path': posixpath.relpath(path, NODES_PATH), 'type': 'blob'} for path in files]
+    fixture_server.routes[f'/api/repos/n8n-io/n8n/git/trees/sha-{NODES_PATH}?recursive=1'] = (
+        200, {}, json.dumps({'sha': f'sha-{NODES_PATH}', 'tree': tree, 'truncated': False})
+    )
+    for path, content in files.items():
+        fixture_server.routes[f'/raw/n8n-io/n8n/master/{path}'] = (200, {}, content)
+
+
+def make_scraper(tmp_path, fixture_server, name):
+    scraper = GitHubNodeScraper(str(tmp_path / name), http_cache=HttpCache(str(tmp_path / f'{name}.cache')),
+                                max_workers=8)
+    scraper.github_api = fixture_server.url + '/api'
+    scraper.raw_base = fixture_server.url + '/raw'
+    return scraper
+
+
+def node_rows(scraper):
+    return scraper.conn.execute('''
+        SELECT node_type, display_name, description, version, folder_path
+        FROM node_types_github ORDER BY node_type
+    ''').fetchall()
+
+
+def api_calls(fixture_server):
+    return [path for path in fixture_server.paths() if path.startswith('/api/')]
+
+
+def test_tree_crawl_uses_two_api_calls_and_finds_nested_nodes(tmp_path, fixture_server):
+    serve_repository(fixture_server, node_files())
+
+    walk = make_scraper(tmp_path, fixture_server, 'walk.db')
+    tree = make_scraper(tmp_path, fixture_server, 'tree.db')
+    try:
+        walk.crawl_all_nodes()
+        walk_calls = len(api_calls(fixture_server))
+        fixture_server.requests.clear()
+
+        assert tree.crawl_all_nodes_tree()
+        assert len(api_calls(fixture_server)) == 2
+        assert walk_calls == 1 + 31
+
+        walked, crawled = node_rows(walk), node_rows(tree)
+        assert len(crawled) == 40
+        nested = [row for row in crawled if '/Google/' in row[4]]
+        assert len(nested) == 10
+        assert sorted(walked + nested) == crawled
+    finally:
+        walk.close()
+        tree.close()
+
+
+def test_tarball_ingest_stores_the_same_nodes_as_the_tree_crawl(tmp_path, fixture_server):
+    files = node_files()
+    serve_repository(fixture_server, files)
+    tarball_path = tmp_path / 'n8n-master.tar.gz'
+    with tarfile.open(tarball_path, 'w:gz') as tar:
+        for path, content in files.items():
+            data = content.encode('utf-8')
+            member = tarfile.TarInfo(f'n8n-master/{path}')
+            member.size = len(data)
+            tar.addfile(member, io.BytesIO(data))
+
+    tree = make_scraper(tmp_path, fixture_server, 'tree.db')
+    offline = make_scraper(tmp_path, fixture_server, 'tarball.db')
+    try:
+        assert tree.crawl_all_nodes_tree()
+        assert offline.ingest_tarball(str(tarball_path), workers=2) == 40
+        assert node_rows(offline) == node_rows(tree)
+    finally:
+        tree.close()
+        offline.close()
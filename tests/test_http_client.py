@@ -0,0 +1,72 @@
+"""
+Tests for scripts/http_client.py and scripts/http_cache.py against a local fixture server
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from http_cache import HttpCache  # noqa: E402
+from http_client import HttpClient, RateLimitError  # noqa: E402
+
+
+def test_retries_short_rate_limits(fixture_server):
+    fixture_server.routes['/repos'] = [
+        (429, {'Retry-After': '0'}, 'slow down'),
+        (200, {}, '[]'),
+    ]
+    client = HttpClient(backoff_factor=0)
+
+    response = client.get(fixture_server.url + '/repos')
+
+    assert response.status_code == 200
+    assert fixture_server.paths() == ['/repos', '/repos']
+    client.close()
+
+
+def test_long_github_rate_limit_raises(fixture_server):
+    reset = int(time.time()) + 3600
+    fixture_server.routes['/repos'] = (
+        403, {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': str(reset)}, 'rate limited'
+    )
+    client = HttpClient(max_backoff=60)
+
+    with pytest.raises(RateLimitError) as error:
+        client.get(fixture_server.url + '/repos')
+
+    assert error.value.wait > 3000
+    assert error.value.response.status_code == 403
+    assert fixture_server.paths() == ['/repos']
+    client.close()
+
+
+def test_long_retry_after_on_server_error_returns_the_response(fixture_server):
+    fixture_server.routes['/down'] = (503, {'Retry-After': '3600'}, 'maintenance')
+    client = HttpClient(max_backoff=60)
+
+    assert client.get(fixture_server.url + '/down').status_code == 503
+    client.close()
+
+
+def test_cache_sends_requests_through_the_shared_client(fixture_server, tmp_path):
+    fixture_server.routes['/page'] = [(200, {'ETag': '"v1"'}, 'content'), (304, {}, '')]
+    cache = HttpCache(str(tmp_path / 'http_cache.db'))
+    client = HttpClient(headers={'User-Agent': 'shared-client'})
+
+    cache.use_session(client)
+    first = cache.get(fixture_server.url + '/page')
+    second = cache.get(fixture_server.url + '/page')
+
+    assert (first.text, first.changed) == ('content', True)
+    assert (second.text, second.not_modified) == ('content', True)
+    assert [headers['User-Agent'] for _, headers in fixture_server.requests] == ['shared-client'] * 2
+    assert fixture_server.requests[1][1]['If-None-Match'] == '"v1"'
+
+    # The cache no longer owns a client - closing it leaves the shared one usable
+    cache.close()
+    assert client.get(fixture_server.url + '/page').status_code == 304
+    client.close()
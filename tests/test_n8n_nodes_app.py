@@ -0,0 +1,180 @@
+"""
+Tests for the node search of n8n_nodes_app.py on a copy of the shipped database
+"""
+
+import shutil
+import sqlite3
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / 'scripts'))
+
+import n8n_nodes_app as app  # noqa: E402
+from extend_database_schema import create_search_index  # noqa: E402
+
+COLUMNS = ['node_type', 'display_name', 'description', 'category', 'version', 'source']
+
+
+@pytest.fixture(scope='module')
+def conn(tmp_path_factory):
+    db_path = tmp_path_factory.mktemp('db') / 'n8n_docs.db'
+    shutil.copy(ROOT / 'data' / 'n8n_docs.db', db_path)
+    create_search_index(str(db_path))
+    conn = sqlite3.connect(db_path, check_same_thread=False)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture(scope='module')
+def nodes(conn):
+    original = app.get_database_connection
+    app.get_database_connection = lambda: conn
+    try:
+        df = app.load_all_nodes()
+    finally:
+        app.get_database_connection = original
+    return df, app.NodeSearchIndex(df)
+
+
+def rows(df):
+    return df[COLUMNS].astype(object).where(df[COLUMNS].notna(), None).values.tolist()
+
+
+@pytest.mark.parametrize('search_term', ['email', 'google sheets', 'ai', 'db', 'n8n-nodes-base.gmail'])
+@pytest.mark.parametrize('sort_by', ['Relevance', 'Name (A-Z)', 'Category'])
+@pytest.mark.parametrize('categories', [['All'], ['App', 'Core']])
+def test_search_backends_return_the_same_ranking(conn, nodes, search_term, sort_by, categories):
+    df, search_index = nodes
+
+    expected = rows(app.search_nodes(df, search_term, categories, sort_by))
+
+    assert expected
+    assert rows(app.search_nodes(df, search_term, categories, sort_by, search_index=search_index)) == expected
+    assert rows(app.search_nodes_fts(conn, search_term, categories, sort_by)) == expected
+
+
+def test_removed_community_packages_are_not_listed(tmp_path, monkeypatch):
+    db_path = tmp_path / 'n8n_docs.db'
+    shutil.copy(ROOT / 'data' / 'n8n_docs.db', db_path)
+    removed_conn = sqlite3.connect(db_path)
+    monkeypatch.setattr(app, 'get_database_connection', lambda: removed_conn)
+
+    # Shipped database: community_nodes without the removed_at column
+    package = removed_conn.execute('SELECT package_name FROM community_nodes ORDER BY id LIMIT 1').fetchone()[0]
+    assert package in set(app.load_node_rows()['node_type'])
+
+    removed_conn.execute('ALTER TABLE community_nodes ADD COLUMN removed_at TIMESTAMP')
+    removed_conn.execute('UPDATE community_nodes SET removed_at = CURRENT_TIMESTAMP WHERE package_name = ?', (package,))
+    assert package not in set(app.load_node_rows()['node_type'])
+    removed_conn.close()
+
+
+@pytest.mark.parametrize('fragment', ['a', 'ai', 'mai', 'gmail', 'sheets', 'base', 'qqqq', 'n8n'])
+def test_vocabulary_lookup_matches_a_linear_scan(nodes, fragment):
+    _, search_index = nodes
+
+    expected = {position for position, token in enumerate(search_index.vocabulary) if fragment in token}
+    assert set(search_index._tokens_containing(fragment)) == expected
+
+
+SCORE_TERMS = [['trigger'], ['a'], ['api'], ['gmail'], ['email', 'send'], ['n8n-nodes-base.gmail'], ['google sheets'],
+               ['http request'], ['.'], ['nan'], ['ai', 'agent', 'ai']]
+
+
+@pytest.mark.parametrize('search_terms', SCORE_TERMS)
+def test_index_scores_match_calculate_relevance_score(nodes, search_terms):
+    df, search_index = nodes
+
+    scores = search_index.search(search_terms)
+    assert len(scores)
+    assert scores.to_dict() == {
+        label: app.calculate_relevance_score(df.loc[label], search_terms) for label in scores.index
+    }
+
+
+@pytest.mark.parametrize('search_terms', SCORE_TERMS)
+def test_index_scores_rows_with_missing_fields_like_calculate_relevance_score(search_terms):
+    df = pd.DataFrame([
+        ('n8n-nodes-base.gmail', 'Gmail', 'Send an email via the Gmail API'),
+        ('n8n-nodes-base.gmailTrigger', None, 'Trigger on new emails'),
+        (None, 'Trigger', None),
+        ('nan', 'Google Sheets', 'Read and append rows, a nan-safe http request'),
+        ('ai', 'AI Agent', 'An AI agent.'),
+    ], columns=['node_type', 'display_name', 'description'], index=[10, 20, 30, 40, 50])
+
+    scores = app.NodeSearchIndex(df).search(search_terms)
+    texts = df.fillna('').apply(lambda row: [str(value).lower() for value in row], axis=1)
+    assert list(scores.index) == [
+        label for label, fields in texts.items()
+        if any(term.lower() in field for term in search_terms for field in fields)
+    ]
+    assert scores.to_dict() == {
+        label: app.calculate_relevance_score(df.loc[label], search_terms) for label in scores.index
+    }
+
+
+def test_ai_context_lists_credentials_like_the_per_node_query(tmp_path, monkeypatch):
+    db_path = tmp_path / 'n8n_docs.db'
+    shutil.copy(ROOT / 'data' / 'n8n_docs.db', db_path)
+    context_conn = sqlite3.connect(db_path)
+    monkeypatch.setattr(app, 'get_database_connection', lambda: context_conn)
+    context_conn.executemany(
+        'INSERT OR REPLACE INTO node_credentials (node_type, credential_type, display_name) VALUES (?, ?, ?)',
+        [('n8n-nodes-base.gmail', 'zohoApi', None), ('n8n-nodes-base.gmail', 'airtableApi', 'Airtable')]
+    )
+
+    for node in app.load_node_context_for_ai():
+        # The query load_node_context_for_ai used to run for every node
+        expected = context_conn.execute('''
+            SELECT credential_type, display_name
+            FROM node_credentials
+            WHERE node_type = ?
+        ''', (node['node_type'],)).fetchall()
+        assert [(cred['type'], cred['display_name']) for cred in node['credentials']] == [
+            (cred_type, cred_display or cred_type) for cred_type, cred_display in expected
+        ]
+    context_conn.close()
+
+
+CATEGORIZE_ROWS = [
+    (None, 'App'),
+    ('@scope/n8n-nodes-example.example', None),
+    ('@n8n/n8n-nodes-langchain.agent', 'LangChain'),
+    ('n8n-nodes-langchain.lmChatOpenAi', None),
+    ('n8n-nodes-base.gmailTrigger', 'App'),
+    ('n8n-nodes-base.scheduleTrigger', 'Trigger'),
+    ('n8n-nodes-base.httpRequest', 'App'),
+    ('n8n-nodes-base.splitInBatches', 'App'),
+    ('n8n-nodes-base.gmail', 'Core'),
+    ('N8N-NODES-BASE.Upper', 'GitHub'),
+    ('custom.node', None),
+]
+
+
+@pytest.mark.parametrize('with_category', [True, False])
+def test_categorize_nodes_matches_categorize_node(with_category):
+    df = pd.DataFrame(CATEGORIZE_ROWS, columns=['node_type', 'category'])
+    if not with_category:
+        df = df[['node_type']]
+
+    assert app.categorize_nodes(df).tolist() == df.apply(app.categorize_node, axis=1).tolist()
+
+
+def test_categorize_nodes_matches_categorize_node_on_the_shipped_database(monkeypatch):
+    db_path = ROOT / 'data' / 'n8n_docs.db'
+    if not db_path.exists():
+        pytest.skip('data/n8n_docs.db not available')
+    shipped_conn = sqlite3.connect(f'file:{db_path}?mode=ro', uri=True)
+    monkeypatch.setattr(app, 'get_database_connection', lambda: shipped_conn)
+    try:
+        df = app.load_node_rows()
+    finally:
+        shipped_conn.close()
+
+    assert len(df) > 1000
+    assert app.categorize_nodes(df).tolist() == df.apply(app.categorize_node, axis=1).tolist()
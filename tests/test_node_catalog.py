@@ -0,0 +1,39 @@
+"""
+Tests for the database change marker of node_catalog.py
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from node_catalog import database_version  # noqa: E402
+
+
+def test_database_version_changes_on_commits_from_other_connections(tmp_path):
+    db_path = tmp_path / 'n8n_docs.db'
+    reader = sqlite3.connect(db_path)
+    writer = sqlite3.connect(db_path)
+    try:
+        writer.execute('PRAGMA journal_mode=WAL')
+        writer.execute('CREATE TABLE nodes (node_type TEXT)')
+        writer.commit()
+
+        before = database_version(str(db_path), reader)
+        assert database_version(str(db_path), reader) == before
+
+        writer.execute("INSERT INTO nodes VALUES ('n8n-nodes-base.gmail')")
+        writer.commit()
+        assert database_version(str(db_path), reader) != before
+    finally:
+        reader.close()
+        writer.close()
+
+
+def test_database_version_of_a_missing_file_has_no_mtime(tmp_path):
+    conn = sqlite3.connect(':memory:')
+    try:
+        assert database_version(str(tmp_path / 'missing.db'), conn)[0] is None
+    finally:
+        conn.close()
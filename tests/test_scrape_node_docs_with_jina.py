@@ -0,0 +1,227 @@
+"""
+Tests for the markdown extractors and doc snapshots of scripts/scrape_node_docs_with_jina.py
+"""
+
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+import scrape_node_docs_with_jina  # noqa: E402
+from http_cache import HttpCache  # noqa: E402
+from scrape_node_docs_with_jina import JinaNodeDocsScraper  # noqa: E402
+
+SHIPPED_DB = Path(__file__).resolve().parent.parent / 'data' / 'n8n_docs.db'
+
+PAGE = """# Gmail node
+
+Use the Gmail node with OAuth2 credentials.
+
+### Send email
+**To** - Email recipients, required
+**Subject**: Subject line
+
+#### Details
+**Cc** - Carbon copy
+
+## Templates and examples
+**Limit** - Number of templates
+
+### Get message
+**Message ID**:
+The ID of the message
+"""
+
+
+def make_scraper(tmp_path, **kwargs):
+    db_path = tmp_path / 'n8n_docs.db'
+    shutil.copy(SHIPPED_DB, db_path)
+    return JinaNodeDocsScraper(str(db_path), http_cache=HttpCache(str(tmp_path / 'http_cache.db')), **kwargs)
+
+
+@pytest.fixture
+def scraper(tmp_path):
+    scraper = make_scraper(tmp_path)
+    yield scraper
+    scraper.close()
+
+
+def parameters_of(scraper, markdown):
+    return [(param['parameter_name'], param['description'], param['required'], param['operation'])
+            for param in scraper.extract_parameters_from_markdown(markdown)]
+
+
+def operations_of(scraper, markdown):
+    return [op['operation'] for op in scraper.extract_operations_from_markdown(markdown, 'n8n-nodes-base.gmail')]
+
+
+def test_operations_and_parameter_sections(scraper):
+    assert operations_of(scraper, PAGE) == ['send_email', 'details', 'get_message']
+    assert parameters_of(scraper, PAGE) == [
+        ('to', 'Email recipients, required', True, 'send_email'),
+        ('subject', 'Subject line', False, 'send_email'),
+        ('cc', 'Carbon copy', False, 'details'),
+        # "##" heading ends the operation section
+        ('limit', 'Number of templates', False, None),
+        # Description on the next line
+        ('message_id', 'The ID of the message', False, 'get_message'),
+    ]
+
+
+def test_credentials(scraper):
+    assert scraper.extract_credentials_from_markdown(PAGE, 'n8n-nodes-base.gmail', 'Gmail') == [{
+        'credential_type': 'gmailOAuth2',
+        'credential_name': 'gmail',
+        'display_name': 'Gmail OAuth2',
+        'required': True
+    }]
+
+
+def test_matches_like_the_original_extractors(scraper):
+    # Parameter on a heading line
+    assert parameters_of(scraper, '## **Token**: The API token\n') == [('token', 'The API token', False, None)]
+    # "###" followed by a line break, and "###" within a line
+    assert operations_of(scraper, '###\nCreate item\n') == ['create_item']
+    assert parameters_of(scraper, 'Then ### Update item\n**Name**: New name\n') == [
+        ('name', 'New name', False, 'update_item')
+    ]
+
+
+def test_unchanged_pages_are_skipped_until_the_parser_changes(tmp_path, monkeypatch):
+    scraper = make_scraper(tmp_path)
+    node = ('n8n-nodes-base.docsFixture', 'Docs Fixture', 'App')
+    url = 'https://docs.n8n.io/integrations/builtin/app-nodes/n8n-nodes-base.docsfixture/'
+    try:
+        assert scraper.process_node_docs(node, url, PAGE)
+        assert scraper.unchanged_count == 0
+
+        assert scraper.process_node_docs(node, url, PAGE)
+        assert scraper.unchanged_count == 1
+
+        monkeypatch.setattr(scrape_node_docs_with_jina, 'PARSER_VERSION', scrape_node_docs_with_jina.PARSER_VERSION + 1)
+        assert scraper.process_node_docs(node, url, PAGE)
+        assert scraper.unchanged_count == 1
+
+        operations = scraper.conn.execute(
+            'SELECT DISTINCT operation FROM node_operations WHERE node_type = ? ORDER BY operation', (node[0],)
+        ).fetchall()
+        assert [row[0] for row in operations] == ['details', 'get_message', 'send_email']
+    finally:
+        scraper.close()
+
+
+def test_injected_cache_uses_the_rate_limited_client(tmp_path):
+    scraper = make_scraper(tmp_path, requests_per_minute=120)
+    try:
+        assert scraper.http_cache.session is scraper.http_client
+        assert scraper.http_client.rate_limiter is not None
+    finally:
+        scraper.close()
+
+
+DOC_TABLES = {
+    'node_operations': 'node_type, resource, operation, description, display_name',
+    'node_parameters': 'node_type, resource, operation, parameter_name, required, description',
+    'node_credentials': 'node_type, credential_type, credential_name, required, display_name',
+}
+
+
+def serve_docs(fixture_server, scraper, limit):
+    """Recorded Jina pages for the first nodes, every fifth one without docs (404)"""
+    for i, (node_type, display_name, _) in enumerate(scraper.get_nodes_to_scrape(limit)):
+        if i % 5 == 4:
+            continue
+        lines = [f'# {display_name} node', '', f'Create an API key for {display_name}.' if i % 2 else 'Uses OAuth2.']
+        for j in range(i % 4):
+            lines += [f'### {["Create", "Get", "Update"][j]} record {j}', f'**Record ID** - Required value {i}',
+                      f'**Limit**: Max results {j}']
+        path = '/' + scraper.get_doc_url(node_type, display_name)
+        fixture_server.routes[path] = (200, {}, '\n'.join(lines) + '\n')
+
+
+def doc_rows(scraper):
+    return {table: scraper.conn.execute(f'SELECT {columns} FROM {table} ORDER BY id').fetchall()
+            for table, columns in DOC_TABLES.items()}
+
+
+def test_parallel_fetches_save_the_same_rows_as_a_serial_run(tmp_path, fixture_server):
+    results = []
+    for workers in (1, 4):
+        run_path = tmp_path / f'workers_{workers}'
+        run_path.mkdir()
+        scraper = make_scraper(run_path, requests_per_minute=60000, max_workers=workers,
+                               jina_reader_base=fixture_server.url + '/')
+        try:
+            serve_docs(fixture_server, scraper, 20)
+            scraper.scrape_all(limit=20)
+            results.append(doc_rows(scraper))
+        finally:
+            scraper.close()
+
+    assert results[0] == results[1]
+    assert any(row[3] == 'record_id' for row in results[0]['node_parameters'])
+    assert len(fixture_server.requests) == 40
+
+
+def test_second_run_skips_unchanged_pages(tmp_path, fixture_server):
+    scraper = make_scraper(tmp_path, requests_per_minute=60000, max_workers=4,
+                           jina_reader_base=fixture_server.url + '/')
+    try:
+        serve_docs(fixture_server, scraper, 20)
+        scraper.scrape_all(limit=20)
+        assert scraper.unchanged_count == 0
+        saved = doc_rows(scraper)
+
+        scraper.scrape_all(limit=20)
+        assert scraper.unchanged_count == 16
+        assert doc_rows(scraper) == saved
+    finally:
+        scraper.close()
+
+
+def test_resaving_a_node_replaces_its_earlier_rows(scraper):
+    node_type = 'n8n-nodes-base.docsFixture'
+    operations, parameters, credentials = scraper.parse_node_docs(node_type, 'Docs Fixture', PAGE)
+
+    # Rows of an earlier run: a removed operation, every parameter under the first operation
+    scraper.save_operations(node_type, operations + [{'operation': 'archive', 'description': 'Archive',
+                                                      'display_name': 'Archive'}])
+    scraper.save_parameters(node_type, 'send_email', parameters)
+    scraper.conn.commit()
+
+    scraper.save_node_docs(node_type, operations, parameters, credentials)
+
+    assert scraper.conn.execute(
+        'SELECT operation FROM node_operations WHERE node_type = ? ORDER BY id', (node_type,)
+    ).fetchall() == [('send_email',), ('details',), ('get_message',)]
+    assert scraper.conn.execute(
+        'SELECT operation, parameter_name FROM node_parameters WHERE node_type = ? ORDER BY id', (node_type,)
+    ).fetchall() == [
+        ('send_email', 'to'), ('send_email', 'subject'), ('send_email', 'limit'),
+        ('details', 'cc'), ('get_message', 'message_id'),
+    ]
+
+
+def test_interrupted_run_stops_fetching(tmp_path, fixture_server, monkeypatch):
+    scraper = make_scraper(tmp_path, requests_per_minute=60000, max_workers=1,
+                           jina_reader_base=fixture_server.url + '/')
+    processed = []
+
+    def interrupt_after_three(node, doc_url, markdown_content):
+        processed.append(node)
+        if len(processed) == 3:
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr(scraper, 'process_node_docs', interrupt_after_three)
+    try:
+        serve_docs(fixture_server, scraper, 60)
+        with pytest.raises(KeyboardInterrupt):
+            scraper.scrape_all(limit=60)
+    finally:
+        scraper.close()
+
+    # The three processed nodes plus at most the queued window (2 * max_workers)
+    assert len(fixture_server.requests) <= 3 + 2
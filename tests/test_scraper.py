@@ -0,0 +1,96 @@
+"""
+Tests for the concurrent, resumable crawl of scripts/scraper.py against a local fixture server
+"""
+
+import sqlite3
+import sys
+import threading
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from http_cache import HttpCache  # noqa: E402
+from scraper import N8nDocScraper  # noqa: E402
+
+PAGE_COUNT = 30
+MISSING_PAGE = 13
+START_URL = 'https://docs.n8n.io/p/0/'
+# Reachable pages: the children of the missing page are never linked
+REACHABLE = [n for n in range(PAGE_COUNT) if (n - 1) // 2 != MISSING_PAGE]
+
+
+def serve_site(fixture_server):
+    """Docs pages as a binary tree with a link back home, one page returns 404"""
+    for n in range(PAGE_COUNT):
+        if n == MISSING_PAGE:
+            continue
+        links = ''.join(f'[p{child}](https://docs.n8n.io/p/{child}/)\n'
+                        for child in (2 * n + 1, 2 * n + 2) if child < PAGE_COUNT)
+        fixture_server.routes[f'/https://docs.n8n.io/p/{n}/'] = (
+            200, {}, f'# Page {n}\n\n{links}[home]({START_URL})\n[external](https://n8n.io/pricing)\n'
+        )
+
+
+def make_scraper(tmp_path, fixture_server, name='n8n_docs.db', **kwargs):
+    return N8nDocScraper(str(tmp_path / name), jina_api_base=fixture_server.url + '/',
+                         requests_per_second=1000, http_cache=HttpCache(str(tmp_path / f'{name}.cache')),
+                         **kwargs)
+
+
+def crawl(tmp_path, fixture_server, name='n8n_docs.db', max_pages=None, **kwargs):
+    scraper = make_scraper(tmp_path, fixture_server, name, **kwargs)
+    try:
+        scraper.crawl(START_URL, max_pages=max_pages)
+    finally:
+        scraper.close()
+
+
+def crawl_result(db_path):
+    conn = sqlite3.connect(db_path)
+    try:
+        return (
+            sorted(conn.execute('SELECT url, title, status FROM pages')),
+            sorted(conn.execute('SELECT source_url, target_url FROM links')),
+            sorted(conn.execute('SELECT url, state FROM crawl_frontier')),
+        )
+    finally:
+        conn.close()
+
+
+def fetch_counts(fixture_server):
+    return Counter(path.split('https://docs.n8n.io', 1)[-1] for path in fixture_server.paths())
+
+
+def test_parallel_crawl_finds_the_same_pages_as_a_serial_crawl(tmp_path, fixture_server):
+    serve_site(fixture_server)
+
+    crawl(tmp_path, fixture_server, 'serial.db', max_workers=1)
+    crawl(tmp_path, fixture_server, 'parallel.db', max_workers=6)
+
+    pages, links, frontier = crawl_result(tmp_path / 'serial.db')
+    assert crawl_result(tmp_path / 'parallel.db') == (pages, links, frontier)
+    assert len(pages) == len(REACHABLE)
+    assert (f'https://docs.n8n.io/p/{MISSING_PAGE}/', f'Error: https://docs.n8n.io/p/{MISSING_PAGE}/', 'error') in pages
+    assert all(url.startswith('https://docs.n8n.io/') for _, url in links)
+
+
+def test_interrupted_crawl_resumes_from_the_frontier(tmp_path, fixture_server):
+    serve_site(fixture_server)
+    crawl(tmp_path, fixture_server, max_pages=5)
+    assert sum(fetch_counts(fixture_server).values()) == 5
+
+    # Two crawlers share the stored frontier
+    threads = [threading.Thread(target=crawl, args=(tmp_path, fixture_server)) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    counts = fetch_counts(fixture_server)
+    assert counts.pop(f'/p/{MISSING_PAGE}/') == 3
+    assert counts == Counter(f'/p/{n}/' for n in REACHABLE if n != MISSING_PAGE)
+
+    pages, _, frontier = crawl_result(tmp_path / 'n8n_docs.db')
+    assert len(pages) == len(REACHABLE)
+    assert Counter(state for _, state in frontier) == {'done': len(REACHABLE) - 1, 'error': 1}
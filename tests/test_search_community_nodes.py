@@ -0,0 +1,186 @@
+"""
+Tests for the npm community node search of scripts/search_community_nodes.py against a local fixture server
+"""
+
+import io
+import json
+import sys
+import tarfile
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from http_cache import HttpCache  # noqa: E402
+from search_community_nodes import CommunityNodesSearcher  # noqa: E402
+
+PAGE_SIZE = 250
+
+
+def registry_package(i, version='1.0.0'):
+    """Scoped and unscoped n8n node packages, every eleventh one not a community node"""
+    name = f'@scope{i % 7}/n8n-nodes-x{i}' if i % 3 else f'n8n-nodes-p{i}'
+    if i % 11 == 0:
+        name = f'other-lib-{i}'
+    package = {'name': name, 'version': version, 'description': f'Package {i} ' * (i % 4)}
+    if i % 2:
+        package['author'] = {'name': f'author{i}'}
+    if i % 4 == 0:
+        package['repository'] = {'url': f'git+https://github.com/example/n8n-nodes-{i}'}
+    return package
+
+
+def serve_registry(fixture_server, packages):
+    """Search pages of PAGE_SIZE packages and a /latest manifest per package"""
+    fixture_server.routes.clear()
+    for start in range(0, len(packages), PAGE_SIZE):
+        fixture_server.routes[f'/-/v1/search?text=n8n-nodes&size={PAGE_SIZE}&from={start}'] = (
+            200, {'Content-Type': 'application/json'},
+            json.dumps({'total': len(packages),
+                        'objects': [{'package': package} for package in packages[start:start + PAGE_SIZE]]})
+        )
+    for i, package in enumerate(packages):
+        manifest = dict(package, n8n={'nodes': [f'dist/nodes/Node{i}.node.js']}) if i % 5 else package
+        fixture_server.routes[f"/{package['name']}/latest"] = (
+            200, {'Content-Type': 'application/json'}, json.dumps(manifest)
+        )
+
+
+def make_searcher(tmp_path, fixture_server, name='n8n_docs.db', **kwargs):
+    return CommunityNodesSearcher(str(tmp_path / name), http_cache=HttpCache(str(tmp_path / f'{name}.cache')),
+                                  registry_url=fixture_server.url, requests_per_second=None, **kwargs)
+
+
+def community_rows(searcher):
+    return searcher.conn.execute('''
+        SELECT id, package_name, node_types, description, version, author, repository, removed_at IS NOT NULL
+        FROM community_nodes ORDER BY id
+    ''').fetchall()
+
+
+def test_parallel_search_saves_the_same_rows_as_the_serial_loop(tmp_path, fixture_server):
+    serve_registry(fixture_server, [registry_package(i) for i in range(300)])
+
+    serial = make_searcher(tmp_path, fixture_server, 'serial.db', max_workers=1)
+    parallel = make_searcher(tmp_path, fixture_server, 'parallel.db', max_workers=8, batch_size=40)
+    try:
+        for package in serial.filter_community_nodes(serial.search_npm_community_nodes()):
+            serial.save_community_node(package)
+        parallel.search_and_save()
+
+        rows = community_rows(serial)
+        # serve_registry lists nodes in the manifest of every package whose index is not a multiple of 5
+        assert [row[1:3] for row in rows] == [
+            (registry_package(i)['name'], f'dist/nodes/Node{i}.node.js' if i % 5 else '')
+            for i in range(300) if i % 11
+        ]
+        assert community_rows(parallel) == rows
+    finally:
+        serial.close()
+        parallel.close()
+
+
+def test_incremental_refresh_fetches_only_new_and_changed_packages(tmp_path, fixture_server):
+    indexes = [i for i in range(300) if i % 11]
+    searcher = make_searcher(tmp_path, fixture_server)
+
+    def refresh(removed=(), bumped=()):
+        serve_registry(fixture_server, [registry_package(i, '1.0.1' if i in bumped else '1.0.0')
+                                        for i in indexes if i not in removed])
+        fixture_server.requests.clear()
+        summary = searcher.search_and_save(incremental=True)
+        fetched = sum(path.endswith('/latest') for path in fixture_server.paths())
+        assert fetched == summary['fetched']
+        return {key: summary[key] for key in ('new_packages', 'changed_packages', 'removed_packages', 'fetched')}
+
+    try:
+        assert refresh() == {'new_packages': 272, 'changed_packages': 0, 'removed_packages': 0, 'fetched': 272}
+        assert refresh(removed={1, 2, 3}, bumped={4, 5, 7}) == {
+            'new_packages': 0, 'changed_packages': 3, 'removed_packages': 3, 'fetched': 3
+        }
+        assert refresh(removed={1, 2, 3}, bumped={4, 5, 7}) == {
+            'new_packages': 0, 'changed_packages': 0, 'removed_packages': 0, 'fetched': 0
+        }
+        # A package listed again is refetched and no longer marked as removed
+        assert refresh(removed={1, 3}, bumped={4, 5, 7}) == {
+            'new_packages': 0, 'changed_packages': 1, 'removed_packages': 0, 'fetched': 1
+        }
+
+        removed = [row[1] for row in community_rows(searcher) if row[-1]]
+        assert removed == [registry_package(1)['name'], registry_package(3)['name']]
+    finally:
+        searcher.close()
+
+
+def test_prefetch_thread_ends_when_the_consumer_stops_early(tmp_path, fixture_server):
+    serve_registry(fixture_server, [registry_package(i) for i in range(4 * PAGE_SIZE)])
+    searcher = make_searcher(tmp_path, fixture_server)
+    running = set(threading.enumerate())
+    try:
+        pages = searcher.prefetch_search_pages()
+        assert len(next(pages)) == PAGE_SIZE
+        pages.close()
+
+        for thread in set(threading.enumerate()) - running:
+            thread.join(timeout=5)
+            assert not thread.is_alive()
+        # The current page plus at most one page ahead
+        assert sum('/-/v1/search' in path for path in fixture_server.paths()) <= 2
+    finally:
+        searcher.close()
+
+
+def test_tarball_ingest_reads_community_packages(tmp_path):
+    tarball_dir = tmp_path / 'tarballs'
+    tarball_dir.mkdir()
+    for i in range(40):
+        data = json.dumps(dict(registry_package(i), n8n={'nodes': [f'dist/nodes/Node{i}.node.js']})).encode('utf-8')
+        with tarfile.open(tarball_dir / f'package-{i}.tgz', 'w:gz') as tar:
+            member = tarfile.TarInfo('package/package.json')
+            member.size = len(data)
+            tar.addfile(member, io.BytesIO(data))
+
+    searcher = CommunityNodesSearcher(str(tmp_path / 'n8n_docs.db'), http_cache=HttpCache(str(tmp_path / 'cache.db')))
+    try:
+        summary = searcher.ingest_tarballs(str(tarball_dir), workers=2)
+        names = [row[1] for row in community_rows(searcher)]
+    finally:
+        searcher.close()
+
+    expected = sorted(registry_package(i)['name'] for i in range(40) if i % 11)
+    assert (summary['listed'], summary['saved']) == (len(expected), len(expected))
+    assert sorted(names) == expected
+
+
+def test_failed_manifest_fetches_are_retried_by_the_next_incremental_run(tmp_path, fixture_server):
+    searcher = make_searcher(tmp_path, fixture_server)
+    names = [registry_package(i)['name'] for i in (1, 2, 3)]
+
+    def refresh(versions, failing=()):
+        serve_registry(fixture_server, [registry_package(i, versions[i]) for i in (1, 2, 3)])
+        for i in failing:
+            fixture_server.routes[f'/{registry_package(i)["name"]}/latest'] = (404, {}, 'Not found')
+        summary = searcher.search_and_save(incremental=True)
+        rows = {row[1]: (row[2], row[4]) for row in community_rows(searcher)}
+        return summary['fetched'], summary['saved'], rows
+
+    try:
+        # New package: nothing is saved, so it stays new
+        fetched, saved, rows = refresh({1: '1.0.0', 2: '1.0.0', 3: '1.0.0'}, failing=(2,))
+        assert (fetched, saved) == (3, 2)
+        assert names[1] not in rows
+
+        fetched, saved, rows = refresh({1: '1.0.0', 2: '1.0.0', 3: '1.0.0'})
+        assert (fetched, saved) == (1, 1)
+        assert rows[names[1]] == ('dist/nodes/Node1.node.js', '1.0.0')
+
+        # Changed package: the stored version is kept, so it stays changed
+        fetched, saved, rows = refresh({1: '1.0.0', 2: '1.0.0', 3: '2.0.0'}, failing=(3,))
+        assert (fetched, saved) == (1, 0)
+        assert rows[names[2]] == ('dist/nodes/Node2.node.js', '1.0.0')
+
+        fetched, saved, rows = refresh({1: '1.0.0', 2: '1.0.0', 3: '2.0.0'})
+        assert (fetched, saved) == (1, 1)
+        assert rows[names[2]] == ('dist/nodes/Node2.node.js', '2.0.0')
+    finally:
+        searcher.close()
@@ -0,0 +1,121 @@
+"""
+Tests for scripts/ts_node_parser.py against the hand-written node sources in
+tests/fixtures/n8n (router-style versioned Gmail, classic Trello, single-file
+HttpRequest)
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from ts_node_parser import parse_node_file  # noqa: E402
+
+NODES = Path(__file__).resolve().parent / 'fixtures' / 'n8n' / 'packages' / 'nodes-base' / 'nodes'
+
+
+def parse(relative_path):
+    return parse_node_file(str(NODES / relative_path))
+
+
+def parameter_keys(details):
+    return {(resource, operation, name) for resource, operation, name, *_ in details['parameters']}
+
+
+def test_versioned_base_node_has_no_description():
+    assert parse('Google/Gmail/Gmail.node.ts') is None
+
+
+def test_gmail_v1():
+    details = parse('Google/Gmail/v1/GmailV1.node.ts')
+
+    assert (details['node_type'], details['version']) == ('n8n-nodes-base.gmail', 1)
+    assert details['operations'] == [('message', 'send', 'Old send')]
+    assert details['credentials'] == [('gmailOAuth2', True)]
+
+
+def test_gmail_v2_router_node():
+    details = parse('Google/Gmail/v2/GmailV2.node.ts')
+
+    assert (details['node_type'], details['version']) == ('n8n-nodes-base.gmail', 2.1)
+    assert details['operations'] == [
+        ('message', 'send', 'Send a message'),
+        ('message', 'get', 'Get a message'),
+        ('label', 'create', 'Create a label'),
+        ('label', 'delete', 'Delete a label'),
+    ]
+    assert details['credentials'] == [('googleApi', True), ('gmailOAuth2', True)]
+
+    pairs = [(resource, operation) for resource, operation, _ in details['operations']]
+    assert parameter_keys(details) == (
+        {(resource, operation, 'authentication') for resource, operation in pairs}
+        | {
+            ('message', 'send', 'sendTo'),
+            ('message', 'send', 'subject'),
+            ('message', 'send', 'emailType'),
+            ('message', 'send', 'options'),
+            ('message', 'get', 'messageId'),
+            ('message', 'get', 'simple'),
+            ('label', 'create', 'name'),
+            ('label', 'delete', 'labelId'),
+        }
+    )
+
+    parameters = {(row[0], row[1], row[2]): row for row in details['parameters']}
+    # updateDisplayOptions() + imported option from utils/descriptions.ts
+    assert parameters[('message', 'send', 'options')] == (
+        'message', 'send', 'options', 'collection', False, '{}', 'Options',
+        '["appendAttribution", "bccList", "ccList"]',
+    )
+    assert parameters[('message', 'send', 'emailType')][3:6] == ('options', True, '"html"')
+
+
+def test_trello_classic_node():
+    details = parse('Trello/Trello.node.ts')
+
+    assert (details['node_type'], details['version']) == ('n8n-nodes-base.trello', 1)
+    assert details['operations'] == [
+        ('board', 'create', 'Create a new board'),
+        ('board', 'get', 'Get the data of a board'),
+        ('card', 'create', 'Create a new card'),
+    ]
+    assert details['credentials'] == [('trelloApi', True)]
+    assert parameter_keys(details) == {
+        ('board', 'create', 'name'),
+        ('board', 'get', 'id'),
+        ('board', 'create', 'additionalFields'),
+        ('board', 'get', 'additionalFields'),
+        # show.operation without resource: only resources that have the operation
+        ('board', 'get', 'includeMembers'),
+        # hide.operation
+        ('board', 'get', 'simplify'),
+        # displayOptions from an unresolvable @utils import: shown everywhere
+        ('board', 'create', 'board'),
+        ('board', 'get', 'board'),
+        ('card', 'create', 'board'),
+    }
+
+    parameters = {(row[0], row[1], row[2]): row for row in details['parameters']}
+    assert parameters[('board', 'get', 'id')] == (
+        'board', 'get', 'id', 'resourceLocator', True, '{"mode": "list", "value": ""}', 'Board ID', None,
+    )
+
+
+def test_http_request_single_file_node():
+    details = parse('HttpRequest/HttpRequest.node.ts')
+
+    assert (details['node_type'], details['version']) == ('n8n-nodes-base.httpRequest', 3)
+    assert details['operations'] == []
+    assert details['credentials'] == []
+    assert details['parameters'] == [
+        (None, None, 'method', 'options', False, '"GET"', 'The request method to use', '["DELETE", "GET", "POST"]'),
+        (None, None, 'url', 'string', True, '""', 'The URL to make the request to', None),
+        (None, None, 'timeout', 'number', False, '10000', 'Timeout', None),
+    ]
+
+
+def test_unparseable_file_is_skipped(tmp_path):
+    broken = tmp_path / 'Broken.node.ts'
+    broken.write_bytes(b'\xff\xfe not utf-8 \x00')
+
+    assert parse_node_file(str(broken)) is None
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Memory benchmark: AI node context as dicts vs. compact NodeCatalog
+(run from the project root)
+"""
+import sys
+import io
+import os
+import gc
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+from n8n_nodes_app import load_node_context_for_ai
+from node_catalog import NodeCatalog
+
+
+def retained_bytes(build):
+    """Bytes still allocated after build() returns (result kept alive)"""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+nodes_context, dict_bytes = retained_bytes(lambda: load_node_context_for_ai(limit=None))
+del nodes_context
+catalog, catalog_bytes = retained_bytes(lambda: NodeCatalog.from_context(load_node_context_for_ai(limit=None)))
+
+total_ops = sum(len(n.operations) for n in catalog)
+total_params = sum(len(n.parameters) for n in catalog)
+total_creds = sum(len(n.credentials) for n in catalog)
+
+print("\n" + "="*60)
+print("📦 AI Node Context - Speicherbedarf pro Kopie")
+print("="*60 + "\n")
+
+print(f'   Nodes: {len(catalog):,} | Operations: {total_ops:,} | Parameters: {total_params:,} | Credentials: {total_creds:,}\n')
+print(f'   {"list[dict] (vorher)":25s}: {dict_bytes / 1024:10.1f} KB')
+print(f'   {"NodeCatalog (nachher)":25s}: {catalog_bytes / 1024:10.1f} KB')
+print(f'\n   Ersparnis: {(1 - catalog_bytes / dict_bytes) * 100:.1f}%')
+print(f'\n{"="*60}\n')
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: offline import of node definitions from tarballs
+Builds a deterministic fixture (n8n repo tarball + npm package tarballs)
+in a temp directory and imports it with github_node_scraper.py and
+search_community_nodes.py (run from the project root)
+
+Usage: python utils/benchmark_offline_ingest.py [NODES] [PACKAGES]
+"""
+import sys
+import io
+import os
+import json
+import sqlite3
+import tarfile
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'scripts'))
+
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+from github_node_scraper import GitHubNodeScraper
+from http_cache import HttpCache
+from search_community_nodes import CommunityNodesSearcher
+
+
+def add_file(tar, name, content):
+    data = content.encode('utf-8')
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    info.mtime = 0
+    tar.addfile(info, io.BytesIO(data))
+
+
+def build_repo_tarball(path, node_count):
+    """n8n-master/packages/nodes-base/nodes/... with .node.json and .node.ts files"""
+    with tarfile.open(path, 'w:gz') as tar:
+        for i in range(node_count):
+            folder = f"n8n-master/packages/nodes-base/nodes/Group{i % 20}/Node{i}"
+            add_file(tar, f"{folder}/Node{i}.node.json", json.dumps({
+                'node': f'n8n-nodes-base.node{i}',
+                'displayName': f'Node {i}',
+                'description': f'Benchmark node {i}',
+                'version': i % 3 + 1
+            }))
+            add_file(tar, f"{folder}/Node{i}.node.ts", 'export class Node {}\n' * 50)
+
+
+def build_npm_tarballs(directory, package_count):
+    """One .tgz per package with package/package.json and a dist file"""
+    for i in range(package_count):
+        name = f'n8n-nodes-bench{i}'
+        with tarfile.open(os.path.join(directory, f'{name}-1.0.{i % 7}.tgz'), 'w:gz') as tar:
+            add_file(tar, 'package/package.json', json.dumps({
+                'name': name,
+                'version': f'1.0.{i % 7}',
+                'description': f'Benchmark package {i}',
+                'author': {'name': f'author{i % 13}'},
+                'repository': {'url': f'git+https://example.com/{name}.git'},
+                'n8n': {'nodes': [f'dist/nodes/Bench{i}/Bench{i}.node.js']}
+            }))
+            add_file(tar, 'package/dist/index.js', 'module.exports = {};\n' * 200)
+
+
+def main():
+    node_count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    package_count = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo_tarball = os.path.join(tmp, 'n8n-master.tar.gz')
+        npm_dir = os.path.join(tmp, 'npm')
+        os.makedirs(npm_dir)
+        db_path = os.path.join(tmp, 'bench.db')
+
+        start = time.perf_counter()
+        build_repo_tarball(repo_tarball, node_count)
+        build_npm_tarballs(npm_dir, package_count)
+        print(f"Fixture: {node_count} nodes, {package_count} npm packages "
+              f"({time.perf_counter() - start:.2f}s)")
+
+        scraper = GitHubNodeScraper(db_path, http_cache=HttpCache(os.path.join(tmp, 'http_cache.db')))
+        start = time.perf_counter()
+        scraper.ingest_tarball(repo_tarball)
+        github_seconds = time.perf_counter() - start
+        scraper.close()
+
+        searcher = CommunityNodesSearcher(db_path, http_cache=HttpCache(os.path.join(tmp, 'http_cache.db')))
+        start = time.perf_counter()
+        searcher.ingest_tarballs(npm_dir)
+        npm_seconds = time.perf_counter() - start
+        searcher.close()
+
+        conn = sqlite3.connect(db_path)
+        github_rows = conn.execute('SELECT COUNT(*) FROM node_types_github').fetchone()[0]
+        community_rows = conn.execute('SELECT COUNT(*) FROM community_nodes').fetchone()[0]
+        conn.close()
+
+    print("\n" + "=" * 60)
+    print(f"node_types_github: {github_rows:>6} rows in {github_seconds:.2f}s")
+    print(f"community_nodes:   {community_rows:>6} rows in {npm_seconds:.2f}s")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
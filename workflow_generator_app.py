@@ -11,6 +11,7 @@ import json
 import os
 from datetime import datetime
 from dotenv import load_dotenv
+from node_catalog import NodeCatalog, database_version
 
 # Load environment variables
 load_dotenv()
@@ -55,10 +56,16 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+DATABASE_PATH = 'data/n8n_docs.db'
+
 @st.cache_resource
 def get_database_connection():
     """Cached database connection"""
-    return sqlite3.connect('data/n8n_docs.db', check_same_thread=False)
+    return sqlite3.connect(DATABASE_PATH, check_same_thread=False)
+
+def get_database_version():
+    """Change marker for DATABASE_PATH (see node_catalog.database_version)"""
+    return database_version(DATABASE_PATH, get_database_connection())
 
 def load_node_context(limit=50):
     """
@@ -137,6 +144,14 @@ def load_node_context(limit=50):
 
     return nodes_data
 
+@st.cache_resource(max_entries=1, show_spinner=False)
+def load_node_catalog(database_version, limit=50):
+    """
+    Compact node catalog shared by all sessions (see node_catalog.py)
+    Rebuilt once whenever database_version changes
+    """
+    return NodeCatalog.from_context(load_node_context(limit=limit))
+
 def generate_workflow_with_openai(prompt, api_key, nodes_context):
     """
     Generate n8n workflow using OpenAI API
@@ -152,7 +167,7 @@ def generate_workflow_with_openai(prompt, api_key, nodes_context):
 You help users create n8n workflows in JSON format.
 
 Available n8n nodes (selection):
-{json.dumps(nodes_context[:20], indent=2)}
+{json.dumps([node.to_dict() for node in nodes_context[:20]], indent=2)}
 
 IMPORTANT RULES:
 1. Return ONLY valid n8n workflow JSON
@@ -277,14 +292,14 @@ def main():
 
     # Load node context
     with st.spinner('Loading node database...'):
-        nodes_context = load_node_context(limit=100)
+        nodes_context = load_node_catalog(get_database_version(), limit=100)
 
     st.sidebar.success(f"Loaded {len(nodes_context)} nodes")
 
     # Show available nodes
     with st.sidebar.expander("📚 Available Nodes (sample)"):
         for node in nodes_context[:10]:
-            st.markdown(f"**{node['display_name']}** - {node['node_type']}")
+            st.markdown(f"**{node.display_name}** - {node.node_type}")
 
     # Main content
     st.markdown("---")